@@ -17,6 +17,7 @@
     "interactive",
     "ExecutionInfo",
     "ExecutorConfig",
+    "PoolConfig",
     "llm",
     "context",
     "set_config",
@@ -49,7 +50,7 @@
 from .interaction import broadcast, call, call_batch, interactive
 from .nodes.manifest import ToolManifest
 from .rt_mcp import MCPHttpParams, MCPStdioParams, connect_mcp, create_mcp_server
-from .utils.config import ExecutorConfig
+from .utils.config import ExecutorConfig, PoolConfig
 from .utils.logging.config import initialize_module_logging
 
 load_dotenv()
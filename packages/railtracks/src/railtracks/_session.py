@@ -18,13 +18,18 @@
     register_globals,
 )
 from .execution.coordinator import Coordinator
-from .execution.execution_strategy import AsyncioExecutionStrategy
+from .execution.execution_strategy import (
+    AsyncioExecutionStrategy,
+    ProcessExecutionStrategy,
+    ThreadedExecutionStrategy,
+)
 from .pubsub import RTPublisher, stream_subscriber
 from .state.info import (
     ExecutionInfo,
 )
 from .state.state import RTState
-from .utils.config import ExecutorConfig
+from .utils.config import ExecutorConfig, PoolConfig
+from .utils.executor_pool import ExecutorPools
 from .utils.logging.config import (
     AllowableLogLevels,
     mark_session_logging_override,
@@ -58,6 +63,8 @@ class Session:
     - `broadcast_callback`: None (no callback for broadcast messages)
     - `prompt_injection`: True (the prompt will be automatically injected from context variables)
     - `save_state`: True (the state of the execution will be saved to a file at the end of the run in the `.railtracks/data/sessions/` directory)
+    - `sync_pool_size`: None (the `concurrent.futures` default number of threads for synchronous nodes)
+    - `node_pools`: None (all synchronous nodes share a single pool)
 
 
     Args:
@@ -70,6 +77,8 @@ class Session:
         broadcast_callback (Callable[[str], None] | Callable[[str], Coroutine[None, None, None]] | None, optional): A callback function that will be called with the broadcast messages.
         prompt_injection (bool, optional): If True, the prompt will be automatically injected from context variables.
         save_state (bool, optional): If True, the state of the execution will be saved to a file at the end of the run in the `.railtracks/data/sessions/` directory.
+        sync_pool_size (int, optional): The number of threads in the session's pool for synchronous nodes.
+        node_pools (Dict[str, PoolConfig], optional): Dedicated executor pools for specific node types, keyed by node name.
     """
 
     def __init__(
@@ -86,6 +95,8 @@ def __init__(
         ) = None,
         prompt_injection: bool | None = None,
         save_state: bool | None = None,
+        sync_pool_size: int | None = None,
+        node_pools: Dict[str, PoolConfig] | None = None,
     ):
         # first lets read from defaults if nessecary for the provided input config
 
@@ -97,6 +108,8 @@ def __init__(
             broadcast_callback=broadcast_callback,
             prompt_injection=prompt_injection,
             save_state=save_state,
+            sync_pool_size=sync_pool_size,
+            node_pools=node_pools,
         )
 
         if context is None:
@@ -113,12 +126,17 @@ def __init__(
             )
 
         self.publisher: RTPublisher = RTPublisher()
+        self.executor_pools = ExecutorPools(self.executor_config)
 
         self._identifier = str(uuid.uuid4())
 
         executor_info = ExecutionInfo.create_new()
         self.coordinator = Coordinator(
-            execution_modes={"async": AsyncioExecutionStrategy()}
+            execution_modes={
+                "async": AsyncioExecutionStrategy(),
+                "thread": ThreadedExecutionStrategy(),
+                "process": ProcessExecutionStrategy(),
+            }
         )
         self.rt_state = RTState(
             executor_info, self.executor_config, self.coordinator, self.publisher
@@ -132,6 +150,7 @@ def __init__(
             parent_id=None,
             executor_config=self.executor_config,
             global_context_vars=context,
+            executor_pools=self.executor_pools,
         )
 
         self._start_time = time.time()
@@ -150,6 +169,8 @@ def global_config_precedence(
         ),
         prompt_injection: bool | None,
         save_state: bool | None,
+        sync_pool_size: int | None = None,
+        node_pools: Dict[str, PoolConfig] | None = None,
     ) -> ExecutorConfig:
         """
         Uses the following precedence order to determine the configuration parameters:
@@ -167,6 +188,8 @@ def global_config_precedence(
             subscriber=broadcast_callback,
             prompt_injection=prompt_injection,
             save_state=save_state,
+            sync_pool_size=sync_pool_size,
+            node_pools=node_pools,
         )
 
     def __enter__(self):
@@ -229,6 +252,7 @@ def _close(self):
         """
         # the publisher should have already been closed in `_run_base`
         self.rt_state.shutdown()
+        self.executor_pools.shutdown()
 
         if self._has_custom_logging:
             restore_module_logging()
@@ -294,6 +318,8 @@ def session(
     ) = None,
     prompt_injection: bool | None = None,
     save_state: bool | None = None,
+    sync_pool_size: int | None = None,
+    node_pools: Dict[str, PoolConfig] | None = None,
 ) -> Callable[
     [Callable[_P, Coroutine[Any, Any, _TOutput]]],
     Callable[_P, Coroutine[Any, Any, Tuple[_TOutput, Session]]],
@@ -316,6 +342,8 @@ def session(
         broadcast_callback (Callable[[str], None] | Callable[[str], Coroutine[None, None, None]] | None, optional): A callback function that will be called with the broadcast messages.
         prompt_injection (bool, optional): If True, the prompt will be automatically injected from context variables.
         save_state (bool, optional): If True, the state of the execution will be saved to a file at the end of the run in the `.railtracks/data/sessions/` directory.
+        sync_pool_size (int, optional): The number of threads in the session's pool for synchronous nodes.
+        node_pools (Dict[str, PoolConfig], optional): Dedicated executor pools for specific node types, keyed by node name.
 
     Returns:
         A decorator function that takes an async function and returns a new async function
@@ -338,6 +366,8 @@ def session(
     ) = None,
     prompt_injection: bool | None = None,
     save_state: bool | None = None,
+    sync_pool_size: int | None = None,
+    node_pools: Dict[str, PoolConfig] | None = None,
 ) -> (
     Callable[_P, Coroutine[Any, Any, Tuple[_TOutput, Session]]]
     | Callable[
@@ -371,6 +401,8 @@ def session(
         broadcast_callback (Callable[[str], None] | Callable[[str], Coroutine[None, None, None]] | None, optional): A callback function that will be called with the broadcast messages.
         prompt_injection (bool, optional): If True, the prompt will be automatically injected from context variables.
         save_state (bool, optional): If True, the state of the execution will be saved to a file at the end of the run in the `.railtracks/data/sessions/` directory.
+        sync_pool_size (int, optional): The number of threads in the session's pool for synchronous nodes.
+        node_pools (Dict[str, PoolConfig], optional): Dedicated executor pools for specific node types, keyed by node name.
 
     Returns:
         When used as @session (without parentheses): Returns the decorated function that returns (result, session).
@@ -403,6 +435,8 @@ async def wrapper(
                 name=name,
                 prompt_injection=prompt_injection,
                 save_state=save_state,
+                sync_pool_size=sync_pool_size,
+                node_pools=node_pools,
             )
 
             with session_obj:
@@ -4,11 +4,14 @@
 from copy import deepcopy
 from typing import (
     Any,
+    AsyncGenerator,
     Dict,
     Generator,
     Generic,
     Iterable,
+    List,
     Literal,
+    Sequence,
     TypeVar,
 )
 
@@ -43,14 +46,81 @@
 _T = TypeVar("_T")
 
 
+class MessageLog:
+    """
+    An append-only log of the messages an LLM node has sent to its model.
+
+    In a tool calling loop every request repeats the conversation so far plus a handful of new messages. Rather than
+    copying the whole conversation for every request, each request records a `MessageSnapshot` that points into this
+    log, so every message is only stored once.
+
+    Note that the messages are shared by reference, they are expected not to change once they have been sent.
+    """
+
+    def __init__(self):
+        self._messages: List[Message] = []
+
+    def __len__(self):
+        return len(self._messages)
+
+    def snapshot(self, message_history: Sequence[Message]) -> MessageSnapshot:
+        """
+        Records the provided message history in the log and returns a snapshot of it.
+
+        If the history extends the messages already in the log, the new messages are appended and the snapshot is just
+        an offset into the log. Otherwise (the history was rewritten), the snapshot keeps the shared prefix as an offset
+        and holds onto the diverging messages itself.
+        """
+        shared = 0
+        limit = min(len(self._messages), len(message_history))
+        while shared < limit and self._messages[shared] is message_history[shared]:
+            shared += 1
+
+        new_messages = tuple(message_history[shared:])
+        if shared == len(self._messages):
+            self._messages.extend(new_messages)
+            return MessageSnapshot(self, len(self._messages))
+
+        return MessageSnapshot(self, shared, new_messages)
+
+
+class MessageSnapshot:
+    """
+    A structurally shared copy of a message history. It is made up of the first `offset` messages of a `MessageLog`
+    followed by `new_messages`.
+
+    Use `MessageSnapshot.materialize()` to rebuild the full message history.
+    """
+
+    def __init__(
+        self,
+        log: MessageLog,
+        offset: int,
+        new_messages: tuple[Message, ...] = (),
+    ):
+        self.log = log
+        self.offset = offset
+        self.new_messages = new_messages
+
+    def __len__(self):
+        return self.offset + len(self.new_messages)
+
+    def materialize(self) -> MessageHistory:
+        """Rebuilds the message history this snapshot represents."""
+        return MessageHistory([*self.log._messages[: self.offset], *self.new_messages])
+
+
 class RequestDetails:
     """
     A named tuple to store details of each LLM request.
+
+    The input can be provided as a `MessageSnapshot`, in which case the full message history is only rebuilt when the
+    `input` is accessed.
     """
 
     def __init__(
         self,
-        message_input: MessageHistory,
+        message_input: MessageHistory | MessageSnapshot,
         output: Message | None,
         model_name: str | None,
         model_provider: ModelProvider | None,
@@ -59,8 +129,10 @@ def __init__(
         total_cost: float | None = None,
         system_fingerprint: str | None = None,
         latency: float | None = None,
+        retries: int | None = None,
+        hedged: bool | None = None,
     ):
-        self.input = message_input
+        self._input = message_input
         self.output = output
         self.model_name = model_name
         self.model_provider = model_provider
@@ -69,6 +141,14 @@ def __init__(
         self.total_cost = total_cost
         self.system_fingerprint = system_fingerprint
         self.latency = latency
+        self.retries = retries
+        self.hedged = hedged
+
+    @property
+    def input(self) -> MessageHistory:
+        if isinstance(self._input, MessageSnapshot):
+            return self._input.materialize()
+        return self._input
 
     def __repr__(self):
         return f"RequestDetails(model_name={self.model_name}, model_provider={self.model_provider}, input={self.input}, output={self.output})"
@@ -152,11 +232,13 @@ def __init__(
         assert isinstance(unwrapped_llm_model, ModelBase), (
             "unwrapped_llm_model must be an instance of llm.ModelBase"
         )
-        self.llm_model = unwrapped_llm_model
+        # every node works with its own copy of the model, so the hooks it attaches only ever see its own requests.
+        self.llm_model = unwrapped_llm_model.copy_with_hooks()
 
         self.message_hist = message_history_copy
 
         self._details["llm_details"] = []
+        self._message_log = MessageLog()
 
         self._attach_llm_hooks()
 
@@ -247,12 +329,11 @@ def _pre_llm_hook(self, message_history: MessageHistory) -> MessageHistory:
     def _post_llm_hook(self, message_history: MessageHistory, response: Response):
         """Hook to store the response details after invoking the llm model."""
 
-        output_message = deepcopy(response.message)
-
+        # the output message is appended to the message history, so it will be shared with the next request's input.
         self._details["llm_details"].append(
             RequestDetails(
-                message_input=deepcopy(message_history),
-                output=output_message,
+                message_input=self._message_log.snapshot(message_history),
+                output=response.message,
                 model_name=(
                     response.message_info.model_name
                     if response.message_info.model_name is not None
@@ -264,6 +345,8 @@ def _post_llm_hook(self, message_history: MessageHistory, response: Response):
                 total_cost=response.message_info.total_cost,
                 system_fingerprint=response.message_info.system_fingerprint,
                 latency=response.message_info.latency,
+                retries=response.message_info.retries,
+                hedged=response.message_info.hedged,
             )
         )
 
@@ -275,7 +358,7 @@ def _exception_llm_hook(
         """Hook to store the response details after exception was thrown during llm model invocation"""
         self._details["llm_details"].append(
             RequestDetails(
-                message_input=deepcopy(message_history),
+                message_input=self._message_log.snapshot(message_history),
                 output=None,
                 model_name=self.llm_model.model_name(),
                 model_provider=self.llm_model.model_provider(),
@@ -337,8 +420,23 @@ def safe_copy(self) -> Self:
     def type(cls):
         return "Agent"
 
+    @staticmethod
+    async def _read_stream(
+        returned_mess: AsyncGenerator[str | Response, None]
+        | Generator[str | Response, None, Response],
+    ) -> List[str | Response]:
+        """
+        Reads the whole stream returned by the model without blocking the event loop.
+
+        The streamed output of a node is a sync generator, which can't wait on the async stream of the model, so the
+        chunks are collected here and the output is built over them.
+        """
+        if isinstance(returned_mess, AsyncGenerator):
+            return [r async for r in returned_mess]
+        return list(returned_mess)
+
     def _gen_wrapper(
-        self, returned_mess: Generator[str | Response, None, Response]
+        self, returned_mess: Iterable[str | Response]
     ) -> Generator[str | _TCollectedOutput, None, _TCollectedOutput]:
         for r in returned_mess:
             if isinstance(r, Response):
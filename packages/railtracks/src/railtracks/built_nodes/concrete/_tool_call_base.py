@@ -3,14 +3,20 @@
 import asyncio
 import warnings
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import (
     Any,
     Dict,
     Generator,
     Generic,
+    Iterable,
+    List,
     Literal,
+    Mapping,
     ParamSpec,
     Set,
+    Tuple,
     Type,
     TypeVar,
 )
@@ -23,6 +29,7 @@
     Message,
     MessageHistory,
     ModelBase,
+    Tool,
     ToolCall,
     ToolMessage,
     ToolResponse,
@@ -46,6 +53,40 @@
 _TContent = TypeVar("_TContent", bound=Content)
 
 
+@dataclass(frozen=True)
+class CompiledTools:
+    """
+    The tools of a tool calling node compiled into an immutable form. It is built once per node class, see
+    `OutputLessToolCallLLMBase.compiled_tools`.
+
+    Args:
+        tools (Tuple[Tool, ...]): The tool details of every connected node.
+        nodes_by_name (Mapping[str, Tuple[Type[Node], ...]]): The connected nodes indexed by their tool name.
+    """
+
+    tools: Tuple[Tool, ...]
+    nodes_by_name: Mapping[str, Tuple[Type[Node], ...]] = field(
+        hash=False, compare=False
+    )
+
+    @classmethod
+    def compile(cls, tool_nodes: Iterable[Type[Node]]) -> CompiledTools:
+        """Collects the tool details of every node (calling `tool_info` exactly once per node)."""
+        tools: List[Tool] = []
+        nodes_by_name: Dict[str, List[Type[Node]]] = {}
+        for node in tool_nodes:
+            tool = node.tool_info()
+            tools.append(tool)
+            nodes_by_name.setdefault(tool.name, []).append(node)
+
+        return cls(
+            tools=tuple(tools),
+            nodes_by_name=MappingProxyType(
+                {name: tuple(nodes) for name, nodes in nodes_by_name.items()}
+            ),
+        )
+
+
 class OutputLessToolCallLLMBase(
     LLMBase[_T, _TCollectedOutput, _TStream],
     ABC,
@@ -131,38 +172,41 @@ def name(cls) -> str:
     @abstractmethod
     def tool_nodes(cls) -> Set[Type[Node]]: ...
 
+    @classmethod
+    def compiled_tools(cls) -> CompiledTools:
+        """
+        The compiled tools of the connected nodes. They are compiled the first time they are needed and cached on the
+        class, so the tool details are not rebuilt on every turn of the tool calling loop.
+        """
+        # we look in the class' own __dict__ so subclasses (which may connect different nodes) get their own cache.
+        compiled = cls.__dict__.get("_compiled_tools")
+        if compiled is None:
+            compiled = CompiledTools.compile(cls.tool_nodes())
+            cls._compiled_tools = compiled
+        return compiled
+
     def create_node(self, tool_name: str, arguments: Dict[str, Any]) -> Node:
         """
         A function which creates a new instance of a node Class from a tool name and arguments.
 
         This function may be overwritten to fit the needs of the given node as needed.
         """
-        node = [x for x in self.tool_nodes() if x.tool_info().name == tool_name]
-        if node == []:
-            raise LLMError(
-                reason=f" Error creating a node from tool {tool_name}. The tool_name given by the LLM doesn't match any of the tool names in the connected nodes.",
-                message_history=self.message_hist,
-            )
-        if len(node) > 1:
-            raise NodeCreationError(
-                message=f"Tool {tool_name} has multiple nodes, this is not allowed. Current Node include {[x.tool_info().name for x in self.tool_nodes()]}",
-                notes=["Please check the tool names in the connected nodes."],
-            )
-        return node[0].prepare_tool(arguments)
+        return self.get_node_from_name(tool_name).prepare_tool(arguments)
 
     def get_node_from_name(self, tool_name: str):
         """
         Gets the node attached to the node of the given name. If no node exists or there are multiple matches, it will raise an exception.
         """
-        node = [x for x in self.tool_nodes() if x.tool_info().name == tool_name]
-        if node == []:
+        compiled = self.compiled_tools()
+        node = compiled.nodes_by_name.get(tool_name, ())
+        if len(node) == 0:
             raise LLMError(
                 reason=f"Error creating a node from tool {tool_name}. The tool_name given by the LLM doesn't match any of the tool names in the connected nodes.",
                 message_history=self.message_hist,
             )
         if len(node) > 1:
             raise NodeCreationError(
-                message=f"Tool {tool_name} has multiple nodes, this is not allowed. Current Node include {[x.tool_info().name for x in self.tool_nodes()]}",
+                message=f"Tool {tool_name} has multiple nodes, this is not allowed. Current Node include {[x.name for x in compiled.tools]}",
                 notes=["Please check the tool names in the connected nodes."],
             )
 
@@ -174,8 +218,8 @@ async def run_node_from_tool(self, tool_name: str, arguments: dict[str, Any]):
         return await call(node.prepare_tool, **arguments)
 
     @classmethod
-    def tools(cls):
-        return [x.tool_info() for x in cls.tool_nodes()]
+    def tools(cls) -> List[Tool]:
+        return list(cls.compiled_tools().tools)
 
     async def _call_tools(self, tool_calls: list[ToolCall]) -> list[ToolMessage]:
         contracts = []
@@ -256,10 +300,7 @@ class OutputLessToolCallLLM(
 ):
     async def _on_max_tool_calls_exceeded(self):
         """force a final response. This function will add it to the message history and return the message. This function shoudld only be called on non streaming llms."""
-        response = await asyncio.to_thread(
-            self.llm_model.chat,
-            self.message_hist,
-        )
+        response = await self.llm_model.achat(self.message_hist)
 
         if not response.message.role == Role.assistant:
             raise LLMError(
@@ -293,8 +334,8 @@ async def _handle_tool_calls(self) -> tuple[bool, Message | None]:
             return False, message
 
         # collect the response from the llm model
-        response = await asyncio.to_thread(
-            self.llm_model.chat_with_tools, self.message_hist, tools=self.tools()
+        response = await self.llm_model.achat_with_tools(
+            self.message_hist, tools=self.tools()
         )
 
         if not response.message.role == Role.assistant:
@@ -325,17 +366,16 @@ class StreamingOutputLessToolCallLLM(
     Generic[_TCollectedOutput],
 ):
     async def _handle_tool_calls(self):
-        returned_mess = await asyncio.to_thread(
-            self.llm_model.chat_with_tools, self.message_hist, tools=self.tools()
+        returned_mess = await self.llm_model.achat_with_tools(
+            self.message_hist, tools=self.tools()
         )
+        chunks = await self._read_stream(returned_mess)
 
-        first_item = next(returned_mess)
+        first_item = chunks[0]
         if isinstance(first_item, str):
 
             def gen_wrapper():
-                yield first_item
-                # yield the rest of the items
-                for chunk in returned_mess:
+                for chunk in chunks:
                     if isinstance(chunk, str):
                         yield chunk
                     elif isinstance(chunk, Response):
@@ -46,7 +46,7 @@ async def invoke(self):  # noqa: C901
                 break
 
             # collect the response from the model
-            returned_mess = self.llm_model.chat_with_tools(
+            returned_mess = await self.llm_model.achat_with_tools(
                 self.message_hist, tools=self.tools()
             )
 
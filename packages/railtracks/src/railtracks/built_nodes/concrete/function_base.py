@@ -12,6 +12,7 @@
 
 from typing_extensions import Self
 
+from railtracks.context.central import run_sync
 from railtracks.exceptions import NodeCreationError
 from railtracks.llm import Tool
 from railtracks.llm.type_mapping import TypeMapper
@@ -88,7 +89,9 @@ def func(cls, *args: _P.args, **kwargs: _P.kwargs) -> _TOutput:
         pass
 
     async def invoke(self):
-        result = await asyncio.to_thread(self.func, *self.args, **self.kwargs)
+        # the function is unwrapped from its classmethod so it can be pickled if the node is sent to a process pool.
+        func = getattr(self.func, "__wrapped__", self.func)
+        result = await run_sync(self.name(), func, *self.args, **self.kwargs)
 
         # This is overly safe check to make sure the returned function isn't also a coroutine.
 
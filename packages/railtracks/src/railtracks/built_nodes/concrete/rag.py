@@ -1,17 +1,76 @@
-from copy import deepcopy
+from collections import OrderedDict
 
 import railtracks as rt
 from railtracks.vector_stores.vector_store_base import VectorStore
 
 
+class RetrievalCache:
+    """
+    A bounded LRU cache of vector store search results keyed by the query text (and `top_k`).
+
+    Most of the queries built from a conversation only cover turns that were already searched on a previous
+    invocation, so caching their results means only the queries including the newest turn reach the vector store.
+
+    Args:
+        max_entries: The maximum number of query results kept.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self._results: OrderedDict[tuple[str, int], list] = OrderedDict()
+
+    def get(self, query: str, top_k: int) -> list | None:
+        """The cached results of the query, or `None` if it has not been searched yet."""
+        results = self._results.get((query, top_k))
+        if results is not None:
+            self._results.move_to_end((query, top_k))
+        return results
+
+    def set(self, query: str, top_k: int, results: list) -> None:
+        """Stores the results of the query, evicting the least recently used entries."""
+        if self.max_entries <= 0:
+            return
+        self._results[(query, top_k)] = results
+        self._results.move_to_end((query, top_k))
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes every cached result (e.g. after the vector store was updated)."""
+        self._results.clear()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+
 class RagConfig:
     """
     Configuration object for Retrieval-Augmented Generation (RAG).
+
+    Args:
+        vector_store: The vector store searched for context.
+        top_k: Number of results to retrieve from each search query.
+        max_turns: Only the most recent `max_turns` (user -> assistants) turns are used to build queries.
+            `None` uses the whole conversation.
+        max_queries: The maximum number of queries built per invocation, most recent windows first.
+            `None` means no limit.
+        cache_size: The number of query results cached between invocations (0 disables the cache).
     """
 
-    def __init__(self, vector_store: VectorStore, top_k: int = 3) -> None:
+    def __init__(
+        self,
+        vector_store: VectorStore,
+        top_k: int = 3,
+        *,
+        max_turns: int | None = 4,
+        max_queries: int | None = 10,
+        cache_size: int = 256,
+    ) -> None:
         self.vector_store = vector_store
         self.top_k = top_k
+        self.max_turns = max_turns
+        self.max_queries = max_queries
+        self.cache = RetrievalCache(cache_size)
 
 
 def _parse_message_combos(message_history: rt.llm.MessageHistory):
@@ -83,15 +142,20 @@ def update_context(
     message_history: rt.llm.MessageHistory,
     vs: rt.vector_stores.vector_store_base.VectorStore,
     top_k: int = 3,
+    *,
+    max_turns: int | None = None,
+    max_queries: int | None = None,
+    cache: RetrievalCache | None = None,
 ):
     """
     Performs a RAG-style context injection into a message history.
 
     Steps:
-        1. Deep-copy the message history (original remains untouched).
+        1. Shallow-copy the message history (original remains untouched).
         2. Convert the history into grouped (user → assistants) chunks.
-        3. Generate all possible contiguous subsequences of these chunks.
-        4. Search the vector store using these sequences.
+        3. Generate the contiguous windows of the most recent `max_turns` chunks,
+           newest first, up to `max_queries` of them.
+        4. Search the vector store using the windows not found in `cache`.
         5. Collect all unique returned results.
         6. Construct an injection text block from these results.
         7. Prepend a new user message containing the contextual information.
@@ -103,25 +167,32 @@ def update_context(
             A vector store instance implementing `.search(texts, top_k)`.
         top_k (int):
             Number of results to retrieve from each search query.
+        max_turns (int | None):
+            Number of most recent turns used to build queries (`None` for all of them).
+        max_queries (int | None):
+            Maximum number of queries to build (`None` for no limit).
+        cache (RetrievalCache | None):
+            Optional cache of the results of previously searched queries.
 
     Returns:
         MessageHistory:
             A new message history with prepended retrieved context.
     """
-    message_history = deepcopy(message_history)
+    # the messages themselves are not modified, only the list is
+    message_history = rt.llm.MessageHistory(message_history)
 
     parsed_messages = _parse_message_combos(message_history)
-    chunks_to_search = _random_contiguous_subsequence(parsed_messages)
+    chunks_to_search = _recent_windows(parsed_messages, max_turns, max_queries)
 
-    chunks = {}
-    results = vs.search(chunks_to_search, top_k=top_k)
+    results = _search_with_cache(chunks_to_search, vs, top_k, cache)
 
+    chunks = {}
     for r in results:
         if isinstance(r, list):
             for item in r:
                 if item.id not in chunks:
                     chunks[item.id] = item.content
-        else:
+        elif r.id not in chunks:
             chunks[r.id] = r.content
 
     injection_str = (
@@ -136,6 +207,44 @@ def update_context(
     return message_history
 
 
+def _search_with_cache(
+    queries: list[str],
+    vs: rt.vector_stores.vector_store_base.VectorStore,
+    top_k: int,
+    cache: RetrievalCache | None,
+) -> list:
+    """
+    Searches the vector store for the queries (in one call), reusing the results of the queries found in `cache`.
+
+    Returns:
+        list:
+            The cached and new results, in no particular order.
+    """
+    results = []
+    to_search = []
+    for query in queries:
+        cached = cache.get(query, top_k) if cache is not None else None
+        if cached is None:
+            to_search.append(query)
+        else:
+            results.extend(cached)
+
+    if not to_search:
+        return results
+
+    searched = vs.search(to_search, top_k=top_k)
+    # only per-query results (one list for every query) can be attributed to a query and cached
+    if (
+        cache is not None
+        and len(searched) == len(to_search)
+        and all(isinstance(r, list) for r in searched)
+    ):
+        for query, r in zip(to_search, searched):
+            cache.set(query, top_k, list(r))
+    results.extend(searched)
+    return results
+
+
 def _prepare_messages(messages: list[rt.llm.Message] | rt.llm.Message):
     """
     Converts one or many message objects into a newline-joined string.
@@ -154,32 +263,48 @@ def _prepare_messages(messages: list[rt.llm.Message] | rt.llm.Message):
         return str(messages)
 
 
-def _random_contiguous_subsequence(seq: list[tuple[str, str]]):
+def _recent_windows(
+    seq: list[tuple[str, str]],
+    max_turns: int | None = None,
+    max_queries: int | None = None,
+):
     """
-    Generates all possible contiguous subsequences from a list of message pairs,
+    Generates the contiguous subsequences of the most recent `max_turns` message pairs,
     flattening each subsequence into a single string.
 
+    Windows ending on a more recent turn come first (and shorter windows before longer
+    ones), so the `max_queries` budget drops the queries about the oldest turns.
+
     Example:
         Input:
             [(U1, A1), (U2, A2)]
         Output:
             [
-                "U1\nA1",
+                "U2\nA2",
                 "U1\nA1\nU2\nA2",
-                "U2\nA2"
+                "U1\nA1"
             ]
 
     Args:
         seq (list[tuple[str, str]]):
             List of (user_text, assistant_text) pairs.
+        max_turns (int | None):
+            Number of most recent pairs considered (`None` for all of them).
+        max_queries (int | None):
+            Maximum number of windows returned (`None` for no limit).
 
     Returns:
         list[str]:
-            Every possible contiguous combination of messages, each as one string.
+            The windows of the recent messages, each as one string.
     """
+    if max_turns is not None:
+        seq = seq[-max_turns:] if max_turns > 0 else []
+
     new_seq: list[str] = []
-    for i in range(len(seq)):
-        for j in range(i, len(seq)):
+    for j in reversed(range(len(seq))):
+        for i in reversed(range(j + 1)):
+            if max_queries is not None and len(new_seq) >= max_queries:
+                return new_seq
             texts = []
             for idx in range(i, j + 1):
                 texts.append(seq[idx][0])
@@ -1,4 +1,3 @@
-import asyncio
 from abc import ABC
 from typing import Generator, Generic, Literal, TypeVar
 
@@ -86,8 +85,8 @@ async def invoke(self):
             (StructuredlLLM.Output): The response message from the llm model
         """
 
-        returned_mess = await asyncio.to_thread(
-            self.llm_model.structured, self.message_hist, schema=self.output_schema()
+        returned_mess = await self.llm_model.astructured(
+            self.message_hist, schema=self.output_schema()
         )
 
         self._handle_output(returned_mess.message)
@@ -133,8 +132,8 @@ async def invoke(self):
             (StructuredlLLM.Output): The response message from the llm model
         """
 
-        returned_mess = await asyncio.to_thread(
-            self.llm_model.structured, self.message_hist, schema=self.output_schema()
+        returned_mess = await self.llm_model.astructured(
+            self.message_hist, schema=self.output_schema()
         )
 
-        return self._gen_wrapper(returned_mess)
+        return self._gen_wrapper(await self._read_stream(returned_mess))
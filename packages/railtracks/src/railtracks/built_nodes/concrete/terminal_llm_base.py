@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 from abc import ABC
 from typing import Generator, Generic, Literal, TypeVar
 
@@ -57,9 +56,7 @@ async def invoke(self):
             (TerminalLLM.Output): The response message from the llm model
         """
         try:
-            returned_mess = await asyncio.to_thread(
-                self.llm_model.chat, self.message_hist
-            )
+            returned_mess = await self.llm_model.achat(self.message_hist)
         except Exception as e:
             raise LLMError(
                 reason=f"Exception during llm model chat: {str(e)}",
@@ -111,13 +108,11 @@ async def invoke(self):
             (TerminalLLM.Output): The response message from the llm model
         """
         try:
-            returned_mess = await asyncio.to_thread(
-                self.llm_model.chat, self.message_hist
-            )
+            returned_mess = await self.llm_model.achat(self.message_hist)
         except Exception as e:
             raise LLMError(
                 reason=f"Exception during llm model chat: {str(e)}",
                 message_history=self.message_hist,
             )
 
-        return self._gen_wrapper(returned_mess)
+        return self._gen_wrapper(await self._read_stream(returned_mess))
@@ -214,7 +214,12 @@ def agent_node(
 
         def _update_message_history(node: LLMBase):
             node.message_hist = update_context(
-                node.message_hist, vs=rag.vector_store, top_k=rag.top_k
+                node.message_hist,
+                vs=rag.vector_store,
+                top_k=rag.top_k,
+                max_turns=rag.max_turns,
+                max_queries=rag.max_queries,
+                cache=rag.cache,
             )
             return
 
@@ -1,17 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import contextvars
+import copy
 import logging
 import os
 import warnings
-from typing import TYPE_CHECKING, Any, Callable, Coroutine, KeysView
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, KeysView, TypeVar
 
 from railtracks.exceptions import ContextError
 
 if TYPE_CHECKING:
     from railtracks.pubsub.publisher import RTPublisher
+    from railtracks.utils.executor_pool import ExecutorPools
 
-from railtracks.utils.config import ExecutorConfig
+from railtracks.utils.config import ExecutorConfig, PoolConfig
 from railtracks.utils.logging.config import AllowableLogLevels
 
 from ..utils.logging.config import configure_module_logging
@@ -48,6 +51,8 @@ def prepare_new(self, new_parent_id: str, new_run_id: str | None = None):
         )
 
 
+_T = TypeVar("_T")
+
 runner_context: contextvars.ContextVar[RunnerContextVars | None] = (
     contextvars.ContextVar("runner_context", default=None)
 )
@@ -160,6 +165,7 @@ def register_globals(
     parent_id: str | None,
     executor_config: ExecutorConfig,
     global_context_vars: dict[str, Any],
+    executor_pools: ExecutorPools | None = None,
 ):
     """
     Register the global variables for the current thread.
@@ -169,6 +175,7 @@ def register_globals(
         parent_id=parent_id,
         session_id=session_id,
         executor_config=executor_config,
+        executor_pools=executor_pools,
     )
     e_c = MutableExternalContext(global_context_vars)
 
@@ -190,7 +197,14 @@ async def activate_publisher():
     internal_context = r_c.internal_context
     assert internal_context is not None
 
-    assert internal_context.publisher is not None
+    if internal_context.publisher is None:
+        raise ContextError(
+            message="There is no publisher available in this context, so no nodes can be called from it.",
+            notes=[
+                "Nodes running in the 'thread' or 'process' execution modes cannot call other nodes.",
+                "Run the node in the 'async' execution mode if it needs to call other nodes.",
+            ],
+        )
 
     await internal_context.publisher.start()
 
@@ -209,6 +223,34 @@ async def shutdown_publisher():
     await context.publisher.shutdown()
 
 
+def get_executor_pools() -> ExecutorPools | None:
+    """
+    Get the executor pools for the current thread's global variables.
+
+    Returns:
+        ExecutorPools | None: The executor pools of the active session, or None if there is no session.
+    """
+    context = runner_context.get()
+    if context is None:
+        return None
+
+    return context.internal_context.executor_pools
+
+
+async def run_sync(node_name: str, func: Callable[..., _T], *args, **kwargs) -> _T:
+    """
+    Runs a synchronous function on behalf of the named node type without blocking the event loop.
+
+    Inside a session the function runs on the session's executor pools (see `ExecutorConfig.node_pools`). Otherwise, it
+    falls back to `asyncio.to_thread`.
+    """
+    pools = get_executor_pools()
+    if pools is None:
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    return await pools.run(node_name, func, *args, **kwargs)
+
+
 def get_global_config() -> ExecutorConfig:
     """
     Get the executor configuration for the current thread's global variables.
@@ -279,6 +321,44 @@ def update_parent_id(new_parent_id: str, new_run_id: str | None = None):
     runner_context.set(new_context)
 
 
+def detached_runner_context(
+    new_parent_id: str, *, copy_external: bool = False
+) -> RunnerContextVars:
+    """
+    Creates a copy of the current runner context that is cut off from the session's publisher and executor pools.
+
+    It is used by nodes which run outside the session's event loop (see the "thread" and "process" execution modes).
+    Such nodes can read and write the context, but cannot call other nodes.
+
+    Args:
+        new_parent_id (str): The parent ID of the new context (the node that will run in it).
+        copy_external (bool): If true, the external context is copied (and the executor config stripped of its
+            broadcast callback) so that the new context can be pickled and sent to another process. Otherwise, the
+            external context is shared by reference.
+    """
+    current_context = safe_get_runner_context()
+    internal_context = current_context.internal_context
+
+    executor_config = internal_context.executor_config
+    external_context = current_context.external_context
+    if copy_external:
+        executor_config = copy.copy(executor_config)
+        executor_config.subscriber = None
+        external_context = MutableExternalContext(
+            {k: external_context.get(k) for k in external_context.keys()}
+        )
+
+    return RunnerContextVars(
+        internal_context=InternalContext(
+            session_id=internal_context.session_id,
+            run_id=internal_context.run_id,
+            parent_id=new_parent_id,
+            executor_config=executor_config,
+        ),
+        external_context=external_context,
+    )
+
+
 def delete_globals():
     """Resets the globals to None."""
     runner_context.set(None)
@@ -367,6 +447,8 @@ def set_config(
     ) = None,
     prompt_injection: bool | None = None,
     save_state: bool | None = None,
+    sync_pool_size: int | None = None,
+    node_pools: Dict[str, PoolConfig] | None = None,
 ):
     """
     Sets the global configuration for the executor. This will be propagated to all new runners created after this call.
@@ -396,6 +478,8 @@ def set_config(
         subscriber=broadcast_callback,
         prompt_injection=prompt_injection,
         save_state=save_state,
+        sync_pool_size=sync_pool_size,
+        node_pools=node_pools,
     )
 
     global_executor_config.set(new_config)
@@ -6,6 +6,7 @@
 
 if TYPE_CHECKING:
     from railtracks.pubsub.publisher import RTPublisher
+    from railtracks.utils.executor_pool import ExecutorPools
 
 
 class InternalContext:
@@ -23,12 +24,14 @@ def __init__(
         publisher: RTPublisher | None = None,
         parent_id: str | None = None,
         executor_config: ExecutorConfig,
+        executor_pools: ExecutorPools | None = None,
     ):
         self._parent_id: str | None = parent_id
         self._publisher: RTPublisher | None = publisher
         self._session_id: str = session_id
         self._run_id: str | None = run_id
         self._executor_config: ExecutorConfig = executor_config
+        self._executor_pools: ExecutorPools | None = executor_pools
 
     @property
     def executor_config(self) -> ExecutorConfig:
@@ -44,6 +47,13 @@ def executor_config(self, value: ExecutorConfig):
         """
         self._executor_config = value
 
+    @property
+    def executor_pools(self) -> ExecutorPools | None:
+        """
+        Returns the executor pools that synchronous nodes in this run should use.
+        """
+        return self._executor_pools
+
     # Not super pythonic but it allows us to slap in debug statements on the getters and setters with ease
     @property
     def parent_id(self):
@@ -105,4 +115,5 @@ def prepare_new(
             session_id=self._session_id,
             run_id=unwrapped_run_id,
             executor_config=self._executor_config,
+            executor_pools=self._executor_pools,
         )
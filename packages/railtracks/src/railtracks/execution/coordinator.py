@@ -1,5 +1,8 @@
+import math
 import time
-from typing import Dict, List, Literal, get_args
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Literal, get_args
 
 from railtracks.pubsub.messages import (
     ExecutionConfigurations,
@@ -79,18 +82,51 @@ def __str__(self):
         return f"Job(request_id={self.request_id}, status={self.status}, result={self.result}, start_time={self.start_time}, end_time={self.end_time})"
 
 
+@dataclass(frozen=True)
+class SystemDetail:
+    """
+    A point in time summary of the jobs the coordinator has processed.
+
+    Args:
+        in_flight (int): The number of jobs that are currently open.
+        succeeded (int): The number of jobs that have closed successfully over the lifetime of the coordinator.
+        failed (int): The number of jobs that have closed with a failure over the lifetime of the coordinator.
+        latency_percentiles (Dict[str, float]): The p50, p90 and p99 duration (in seconds) of the most recently closed
+            jobs. Empty if no job has closed yet.
+    """
+
+    in_flight: int
+    succeeded: int
+    failed: int
+    latency_percentiles: Dict[str, float]
+
+    @property
+    def completed(self) -> int:
+        return self.succeeded + self.failed
+
+
 class CoordinatorState:
     """
     A simple object that stores the state of the coordinator in terms of the jobs it has and is currently processing.
 
+    Open jobs are kept in a dictionary keyed by request_id. Once closed, a job moves into a ring buffer that holds only
+    the `max_closed_jobs` most recent ones, while the totals are kept as counters. This keeps the memory of a long-lived
+    session bounded.
+
     The API supports simple operations that will allow you to interact with the jobs.
     """
 
-    def __init__(self, job_list: List[Job] | None = None):
-        if job_list is None:
-            job_list = []
+    def __init__(self, job_list: List[Job] | None = None, max_closed_jobs: int = 1000):
+        self.open_jobs: Dict[str, Job] = {}
+        self.closed_jobs: Deque[Job] = deque(maxlen=max_closed_jobs)
+        self.succeeded = 0
+        self.failed = 0
 
-        self.job_list: List[Job] = job_list
+        for job in job_list or []:
+            if job.status == "opened":
+                self.open_jobs[job.request_id] = job
+            else:
+                self._record_closed(job)
 
     @classmethod
     def empty(cls):
@@ -101,6 +137,13 @@ def empty(cls):
         """
         return cls()
 
+    @property
+    def job_list(self) -> List[Job]:
+        """
+        The retained closed jobs (oldest first) followed by the currently open jobs.
+        """
+        return list(self.closed_jobs) + list(self.open_jobs.values())
+
     def add_job(self, task: Task):
         """
         Adds a job to the coordinator state.
@@ -110,18 +153,49 @@ def add_job(self, task: Task):
 
         """
         new_job = Job.create_new(task)
-        self.job_list.append(new_job)
+        self.open_jobs[new_job.request_id] = new_job
 
     def end_job(self, request_id: str, result: Literal["success", "failure"]):
         """
         End a job with the given request_id and result.
         """
-        for job in self.job_list:
-            if job.request_id == request_id and job.status == "opened":
-                job.end_job(result)
-                return
+        job = self.open_jobs.pop(request_id, None)
+        if job is None:
+            raise ValueError(f"No open job found with request_id: {request_id}")
 
-        raise ValueError(f"No open job found with request_id: {request_id}")
+        job.end_job(result)
+        self._record_closed(job)
+
+    def _record_closed(self, job: Job):
+        if job.result == "success":
+            self.succeeded += 1
+        else:
+            self.failed += 1
+        self.closed_jobs.append(job)
+
+    def detail(self) -> SystemDetail:
+        """
+        Summarizes the current state without copying the job history.
+        """
+        durations = sorted(
+            job.end_time - job.start_time
+            for job in self.closed_jobs
+            if job.start_time is not None and job.end_time is not None
+        )
+
+        latency_percentiles = {}
+        if durations:
+            for p in (50, 90, 99):
+                # nearest-rank percentile
+                index = max(math.ceil(p / 100 * len(durations)) - 1, 0)
+                latency_percentiles[f"p{p}"] = durations[index]
+
+        return SystemDetail(
+            in_flight=len(self.open_jobs),
+            succeeded=self.succeeded,
+            failed=self.failed,
+            latency_percentiles=latency_percentiles,
+        )
 
     def __str__(self):
         return ",".join([str(x) for x in self.job_list])
@@ -186,6 +260,13 @@ def system_detail(self) -> CoordinatorState:
         """
         return self.state
 
+    def summary(self) -> SystemDetail:
+        """
+        Summarizes the current state of the Coordinator (in-flight count, totals and latency percentiles) without
+        copying the job history.
+        """
+        return self.state.detail()
+
     def shutdown(self):
         """
         Shuts down all active execution strategies.
@@ -2,20 +2,24 @@
 
 import asyncio
 import concurrent.futures
-import inspect
+import contextvars
+import pickle
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import Any, Dict, List
 
 from railtracks.context.central import (
+    RunnerContextVars,
+    delete,
+    detached_runner_context,
     get_publisher,
-    update_parent_id,
+    keys,
+    runner_context,
+    update,
 )
-from railtracks.context.internal import InternalContext
 from railtracks.nodes.nodes import NodeState
 from railtracks.pubsub.messages import RequestFailure, RequestSuccess
 
-if TYPE_CHECKING:
-    from .task import Task
+from .task import Task
 
 
 class TaskExecutionStrategy(ABC):
@@ -66,59 +70,185 @@ async def execute(self, task: Task):
         return response
 
 
-class ConcurrentFuturesExecutor(TaskExecutionStrategy):
-    def __init__(self, executor: concurrent.futures.Executor):
-        raise NotImplementedError(
-            "We currently do not support concurrent futures executor. See issue #140"
-        )
-        self.executor: concurrent.futures.Executor | None = executor
+class ConcurrentFuturesExecutor(TaskExecutionStrategy, ABC):
+    """
+    A base for execution strategies that run each task on a `concurrent.futures` executor, off of the session's event
+    loop.
+
+    Nodes run this way can read and write the context, but they cannot call other nodes. The outcome of the task is
+    marshalled back onto the session's publisher like any other task.
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        self.max_workers = max_workers
+        self.executor: concurrent.futures.Executor | None = None
+
+    @abstractmethod
+    def _create_executor(self) -> concurrent.futures.Executor:
+        pass
+
+    @abstractmethod
+    async def _run(self, executor: concurrent.futures.Executor, task: Task) -> Any:
+        """Runs the task on the executor and returns its result (raising any exception it threw)."""
+        pass
 
     def shutdown(self):
         if self.executor is not None:
-            self.executor.shutdown(wait=True)
+            # any work still running belongs to a session that is closing, so we do not wait on it.
+            self.executor.shutdown(wait=False, cancel_futures=True)
             self.executor = None
 
-    def execute(self, task: Task):
-        if inspect.iscoroutine(task.invoke):
-
-            def non_async_wrapper():
-                return asyncio.run(task.invoke())
+    async def execute(self, task: Task):
+        """
+        Executes the task on the executor (created on first use), publishing the outcome once it has finished.
 
-            invoke_func = non_async_wrapper
-        else:
-            invoke_func = task.invoke
+        Args:
+            task (Task): The task to be executed.
+        """
+        if self.executor is None:
+            self.executor = self._create_executor()
 
         publisher = get_publisher()
+        response = None
+        try:
+            result = await self._run(self.executor, task)
+            response = RequestSuccess(
+                request_id=task.request_id,
+                node_state=NodeState(task.node),
+                result=result,
+            )
+        except Exception as e:
+            response = RequestFailure(
+                request_id=task.request_id, node_state=NodeState(task.node), error=e
+            )
+        finally:
+            if response is not None:
+                await publisher.publish(response)
 
-        def wrapped_invoke(global_vars: InternalContext):
-            update_parent_id(task.node.uuid)
-            try:
-                result = invoke_func()
-                response = RequestSuccess(
-                    request_id=task.request_id,
-                    node_state=NodeState(task.node),
-                    result=result,
-                )
-            except Exception as e:
-                response = RequestFailure(
-                    request_id=task.request_id, node_state=NodeState(task.node), error=e
-                )
-            finally:
-                publisher.publish(response)
+        return response
 
-        # f = self.executor.submit(wrapped_invoke, parent_global_variables)
 
-        # return f
+def _invoke_in_thread(task: Task, context: RunnerContextVars):
+    runner_context.set(context)
+    return asyncio.run(task.invoke())
 
 
 class ThreadedExecutionStrategy(ConcurrentFuturesExecutor):
-    # TODO add config as required here
-    def __init__(self):
-        super().__init__(concurrent.futures.ThreadPoolExecutor())
+    """
+    Runs each task on its own event loop in a worker thread.
+
+    The context is shared with the session, so anything put into it is immediately visible to the rest of the session.
+    """
+
+    def _create_executor(self) -> concurrent.futures.Executor:
+        return concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="railtracks-task"
+        )
 
+    async def _run(self, executor: concurrent.futures.Executor, task: Task):
+        context = detached_runner_context(task.node.uuid)
+        loop = asyncio.get_running_loop()
+        # the task runs in a copy of the current context so that the user's own context variables carry over too.
+        return await loop.run_in_executor(
+            executor,
+            contextvars.copy_context().run,
+            _invoke_in_thread,
+            task,
+            context,
+        )
+
+
+class _ProcessOutcome:
+    """
+    Everything that is sent back from a task that ran in a worker process.
+    """
+
+    def __init__(
+        self,
+        *,
+        result: Any,
+        error: Exception | None,
+        details: Dict[str, Any],
+        updated_context: Dict[str, Any],
+        deleted_context: List[str],
+    ):
+        self.result = result
+        self.error = error
+        self.details = details
+        self.updated_context = updated_context
+        self.deleted_context = deleted_context
+
+
+def _picklable_error(error: Exception) -> Exception:
+    try:
+        pickle.loads(pickle.dumps(error))
+        return error
+    except Exception:
+        # many exceptions (including some of our own) can not be rebuilt from their pickled form.
+        return RuntimeError(f"{type(error).__name__}: {str(error)}")
+
+
+def _invoke_in_process(
+    request_id: str, node_state: NodeState, context: RunnerContextVars
+) -> _ProcessOutcome:
+    node = node_state.instantiate()
+    external = context.external_context
+    sent = {k: external.get(k) for k in external.keys()}
+
+    runner_context.set(context)
+    result = None
+    error = None
+    try:
+        result = asyncio.run(Task(request_id=request_id, node=node).invoke())
+    except Exception as e:
+        error = _picklable_error(e)
+    finally:
+        runner_context.set(None)
+
+    return _ProcessOutcome(
+        result=result,
+        error=error,
+        details=dict(node.details),
+        updated_context={
+            k: external.get(k)
+            for k in external.keys()
+            if k not in sent or external.get(k) is not sent[k]
+        },
+        deleted_context=[k for k in sent if k not in external.keys()],
+    )
+
+
+class ProcessExecutionStrategy(ConcurrentFuturesExecutor):
+    """
+    Runs each task on its own event loop in a worker process, allowing CPU heavy nodes to run in parallel.
+
+    The node (see `NodeState`), its context and its result must all be picklable. The node's debug details and any
+    changes it made to the context are copied back into the session once it has finished.
+    """
 
-class ProcessExecutionStrategy(TaskExecutionStrategy):
-    def __init__(self):
-        raise NotImplementedError(
-            "We do not support Process Task Execution Strategy yet."
+    def _create_executor(self) -> concurrent.futures.Executor:
+        return concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers)
+
+    async def _run(self, executor: concurrent.futures.Executor, task: Task):
+        context = detached_runner_context(task.node.uuid, copy_external=True)
+        loop = asyncio.get_running_loop()
+        outcome: _ProcessOutcome = await loop.run_in_executor(
+            executor,
+            _invoke_in_process,
+            task.request_id,
+            NodeState(task.node),
+            context,
         )
+
+        task.node.details.update(outcome.details)
+        if outcome.updated_context:
+            update(outcome.updated_context)
+        for key in outcome.deleted_context:
+            # the key may have already been removed by another node while this one was running.
+            if key in keys():
+                delete(key)
+
+        if outcome.error is not None:
+            raise outcome.error
+
+        return outcome.result
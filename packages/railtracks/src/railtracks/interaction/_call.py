@@ -8,6 +8,7 @@
     Coroutine,
     ParamSpec,
     TypeVar,
+    get_args,
     overload,
 )
 from uuid import uuid4
@@ -24,12 +25,7 @@
 )
 from railtracks.exceptions import GlobalTimeOutError
 from railtracks.nodes.utils import extract_node_from_function
-from railtracks.pubsub.messages import (
-    FatalFailure,
-    RequestCompletionMessage,
-    RequestCreation,
-    RequestFinishedBase,
-)
+from railtracks.pubsub.messages import ExecutionConfigurations, RequestCreation
 from railtracks.pubsub.utils import output_mapping
 
 if TYPE_CHECKING:
@@ -59,6 +55,7 @@ async def call(
 async def call(
     node_: Callable[_P, Node[_TOutput]] | RTFunction[_P, _TOutput],
     *args: _P.args,
+    execution_mode: ExecutionConfigurations = "async",
     **kwargs: _P.kwargs,
 ) -> _TOutput:
     """
@@ -73,13 +70,24 @@ async def call(
     # for parallel operation
     tasks = [call(NodeA, "hello world", i) for i in range(10)]
     results = await asyncio.gather(*tasks)
+
+    # for CPU heavy work that should run on another core
+    result = await call(NodeA, "hello world", 42, execution_mode="process")
     ```
 
     Args:
         node: The node type you would like to create. This could be a function decorated with `@function_node`, a function, or a Node instance.
         *args: The arguments to pass to the node
+        execution_mode: Where the node should run. "async" (the default) runs it on the session's event loop, "thread"
+            runs it on its own event loop in a worker thread and "process" runs it in a worker process. Nodes run in
+            the "thread" or "process" modes cannot call other nodes.
         **kwargs: The keyword arguments to pass to the node
     """
+    if execution_mode not in get_args(ExecutionConfigurations):
+        raise ValueError(
+            f"execution_mode must be one of {get_args(ExecutionConfigurations)}, got {execution_mode}"
+        )
+
     node: Callable[_P, Node[_TOutput]]
     # this entire section is a bit of a typing nightmare becuase all overloads we provide.
     if isinstance(node_, FunctionType):
@@ -93,53 +101,24 @@ async def call(
         from railtracks import Session
 
         with Session():
-            result = await _start(node, args=args, kwargs=kwargs)
+            result = await _start(node, args=args, kwargs=kwargs, mode=execution_mode)
             return result
 
     # if the context is not active then we know this is the top level request
     if not is_context_active():
-        result = await _start(node, args=args, kwargs=kwargs)
+        result = await _start(node, args=args, kwargs=kwargs, mode=execution_mode)
         return result
 
     # if the context is active then we can just run the node
-    result = await _run(node, args=args, kwargs=kwargs)
+    result = await _run(node, args=args, kwargs=kwargs, mode=execution_mode)
     return result
 
 
-def _regular_message_filter(request_id: str):
-    """
-    Returns a filter function that checks if the message matches the request ID.
-    """
-
-    def filter_func(item: RequestCompletionMessage) -> bool:
-        if isinstance(item, RequestFinishedBase):
-            return item.request_id == request_id
-        return False
-
-    return filter_func
-
-
-def _top_level_message_filter(request_id: str):
-    """
-    Returns a filter function that checks if the message matches the request ID.
-    """
-
-    def message_filter(item: RequestCompletionMessage) -> bool:
-        # we want to filter and collect the message that matches this request_id
-        matches_request_id = (
-            isinstance(item, RequestFinishedBase) and item.request_id == request_id
-        )
-        fatal_failure = isinstance(item, FatalFailure)
-
-        return matches_request_id or fatal_failure
-
-    return message_filter
-
-
 async def _start(
     node: Callable[_P, Node[_TOutput]],
     args,
     kwargs,
+    mode: ExecutionConfigurations = "async",
 ):
     await activate_publisher()
 
@@ -156,9 +135,7 @@ async def wrapped_fut(f: Coroutine):
             raise error
 
     timeout = get_local_config().timeout
-    fut = _execute(
-        node, args=args, kwargs=kwargs, message_filter=_top_level_message_filter
-    )
+    fut = _execute(node, args=args, kwargs=kwargs, mode=mode)
     # Here we wait the completion of the future with timeouts.
     try:
         result = await asyncio.wait_for(wrapped_fut(fut), timeout=timeout)
@@ -179,37 +156,36 @@ async def _run(
     node: Callable[_P, Node[_TOutput]],
     args,
     kwargs,
+    mode: ExecutionConfigurations = "async",
 ):
     """
     Executes the given Node set up using the provided arguments and keyword arguments.
     """
-    return await _execute(
-        node, args=args, kwargs=kwargs, message_filter=_regular_message_filter
-    )
+    return await _execute(node, args=args, kwargs=kwargs, mode=mode)
 
 
 async def _execute(
     node: Callable[_P, Node[_TOutput]],
     args,
     kwargs,
-    message_filter: Callable[[str], Callable[[RequestCompletionMessage], bool]],
+    mode: ExecutionConfigurations = "async",
 ) -> _TOutput:
     publisher = get_publisher()
 
-    # generate a unique request ID for this request. We need to hold this reference here because we will use it to
-    # filter for its completion
+    # generate a unique request ID for this request. We need to hold this reference here because the publisher
+    # routes its completion message (or any fatal failure) to us by this id.
     request_id = str(uuid4())
 
     # note we set the listener before we publish the messages ensure that we do not miss any messages
     # I am actually a bit worried about this logic and I think there is a chance of a bug popping up here.
-    f = publisher.listener(message_filter(request_id), output_mapping)
+    f = publisher.request_listener(request_id, output_mapping)
 
     await publisher.publish(
         RequestCreation(
             current_node_id=get_parent_id(),
             current_run_id=get_run_id(),
             new_request_id=request_id,
-            running_mode="async",
+            running_mode=mode,
             new_node_type=node,
             args=args,
             kwargs=kwargs,
@@ -15,6 +15,15 @@
     # TelusLLM,
 )
 from .providers import ModelProvider
+from .rate_limit import (
+    RateLimiter,
+    clear_rate_limits,
+    get_rate_limiter,
+    remove_rate_limit,
+    set_rate_limit,
+)
+from .response_cache import InMemoryResponseCache, ResponseCache, SQLiteResponseCache
+from .retry import RetryPolicy
 from .tools import (
     ArrayParameter,
     ObjectParameter,
@@ -35,6 +44,15 @@
     "ToolMessage",
     "MessageHistory",
     "ModelProvider",
+    "ResponseCache",
+    "InMemoryResponseCache",
+    "SQLiteResponseCache",
+    "RateLimiter",
+    "RetryPolicy",
+    "set_rate_limit",
+    "remove_rate_limit",
+    "clear_rate_limits",
+    "get_rate_limiter",
     "Tool",
     "AnthropicLLM",
     "AzureAILLM",
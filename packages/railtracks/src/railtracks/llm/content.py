@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, AnyStr, Dict, Generator, Generic, List, TypeVar, Union
+from typing import Any, AnyStr, ClassVar, Dict, Generator, Generic, List, TypeVar, Union
 
 from pydantic import BaseModel, Field
 
@@ -20,6 +20,12 @@ class ToolCall(BaseModel):
     arguments: Dict[str, Any] = Field(
         description="The arguments provided as input to the tool."
     )
+    # counts the fields assigned on any tool call, so rendered messages know when to render their tool calls again
+    edits: ClassVar[int] = 0
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        ToolCall.edits += 1
 
     def __str__(self):
         return f"{self.name}({self.arguments})"
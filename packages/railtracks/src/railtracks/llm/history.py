@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Any, Callable, Dict, Hashable, List, Optional
 
 from .message import Message, Role
 
@@ -19,3 +19,66 @@ def removed_system_messages(self) -> MessageHistory:
         Returns a new MessageHistory object with all SystemMessages removed.
         """
         return MessageHistory([msg for msg in self if msg.role != Role.system])
+
+    def render(
+        self,
+        renderer: Callable[[Message], Dict[str, Any]],
+        key: Optional[Hashable] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Renders every message into a provider payload (a dict) with the renderer.
+
+        The payload of each message is memoized on the message, so histories growing turn after turn (e.g. in a tool
+        calling loop) only render their new messages. A message is rendered again when its `revision` changed, e.g.
+        after its prompt was filled or a field of one of its tool calls was assigned. Any other change to the content
+        of a message that has been rendered is not detected, the content is expected not to be mutated once sent.
+
+        The payloads are memoized in a frozen form, and every call builds new dicts and lists from it, so callers may
+        alter the returned payloads (at any depth) freely. Any other value in a payload (strings, numbers, ...) is
+        shared and must not be mutated, hence renderers should only produce plain dicts and lists of such values.
+
+        Args:
+            renderer: Converts a message into its payload.
+            key: Identifies the renderer in the memo, defaults to the renderer itself. Use a stable key when the
+                renderer is a bound method, so the payloads are shared by every instance.
+
+        Returns:
+            List[dict]: A fresh copy of the payload of every message.
+        """
+        key = renderer if key is None else key
+        payloads = []
+        for message in self:
+            memo = message._rendered.get(key)
+            revision = message.revision
+            if memo is None or memo[0] != revision:
+                memo = message._rendered[key] = (revision, _freeze(renderer(message)))
+            payloads.append(_thaw(memo[1]))
+        return payloads
+
+
+class _FrozenDict(tuple):
+    """The items of a frozen dict holding dicts or lists (see `_freeze`)."""
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Converts the dicts and lists of the value into tuples, which `_thaw` turns back into new dicts and lists. Dicts
+    holding no dicts or lists are only copied, as `_thaw` copies them in one go.
+    """
+    if isinstance(value, dict):
+        if not any(isinstance(v, (dict, list)) for v in value.values()):
+            return dict(value)
+        return _FrozenDict((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    if type(value) is dict:
+        return value.copy()
+    if isinstance(value, _FrozenDict):
+        return {k: _thaw(v) for k, v in value}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
@@ -4,7 +4,7 @@
 import os
 from copy import deepcopy
 from enum import Enum
-from typing import Generic, TypeVar
+from typing import Any, Dict, Generic, Hashable, Tuple, TypeVar
 
 from .content import Content, ToolCall, ToolResponse
 from .encoding import detect_source, encode
@@ -113,6 +113,11 @@ def __init__(
         self._content = content
         self._role = role
         self._inject_prompt = inject_prompt
+        # counts the changes made to the content, see `revision`
+        self._version = 0
+        # provider payloads rendered from this message along with the revision they were rendered from, keyed by their
+        # renderer (see `MessageHistory.render`)
+        self._rendered: Dict[Hashable, Tuple[int, Any]] = {}
 
     @classmethod
     def validate_content(cls, content: _T):
@@ -123,6 +128,17 @@ def content(self) -> _T:
         """Collects the content of the message."""
         return self._content
 
+    @property
+    def revision(self) -> int:
+        """
+        A number that grows whenever the content of the message may have changed: when its prompt is filled or, for
+        tool calls, when a field of any tool call is assigned. Changes made inside the values of the content (e.g. to
+        the arguments dict of a tool call) are not counted, the content is expected not to be mutated once sent.
+        """
+        if isinstance(self._content, list):
+            return self._version + ToolCall.edits
+        return self._version
+
     @property
     def role(self) -> _TRole:
         """Collects the role of the message."""
@@ -173,6 +189,7 @@ def validate_content(cls, content: str):
 
     def fill_prompt(self, value_dict: ValueDict) -> None:
         self._content = KeyOnlyFormatter().vformat(self._content, (), value_dict)
+        self._version += 1
 
 
 class UserMessage(_StringOnlyContent[Role.user]):
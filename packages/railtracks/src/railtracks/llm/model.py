@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from copy import copy
 from typing import (
     AsyncGenerator,
     Callable,
@@ -18,10 +19,12 @@
 )
 
 from pydantic import BaseModel
+from typing_extensions import Self
 
 from .history import MessageHistory
 from .providers import ModelProvider
 from .response import Response
+from .response_cache import ResponseCache
 from .tools import Tool
 
 _TStream = TypeVar("_TStream", Literal[True], Literal[False])
@@ -34,9 +37,12 @@ class ModelBase(ABC, Generic[_TStream]):
     The base class allows for the insertion of hooks that can modify the messages before they are sent to the model,
     response after they are received, and map exceptions that may occur during the interaction.
 
-    All the hooks are optional and can be added or removed as needed.
+    All the hooks are optional and can be added or removed as needed. Similarly, a `ResponseCache` can be set so
+    that requests the model has already answered are replayed from the cache instead of sent to the provider.
     """
 
+    _cache: ResponseCache | None = None
+
     def __init__(
         self,
         __pre_hooks: List[Callable[[MessageHistory], MessageHistory]] | None = None,
@@ -94,6 +100,30 @@ def remove_exception_hooks(self) -> None:
         """Removes all of the hooks that handle exceptions during model interactions."""
         self._exception_hooks = []
 
+    def set_cache(self, cache: ResponseCache) -> None:
+        """Sets the cache used to replay the responses of requests the model has already answered."""
+        self._cache = cache
+
+    def remove_cache(self) -> None:
+        """Removes the response cache, every request is sent to the provider again."""
+        self._cache = None
+
+    @property
+    def cache(self) -> ResponseCache | None:
+        """The response cache of the model, if any."""
+        return self._cache
+
+    def copy_with_hooks(self) -> Self:
+        """
+        Creates a shallow copy of the model with its own lists of hooks. Hooks added to or removed from the copy will
+        not affect the original model (and vice versa).
+        """
+        new_model = copy(self)
+        new_model._pre_hooks = list(self._pre_hooks)
+        new_model._post_hooks = list(self._post_hooks)
+        new_model._exception_hooks = list(self._exception_hooks)
+        return new_model
+
     @abstractmethod
     def model_name(self) -> str:
         """
@@ -159,6 +189,25 @@ def generator_wrapper(
 
         return new_response
 
+    async def agenerator_wrapper(
+        self,
+        generator: AsyncGenerator[str | Response, None],
+        message_history: MessageHistory,
+    ) -> AsyncGenerator[str | Response, None]:
+        """The async counterpart of `generator_wrapper`, running the post hooks on the final Response of the stream."""
+        new_response: Response | None = None
+        async for g in generator:
+            if isinstance(g, Response):
+                new_response = self._run_post_hooks(message_history, g)
+                yield new_response
+                continue
+
+            yield g
+
+        assert new_response is not None, (
+            "The generator did not yield a final Response object so nothing could be done."
+        )
+
     @overload
     def chat(self: ModelBase[Literal[False]], messages: MessageHistory) -> Response:
         pass
@@ -197,7 +246,7 @@ async def achat(
     @overload
     async def achat(
         self: ModelBase[Literal[True]], messages: MessageHistory
-    ) -> Generator[str | Response, None, Response]:
+    ) -> AsyncGenerator[str | Response, None]:
         pass
 
     async def achat(self, messages: MessageHistory):
@@ -210,6 +259,9 @@ async def achat(self, messages: MessageHistory):
             self._run_exception_hooks(messages, e)
             raise e
 
+        if isinstance(response, AsyncGenerator):
+            return self.agenerator_wrapper(response, messages)
+
         if isinstance(response, Generator):
             return self.generator_wrapper(response, messages)
 
@@ -263,7 +315,7 @@ async def astructured(
         self: ModelBase[Literal[True]],
         messages: MessageHistory,
         schema: Type[BaseModel],
-    ) -> Generator[str | Response, None, Response]:
+    ) -> AsyncGenerator[str | Response, None]:
         pass
 
     async def astructured(self, messages: MessageHistory, schema: Type[BaseModel]):
@@ -276,6 +328,9 @@ async def astructured(self, messages: MessageHistory, schema: Type[BaseModel]):
             self._run_exception_hooks(messages, e)
             raise e
 
+        if isinstance(response, AsyncGenerator):
+            return self.agenerator_wrapper(response, messages)
+
         if isinstance(response, Generator):
             return self.generator_wrapper(response, messages)
 
@@ -320,7 +375,7 @@ async def achat_with_tools(
     @overload
     async def achat_with_tools(
         self: ModelBase[Literal[True]], messages: MessageHistory, tools: List[Tool]
-    ) -> Generator[str | Response, None, Response]:
+    ) -> AsyncGenerator[str | Response, None]:
         pass
 
     async def achat_with_tools(self, messages: MessageHistory, tools: List[Tool]):
@@ -333,6 +388,9 @@ async def achat_with_tools(self, messages: MessageHistory, tools: List[Tool]):
             self._run_exception_hooks(messages, e)
             raise e
 
+        if isinstance(response, AsyncGenerator):
+            return self.agenerator_wrapper(response, messages)
+
         if isinstance(response, Generator):
             return self.generator_wrapper(response, messages)
 
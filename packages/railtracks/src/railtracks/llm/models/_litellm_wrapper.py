@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+import contextvars
+import functools
 import json
+import os
 import time
 import warnings
+import weakref
 from abc import ABC
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from json import JSONDecodeError
 from typing import (
     Any,
+    AsyncGenerator,
     Callable,
+    Coroutine,
     Dict,
     Generator,
     Generic,
@@ -24,18 +32,26 @@
 import litellm
 from litellm.litellm_core_utils.streaming_handler import CustomStreamWrapper
 from litellm.types.utils import ModelResponse
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
 from ...exceptions.errors import LLMError, NodeInvocationError
 from ..content import ToolCall
 from ..history import MessageHistory
 from ..message import AssistantMessage, Message, ToolMessage, UserMessage
 from ..model import ModelBase
+from ..rate_limit import RateLimiter, estimate_tokens, get_rate_limiter
 from ..response import MessageInfo, Response
+from ..response_cache import ResponseCache
+from ..retry import RetryPolicy
 from ..tools import Tool
 from ..tools.parameters import Parameter
 
 _TBaseModel = TypeVar("_TBaseModel", bound=BaseModel)
+_T = TypeVar("_T")
+
+# the keys of the hidden params of a completion where the number of retries and hedged requests are recorded
+_RETRIES_PARAM = "railtracks_retries"
+_HEDGES_PARAM = "railtracks_hedges"
 
 
 def _process_single_parameter(p: Parameter) -> tuple[str, Dict[str, Any], bool]:
@@ -100,36 +116,199 @@ def _parameters_to_json_schema(
     )
 
 
+# Tools are treated as immutable, so each one is compiled to its (JSON encoded) litellm payload only once.
+_compiled_litellm_tools: weakref.WeakKeyDictionary[Tool, str] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _compile_litellm_tool(tool: Tool) -> str:
+    """
+    Compiles the Tool object into the JSON encoded payload for litellm.completion. The result is cached for as long as
+    the Tool object is alive.
+    """
+    compiled = _compiled_litellm_tools.get(tool)
+    if compiled is None:
+        # parameters may be None
+        json_schema = _parameters_to_json_schema(tool.parameters)
+        compiled = json.dumps(
+            {
+                "type": "function",
+                "function": {
+                    "name": tool.name,
+                    "description": tool.detail,
+                    "parameters": json_schema,
+                },
+            }
+        )
+        _compiled_litellm_tools[tool] = compiled
+    return compiled
+
+
 def _to_litellm_tool(tool: Tool) -> Dict[str, Any]:
     """
     Convert your Tool object into the dict format for litellm.completion.
+
+    A fresh dict is decoded from the compiled payload every time because litellm edits the schemas of some providers in
+    place.
+    """
+    return json.loads(_compile_litellm_tool(tool))
+
+
+class StreamedToolCall:
+    """
+    A tool call being streamed. The fragments of its (json encoded) arguments are buffered and only joined once the
+    call is complete, so accumulating them stays linear in the length of the arguments.
     """
-    # parameters may be None
-    json_schema = _parameters_to_json_schema(tool.parameters)
-    litellm_tool = {
-        "type": "function",
-        "function": {
-            "name": tool.name,
-            "description": tool.detail,
-            "parameters": json_schema,
-        },
-    }
-    return litellm_tool
-
-
-class StreamedToolCall(BaseModel):
-    tool: ToolCall
-    args: str | None = Field(default=None)  # accumulating string of arguments (in json)
+
+    __slots__ = ("tool", "_parts")
+
+    def __init__(self, tool: ToolCall, args: str | None = None):
+        self.tool = tool
+        self._parts: List[str] | None = None if args is None else [args]
+
+    def append(self, fragment: str) -> None:
+        if self._parts is None:
+            self._parts = []
+        self._parts.append(fragment)
+
+    @property
+    def args(self) -> str | None:
+        """The arguments streamed so far (None if no arguments were streamed)."""
+        if self._parts is None:
+            return None
+        if len(self._parts) > 1:
+            self._parts = ["".join(self._parts)]
+        return self._parts[0] if self._parts else ""
 
     def load_args(self):
+        args = self.args
         try:
-            self.tool.arguments = json.loads(self.args) if self.args else {}
+            self.tool.arguments = json.loads(args) if args else {}
         except JSONDecodeError as e:
             raise ValueError(
                 f"Failed to decode tool call arguments: {str(e)}",
             )
 
 
+class _RecordingStream:
+    """
+    Passes through the chunks of a stream while recording them, handing the recorded chunks to `on_complete` once the
+    stream has been consumed past its finishing chunk (the chunk after it carries the usage) or is exhausted.
+    """
+
+    def __init__(
+        self,
+        raw: CustomStreamWrapper,
+        on_complete: Callable[[List[Any]], None],
+    ):
+        self._raw = raw
+        self._on_complete = on_complete
+        self._chunks: List[Any] = []
+        self._finished = False
+        self._done = False
+
+    def _add(self, chunk: Any) -> None:
+        self._chunks.append(chunk)
+        if self._finished:
+            self._complete()
+            return
+        choices = getattr(chunk, "choices", None)
+        if choices and choices[0].finish_reason in ("stop", "tool_calls"):
+            self._finished = True
+
+    @property
+    def _hidden_params(self) -> Dict[str, Any]:
+        return self._raw._hidden_params
+
+    def _complete(self) -> None:
+        if not self._done:
+            self._done = True
+            self._on_complete(self._chunks)
+
+    def __iter__(self):
+        for chunk in self._raw:
+            self._add(chunk)
+            yield chunk
+        self._complete()
+
+    async def __aiter__(self):
+        async for chunk in self._raw:
+            self._add(chunk)
+            yield chunk
+        self._complete()
+
+
+class _ReplayedStream:
+    """Replays the recorded chunks of a stream, both synchronously and asynchronously."""
+
+    def __init__(self, chunks: List[Any]):
+        self._chunks = chunks
+
+    def __iter__(self):
+        return iter(self._chunks)
+
+    async def __aiter__(self):
+        for chunk in self._chunks:
+            yield chunk
+
+
+class _LimitedStream:
+    """
+    Passes through the chunks of a stream admitted by a rate limiter. The stream holds onto its slot in the limiter
+    until it is exhausted, closed or garbage collected, and then corrects the token budget with the usage reported by
+    its final chunk (if any).
+    """
+
+    def __init__(self, raw: CustomStreamWrapper, limiter: RateLimiter, estimated: int):
+        self._raw = raw
+        self._limiter = limiter
+        self._estimated = estimated
+        self._usage: int | None = None
+        self._released = False
+
+    @property
+    def _hidden_params(self) -> Dict[str, Any]:
+        return self._raw._hidden_params
+
+    def _observe(self, chunk: Any) -> None:
+        total_tokens = getattr(getattr(chunk, "usage", None), "total_tokens", None)
+        if isinstance(total_tokens, int):
+            self._usage = total_tokens
+
+    def close(self) -> None:
+        """Releases the slot of the stream in the rate limiter, its remaining chunks should not be read after this."""
+        if self._released:
+            return
+        self._released = True
+        self._limiter.release()
+        if self._usage is not None:
+            self._limiter.record_usage(self._estimated, self._usage)
+
+    def __del__(self):
+        # a stream which is dropped without being read (e.g. the slower reply of a hedged request) must not keep its slot
+        self.close()
+
+    def __iter__(self):
+        try:
+            for chunk in self._raw:
+                self._observe(chunk)
+                yield chunk
+        finally:
+            self.close()
+
+    async def __aiter__(self):
+        try:
+            async for chunk in self._raw:
+                self._observe(chunk)
+                yield chunk
+        finally:
+            self.close()
+
+
+# the kinds of completion that are handled as streams
+_STREAM_TYPES = (CustomStreamWrapper, _RecordingStream, _ReplayedStream, _LimitedStream)
+
 _TStream = TypeVar("_TStream", Literal[True], Literal[False])
 
 
@@ -158,6 +337,11 @@ def __init__(
         self._model_name = model_name
         self.api_base = api_base
         self.api_key = api_key
+        self.retry_policy: RetryPolicy | None = RetryPolicy()
+
+    def set_retry_policy(self, policy: RetryPolicy | None) -> None:
+        """Sets how failed requests are retried and slow ones hedged (`None` sends every request once)."""
+        self.retry_policy = policy
 
     @overload
     def _invoke(
@@ -190,37 +374,25 @@ def _invoke(
         Internal helper that:
           1. Converts MessageHistory
           2. Merges default kwargs
-          3. Calls litellm.completion
+          3. Replays the response from the cache (if any), or calls litellm.completion
         """
         start_time = time.time()
-        litellm_messages = [self._to_litellm_message(m) for m in messages]
-        merged = {}
-
-        if response_format is not None:
-            merged["response_format"] = response_format
-
-        if tools is not None:
-            litellm_tools = [_to_litellm_tool(t) for t in tools]
-            merged["tools"] = litellm_tools
-
-        if self.api_base is not None:
-            merged["api_base"] = self.api_base
-
-        if self.api_key is not None:
-            merged["api_key"] = self.api_key
+        request = self._prepare_request(
+            messages, response_format=response_format, tools=tools
+        )
+        key = self._request_key(request)
+        if key is not None and (cached := self._replay(key, start_time)) is not None:
+            return cached
 
         warnings.filterwarnings(
             "ignore", category=UserWarning, module="pydantic.*"
         )  # Supress pydantic warnings. See issue #204 for more deatils.
 
-        completion = litellm.completion(
-            model=self._model_name,
-            messages=litellm_messages,
-            stream=self.stream,
-            **merged,
-        )
+        completion = self._complete(request)
+        if key is not None:
+            completion = self._record(key, completion)
 
-        if isinstance(completion, CustomStreamWrapper):
+        if isinstance(completion, _STREAM_TYPES):
             return completion, start_time
         else:
             completion_time = time.time() - start_time
@@ -257,60 +429,259 @@ async def _ainvoke(
         Internal helper that:
           1. Converts MessageHistory
           2. Merges default kwargs
-          3. Calls litellm.completion
+          3. Replays the response from the cache (if any), or calls litellm.acompletion
         """
         start_time = time.time()
-        litellm_messages = [self._to_litellm_message(m) for m in messages]
-        merged = {}
-        if response_format is not None:
-            merged["response_format"] = response_format
-        if tools is not None:
-            litellm_tools = [_to_litellm_tool(t) for t in tools]
-            merged["tools"] = litellm_tools
+        request = self._prepare_request(
+            messages, response_format=response_format, tools=tools
+        )
+        key = self._request_key(request)
+        if key is not None and (cached := self._replay(key, start_time)) is not None:
+            return cached
+
         warnings.filterwarnings(
             "ignore", category=UserWarning, module="pydantic.*"
         )  # Supress pydantic warnings. See issue #204 for more deatils.
-        completion = await litellm.acompletion(
-            model=self._model_name,
-            messages=litellm_messages,
-            stream=self.stream,
-            **merged,
-        )
-        if isinstance(completion, CustomStreamWrapper):
+        completion = await self._acomplete(request)
+        if key is not None:
+            completion = self._record(key, completion)
+
+        if isinstance(completion, _STREAM_TYPES):
             return completion, start_time
         else:
             completion_time = time.time() - start_time
             return completion, completion_time
 
+    def _prepare_request(
+        self,
+        messages: MessageHistory,
+        *,
+        response_format: Optional[Any] = None,
+        tools: Optional[list[Tool]] = None,
+    ) -> Dict[str, Any]:
+        """Renders the keyword arguments of the litellm completion call."""
+        if not isinstance(messages, MessageHistory):
+            messages = MessageHistory(messages)
+
+        request: Dict[str, Any] = {
+            "model": self._model_name,
+            # only the messages that were never sent before are converted, the others reuse their memoized payload
+            "messages": messages.render(
+                self._to_litellm_message, key=type(self)._to_litellm_message
+            ),
+            "stream": self.stream,
+        }
+
+        if response_format is not None:
+            request["response_format"] = response_format
+
+        if tools is not None:
+            request["tools"] = [_to_litellm_tool(t) for t in tools]
+
+        if self.api_base is not None:
+            request["api_base"] = self.api_base
+
+        if self.api_key is not None:
+            request["api_key"] = self.api_key
+
+        return request
+
+    # ================ START Retries ===============
+
+    def _complete(self, request: Dict[str, Any]):
+        """Sends the request, retrying transient failures and hedging slow requests as per the retry policy."""
+        retries = 0
+        while True:
+            try:
+                completion, hedged = self._send_hedged(request)
+                break
+            except Exception as e:
+                if not self._should_retry(e, retries):
+                    raise
+                time.sleep(self.retry_policy.delay(retries, e))
+                retries += 1
+
+        _record_attempts(completion, retries, hedged)
+        return completion
+
+    async def _acomplete(self, request: Dict[str, Any]):
+        """The async counterpart of `_complete`."""
+        retries = 0
+        while True:
+            try:
+                completion, hedged = await self._asend_hedged(request)
+                break
+            except Exception as e:
+                if not self._should_retry(e, retries):
+                    raise
+                await asyncio.sleep(self.retry_policy.delay(retries, e))
+                retries += 1
+
+        _record_attempts(completion, retries, hedged)
+        return completion
+
+    def _should_retry(self, error: Exception, retries: int) -> bool:
+        policy = self.retry_policy
+        return (
+            policy is not None
+            and retries < policy.max_retries
+            and policy.is_retryable(error)
+        )
+
+    def _send_hedged(self, request: Dict[str, Any]) -> Tuple[Any, bool]:
+        """Sends the request (and a hedged duplicate if it is slow), returning the first reply and whether it was hedged."""
+        policy = self.retry_policy
+        hedge_after = policy.hedge_delay() if policy is not None else None
+        start_time = time.time()
+        if hedge_after is None:
+            completion, hedged = self._send(request), False
+        else:
+            completion, hedged = _first_reply(lambda: self._send(request), hedge_after)
+        if policy is not None:
+            policy.observe_latency(time.time() - start_time)
+        return completion, hedged
+
+    async def _asend_hedged(self, request: Dict[str, Any]) -> Tuple[Any, bool]:
+        """The async counterpart of `_send_hedged`."""
+        policy = self.retry_policy
+        hedge_after = policy.hedge_delay() if policy is not None else None
+        start_time = time.time()
+        if hedge_after is None:
+            completion, hedged = await self._asend(request), False
+        else:
+            completion, hedged = await _afirst_reply(
+                lambda: self._asend(request), hedge_after
+            )
+        if policy is not None:
+            policy.observe_latency(time.time() - start_time)
+        return completion, hedged
+
+    # ================ END Retries ===============
+
+    # ================ START Rate Limiting ===============
+
+    def _send(self, request: Dict[str, Any]):
+        """Calls litellm.completion once the rate limiter of the model (if any) admits the request."""
+        limiter = get_rate_limiter(self.model_gateway(), self._model_name)
+        if limiter is None:
+            return litellm.completion(**request)
+
+        tokens = self._estimate_request_tokens(limiter, request)
+        limiter.admit(tokens)
+        try:
+            completion = litellm.completion(**request)
+        except BaseException:
+            limiter.release()
+            raise
+        return self._settle(limiter, tokens, completion)
+
+    async def _asend(self, request: Dict[str, Any]):
+        """Calls litellm.acompletion once the rate limiter of the model (if any) admits the request."""
+        limiter = get_rate_limiter(self.model_gateway(), self._model_name)
+        if limiter is None:
+            return await litellm.acompletion(**request)
+
+        tokens = self._estimate_request_tokens(limiter, request)
+        await limiter.aadmit(tokens)
+        try:
+            completion = await litellm.acompletion(**request)
+        except BaseException:
+            limiter.release()
+            raise
+        return self._settle(limiter, tokens, completion)
+
+    @staticmethod
+    def _estimate_request_tokens(limiter: RateLimiter, request: Dict[str, Any]) -> int:
+        if limiter.tokens_per_minute is None:
+            return 0
+        return estimate_tokens(request["messages"], request.get("tools"))
+
+    @staticmethod
+    def _settle(limiter: RateLimiter, estimated: int, completion: Any) -> Any:
+        """
+        Releases the slot of a complete response and corrects the token budget with its real usage. A stream is still
+        running when it is returned, so it is wrapped to hold onto its slot until it has been read.
+        """
+        if isinstance(completion, CustomStreamWrapper):
+            return _LimitedStream(completion, limiter, estimated)
+
+        limiter.release()
+        if limiter.tokens_per_minute is not None and isinstance(
+            completion, ModelResponse
+        ):
+            actual = _return_none_on_error(lambda: completion.usage.total_tokens)
+            if actual is not None:
+                limiter.record_usage(estimated, actual)
+        return completion
+
+    # ================ END Rate Limiting ===============
+
+    # ================ START Response Cache ===============
+
+    def _request_key(self, request: Dict[str, Any]) -> str | None:
+        """The response cache key of the request, or `None` if the model has no cache."""
+        if self._cache is None:
+            return None
+        # the key used to authenticate doesn't change the response
+        return ResponseCache.key(
+            **{name: value for name, value in request.items() if name != "api_key"}
+        )
+
+    def _replay(
+        self, key: str, start_time: float
+    ) -> Tuple[_ReplayedStream | ModelResponse, float] | None:
+        """Replays the cached response of the key in the same shape `_invoke` returns a fresh one."""
+        cached = self._cache.get(key)
+        if cached is None:
+            return None
+        # streamed responses are cached as their list of chunks
+        if isinstance(cached, list):
+            return _ReplayedStream(cached), start_time
+        # the replay itself was neither retried nor hedged
+        cached._hidden_params.pop(_RETRIES_PARAM, None)
+        cached._hidden_params.pop(_HEDGES_PARAM, None)
+        return cached, time.time() - start_time
+
+    def _record(self, key: str, completion: Any) -> Any:
+        """Caches the completion, streams are cached once they have been consumed up to their final chunk."""
+        cache = self._cache
+        if isinstance(completion, (CustomStreamWrapper, _LimitedStream)):
+            return _RecordingStream(
+                completion, on_complete=lambda chunks: cache.set(key, chunks)
+            )
+        if isinstance(completion, ModelResponse):
+            cache.set(key, completion)
+        return completion
+
+    # ================ END Response Cache ===============
+
     # ================ START Streaming Handlers ===============
     async def _astream_handler_base(
         self,
         raw: CustomStreamWrapper,
         start_time: float,
-        output_schema: Type[BaseModel] | None = None,
-    ):
+        output_schema: Type[_TBaseModel] | None = None,
+    ) -> AsyncGenerator[Response | str, None]:
         """
-        Add handler to the streamed response so that we preoperly construct the response object at the end of the stream.
+        The async counterpart of `_stream_handler_base`. It iterates the stream without blocking the event loop and
+        provides strings culminating in the last item being a Response object.
         """
         tools: List[ToolCall] = []
-        accumulated_content = ""
-        structured_response: BaseModel | None = None
+        # the content is joined once at the end, appending to a string for every chunk is quadratic
+        content_parts: List[str] = []
+
         # fall back on empty message info if we don't get one from the stream.
         message_info = MessageInfo()
         active_tool_calls: Dict[int, StreamedToolCall] = {}
         stream_finished = False
 
-        async for chunk in raw.completion_stream:
+        async for chunk in raw:
             if stream_finished:
-                # the last chunk will contain the full message info
+                # the last chunk will contain the full message info. Note this only true for openai. Anthropic is known to not.
                 message_info = self.extract_message_info(
                     chunk, time.time() - start_time
                 )
 
-                if output_schema is not None:
-                    structured_response = output_schema(
-                        **json.loads(accumulated_content)
-                    )
                 break
 
             choice = chunk.choices[0]
@@ -321,32 +692,21 @@ async def _astream_handler_base(
                 continue
 
             if choice.delta.tool_calls:
-                # TODO: determine if it would be useful to stream tools
-                self._handle_tool_call_delta(
-                    choice.delta.tool_calls[0], active_tool_calls
-                )
+                for call in choice.delta.tool_calls:
+                    self._handle_tool_call_delta(call, active_tool_calls)
 
             elif choice.delta.content:
                 content = self._handle_content_delta(choice.delta.content)
-                accumulated_content += content
+                content_parts.append(content)
                 yield content
 
-        if structured_response is not None:
-            r = Response(
-                message=AssistantMessage(content=structured_response),
-                message_info=message_info,
-            )
-        elif len(tools) > 0:
-            r = Response(
-                message=AssistantMessage(content=tools), message_info=message_info
-            )
-        else:
-            r = Response(
-                message=AssistantMessage(content=accumulated_content),
-                message_info=message_info,
-            )
-
-        yield r
+        message_info.retries, message_info.hedged = _attempts(raw)
+        yield self._prepare_response(
+            accumulated_content="".join(content_parts),
+            tools=tools,
+            output_schema=output_schema,
+            message_info=message_info,
+        )
 
     def _stream_handler_base(
         self,
@@ -360,7 +720,8 @@ def _stream_handler_base(
 
         """
         tools: List[ToolCall] = []
-        accumulated_content = ""
+        # the content is joined once at the end, appending to a string for every chunk is quadratic
+        content_parts: List[str] = []
 
         # fall back on empty message info if we don't get one from the stream.
         message_info = MessageInfo()
@@ -385,17 +746,17 @@ def _stream_handler_base(
                 continue
 
             if choice.delta.tool_calls:
-                self._handle_tool_call_delta(
-                    choice.delta.tool_calls[0], active_tool_calls
-                )
+                for call in choice.delta.tool_calls:
+                    self._handle_tool_call_delta(call, active_tool_calls)
 
             elif choice.delta.content:
                 content = self._handle_content_delta(choice.delta.content)
-                accumulated_content += content
+                content_parts.append(content)
                 yield content
 
+        message_info.retries, message_info.hedged = _attempts(raw)
         r = self._prepare_response(
-            accumulated_content=accumulated_content,
+            accumulated_content="".join(content_parts),
             tools=tools,
             output_schema=output_schema,
             message_info=message_info,
@@ -484,10 +845,10 @@ def _start_new_tool_call(
             if prev_data.args:
                 prev_data.tool.arguments = json.loads(prev_data.args)
 
-        # Start new tool call
+        # Start new tool call, some providers already send the first fragment of the arguments with it
         active_tool_calls[call_index] = StreamedToolCall(
             tool=ToolCall(identifier=call.id, name=call.function.name, arguments={}),
-            args="",
+            args=call.function.arguments or "",
         )
 
     def _continue_tool_call_arguments(
@@ -495,7 +856,7 @@ def _continue_tool_call_arguments(
     ):
         """Continue accumulating arguments for an existing tool call."""
         if call_index in active_tool_calls and call.function.arguments:
-            active_tool_calls[call_index].args += call.function.arguments
+            active_tool_calls[call_index].append(call.function.arguments)
 
     def _handle_content_delta(self, content) -> str:
         """Process content delta and return validated content string."""
@@ -549,7 +910,7 @@ def _chat_with_tools_handler_base(
 
     def _chat(self, messages: MessageHistory):
         response, time = self._invoke(messages=messages)
-        if isinstance(response, CustomStreamWrapper):
+        if isinstance(response, _STREAM_TYPES):
             return self._stream_handler_base(response, time)
 
         elif isinstance(response, ModelResponse):
@@ -562,7 +923,7 @@ def _chat(self, messages: MessageHistory):
     def _structured(self, messages: MessageHistory, schema: Type[BaseModel]):
         try:
             model_resp, time = self._invoke(messages, response_format=schema)
-            if isinstance(model_resp, CustomStreamWrapper):
+            if isinstance(model_resp, _STREAM_TYPES):
                 return self._stream_handler_base(model_resp, time, schema)
             elif isinstance(model_resp, ModelResponse):
                 return self._structured_handle_base(
@@ -593,7 +954,7 @@ def _chat_with_tools(self, messages: MessageHistory, tools: List[Tool]):
             A Response containing either plain assistant text or ToolCall(s).
         """
         resp, time = self._invoke(messages, tools=tools)
-        if isinstance(resp, CustomStreamWrapper):
+        if isinstance(resp, _STREAM_TYPES):
             return self._stream_handler_base(resp, time)
         elif isinstance(resp, ModelResponse):
             return self._chat_with_tools_handler_base(
@@ -607,7 +968,7 @@ def _chat_with_tools(self, messages: MessageHistory, tools: List[Tool]):
     # ================ START Async LLM calls ===============
     async def _achat(self, messages: MessageHistory):
         response, time = await self._ainvoke(messages=messages)
-        if isinstance(response, CustomStreamWrapper):
+        if isinstance(response, _STREAM_TYPES):
             return self._astream_handler_base(response, time)
         elif isinstance(response, ModelResponse):
             return self._chat_handle_base(
@@ -619,7 +980,7 @@ async def _achat(self, messages: MessageHistory):
     async def _astructured(self, messages: MessageHistory, schema: Type[BaseModel]):
         try:
             model_resp, time = await self._ainvoke(messages, response_format=schema)
-            if isinstance(model_resp, CustomStreamWrapper):
+            if isinstance(model_resp, _STREAM_TYPES):
                 return self._astream_handler_base(model_resp, time, schema)
             elif isinstance(model_resp, ModelResponse):
                 return self._structured_handle_base(
@@ -639,7 +1000,7 @@ async def _astructured(self, messages: MessageHistory, schema: Type[BaseModel]):
 
     async def _achat_with_tools(self, messages: MessageHistory, tools: List[Tool]):
         resp, time = await self._ainvoke(messages, tools=tools)
-        if isinstance(resp, CustomStreamWrapper):
+        if isinstance(resp, _STREAM_TYPES):
             return self._astream_handler_base(resp, time)
         elif isinstance(resp, ModelResponse):
             return self._chat_with_tools_handler_base(
@@ -692,18 +1053,19 @@ def _to_litellm_message(self, msg: Message) -> Dict[str, Any]:
             base["name"] = msg.content.name
             base["tool_call_id"] = msg.content.identifier
             base["content"] = msg.content.result
-        # only time this is true is tool calls, need to return litellm.utils.Message
+        # only time this is true is tool calls, they are sent in the plain (OpenAI) format litellm accepts
         elif isinstance(msg.content, list):
             assert all(isinstance(t_c, ToolCall) for t_c in msg.content)
             base["content"] = ""
             base["tool_calls"] = [
-                litellm.utils.ChatCompletionMessageToolCall(
-                    function=litellm.utils.Function(
-                        arguments=tool_call.arguments, name=tool_call.name
-                    ),
-                    id=tool_call.identifier,
-                    type="function",
-                )
+                {
+                    "id": tool_call.identifier,
+                    "type": "function",
+                    "function": {
+                        "name": tool_call.name,
+                        "arguments": json.dumps(tool_call.arguments),
+                    },
+                }
                 for tool_call in msg.content
             ]
         else:
@@ -735,6 +1097,7 @@ def extract_message_info(
         total_cost = _return_none_on_error(
             lambda: model_response._hidden_params["response_cost"]
         )
+        retries, hedged = _attempts(model_response)
 
         return MessageInfo(
             input_tokens=input_tokens,
@@ -743,10 +1106,96 @@ def extract_message_info(
             model_name=model_name,
             total_cost=total_cost,
             system_fingerprint=system_fingerprint,
+            retries=retries,
+            hedged=hedged,
         )
 
 
-_T = TypeVar("_T")
+def _attempts(completion: Any) -> Tuple[int | None, bool | None]:
+    """The number of retries and whether the reply came from a hedged request, as recorded in the completion."""
+    hidden_params = getattr(completion, "_hidden_params", None)
+    if not isinstance(hidden_params, dict):
+        return None, None
+    return hidden_params.get(_RETRIES_PARAM), hidden_params.get(_HEDGES_PARAM)
+
+
+def _record_attempts(completion: Any, retries: int, hedged: bool) -> None:
+    """Records the number of retries (and whether the reply came from a hedged request) in the completion."""
+    hidden_params = getattr(completion, "_hidden_params", None)
+    if isinstance(hidden_params, dict):
+        hidden_params[_RETRIES_PARAM] = retries
+        hidden_params[_HEDGES_PARAM] = hedged
+
+
+@functools.lru_cache(maxsize=1)
+def _hedge_executor() -> ThreadPoolExecutor:
+    """The threads shared by every hedged synchronous request (bounded like the default executor of asyncio)."""
+    return ThreadPoolExecutor(
+        max_workers=min(32, (os.cpu_count() or 1) + 4),
+        thread_name_prefix="railtracks-hedge",
+    )
+
+
+def _discard_loser(future: Future | asyncio.Future) -> None:
+    """Closes the stream returned by the losing run of a hedged request, giving back its rate limiter slot."""
+    if future.cancelled() or future.exception() is not None:
+        return
+    result = future.result()
+    if isinstance(result, _LimitedStream):
+        result.close()
+
+
+def _first_reply(send: Callable[[], _T], hedge_after: float) -> Tuple[_T, bool]:
+    """
+    Runs `send`, running it a second time if the first run takes longer than `hedge_after` seconds. Returns the first
+    successful result and whether a hedged run was started, or raises the error of the first run if both fail.
+
+    Threads can't be cancelled, so the losing run keeps going in the background (holding its rate limiter slot, if
+    any) until its reply comes in, which is then discarded.
+    """
+    executor = _hedge_executor()
+    primary = executor.submit(contextvars.copy_context().run, send)
+    done, _ = wait([primary], timeout=hedge_after)
+    if done:
+        return primary.result(), False
+
+    hedge = executor.submit(contextvars.copy_context().run, send)
+    pending = {primary, hedge}
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                for other in {primary, hedge} - {future}:
+                    other.add_done_callback(_discard_loser)
+                return future.result(), True
+    return primary.result(), True
+
+
+async def _afirst_reply(
+    send: Callable[[], Coroutine[Any, Any, _T]], hedge_after: float
+) -> Tuple[_T, bool]:
+    """The async counterpart of `_first_reply`, the slower run is cancelled."""
+    tasks = [asyncio.ensure_future(send())]
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=hedge_after)
+        if done:
+            return tasks[0].result(), False
+
+        tasks.append(asyncio.ensure_future(send()))
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    for other in tasks:
+                        if other is not task:
+                            other.add_done_callback(_discard_loser)
+                    return task.result(), True
+        return tasks[0].result(), True
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
 
 
 def _return_none_on_error(func: Callable[[], _T]) -> _T | None:
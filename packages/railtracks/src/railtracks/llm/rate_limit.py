@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import itertools
+import json
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Deque, Dict, Hashable, Iterator, List, Optional, Tuple
+
+import tiktoken
+
+from .providers import ModelProvider
+
+# how often async waiters re-check a limiter that is blocked on its in-flight requests (there is no refill to wait for)
+_ASYNC_POLL_INTERVAL = 0.05
+# the approximate number of tokens added to every message by the chat format
+_TOKENS_PER_MESSAGE = 4
+
+
+class _TokenBucket:
+    """A bucket holding up to `capacity` units, refilled continuously at `capacity` per minute."""
+
+    __slots__ = ("capacity", "rate", "level", "updated")
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until the bucket holds `amount` units (0 if it already does)."""
+        missing = min(amount, self.capacity) - self.level
+        return max(0.0, missing / self.rate)
+
+    def take(self, amount: float) -> None:
+        # the level may go negative (e.g. after the real usage of a request exceeded its estimate)
+        self.level -= min(amount, self.capacity)
+
+
+class RateLimiter:
+    """
+    A client side limiter of the requests sent to a model (or to every model of a provider).
+
+    Requests are admitted once every configured limit allows them:
+        - `requests_per_minute` and `tokens_per_minute` are enforced with token buckets, so short bursts up to the
+          per-minute budget are allowed and the budget refills continuously.
+        - `max_concurrency` caps the number of requests in flight. A streamed request is in flight until its stream
+          has been read (or closed), and its token usage is corrected from the final chunk of the stream.
+
+    Waiting requests are queued per session (see `rt.Session`) and the sessions take turns, so a session fanning out
+    hundreds of calls doesn't starve the others. Within a session, requests are admitted in order.
+
+    Args:
+        requests_per_minute: The maximum number of requests started per minute.
+        tokens_per_minute: The maximum number of tokens (estimated before the request, corrected after it) per minute.
+        max_concurrency: The maximum number of requests in flight at the same time.
+    """
+
+    def __init__(
+        self,
+        *,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ):
+        for name, value in (
+            ("requests_per_minute", requests_per_minute),
+            ("tokens_per_minute", tokens_per_minute),
+            ("max_concurrency", max_concurrency),
+        ):
+            if value is not None and value < 1:
+                raise ValueError(f"{name} must be at least 1")
+
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_concurrency = max_concurrency
+
+        self._requests = (
+            _TokenBucket(requests_per_minute) if requests_per_minute else None
+        )
+        self._tokens = _TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self._in_flight = 0
+        self._condition = threading.Condition()
+        self._tickets = itertools.count()
+        # the waiting tickets of every session, the session at the front is served first
+        self._queues: OrderedDict[Hashable, Deque[int]] = OrderedDict()
+
+    @property
+    def in_flight(self) -> int:
+        """The number of admitted requests that have not been released yet."""
+        return self._in_flight
+
+    # ---------- Admission ----------
+
+    def _enqueue(self) -> Tuple[Hashable, int]:
+        # imported here as the context module (indirectly) imports the llm module
+        from railtracks.context.central import session_id
+
+        session = session_id()
+        ticket = next(self._tickets)
+        self._queues.setdefault(session, deque()).append(ticket)
+        return session, ticket
+
+    def _dequeue(self, session: Hashable, ticket: int) -> None:
+        queue = self._queues.get(session)
+        if queue is None or ticket not in queue:
+            return
+        queue.remove(ticket)
+        if not queue:
+            del self._queues[session]
+
+    def _try_admit(
+        self, session: Hashable, ticket: int, tokens: int
+    ) -> Optional[float]:
+        """
+        Admits the ticket if it is next in line and every limit allows it, returning `None`. Otherwise, returns the
+        number of seconds worth waiting before trying again (0 if only a release can unblock it).
+        """
+        front_session, front_queue = next(iter(self._queues.items()))
+        if front_session != session or front_queue[0] != ticket:
+            return 0.0
+        if self.max_concurrency is not None and self._in_flight >= self.max_concurrency:
+            return 0.0
+
+        now = time.monotonic()
+        wait = 0.0
+        if self._requests is not None:
+            self._requests.refill(now)
+            wait = max(wait, self._requests.wait_time(1))
+        if self._tokens is not None:
+            self._tokens.refill(now)
+            wait = max(wait, self._tokens.wait_time(tokens))
+        if wait > 0:
+            return wait
+
+        if self._requests is not None:
+            self._requests.take(1)
+        if self._tokens is not None:
+            self._tokens.take(tokens)
+        self._in_flight += 1
+
+        front_queue.popleft()
+        # the session goes to the back of the line
+        del self._queues[session]
+        if front_queue:
+            self._queues[session] = front_queue
+        self._condition.notify_all()
+        return None
+
+    def release(self) -> None:
+        """Releases a request admitted by `admit` or `aadmit`."""
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def record_usage(self, estimated: int, actual: int) -> None:
+        """Corrects the token budget once the actual token usage of an admitted request is known."""
+        if self._tokens is None or actual == estimated:
+            return
+        with self._condition:
+            self._tokens.refill(time.monotonic())
+            self._tokens.level -= actual - estimated
+            self._condition.notify_all()
+
+    def admit(self, tokens: int = 0) -> None:
+        """
+        Blocks until a request of the given (estimated) number of tokens is admitted. The request holds its slot until
+        `release` is called, use `acquire` to release it on exit of a block.
+        """
+        with self._condition:
+            session, ticket = self._enqueue()
+            try:
+                while (wait := self._try_admit(session, ticket, tokens)) is not None:
+                    self._condition.wait(wait or None)
+            except BaseException:
+                self._dequeue(session, ticket)
+                self._condition.notify_all()
+                raise
+
+    async def aadmit(self, tokens: int = 0) -> None:
+        """The async counterpart of `admit`, waiting without blocking the event loop."""
+        with self._condition:
+            session, ticket = self._enqueue()
+        try:
+            while True:
+                with self._condition:
+                    wait = self._try_admit(session, ticket, tokens)
+                if wait is None:
+                    break
+                await asyncio.sleep(wait or _ASYNC_POLL_INTERVAL)
+        except BaseException:
+            with self._condition:
+                self._dequeue(session, ticket)
+                self._condition.notify_all()
+            raise
+
+    @contextmanager
+    def acquire(self, tokens: int = 0) -> Iterator[None]:
+        """Blocks until a request of the given (estimated) number of tokens is admitted, releasing it on exit."""
+        self.admit(tokens)
+        try:
+            yield
+        finally:
+            self.release()
+
+    @asynccontextmanager
+    async def aacquire(self, tokens: int = 0):
+        """The async counterpart of `acquire`, waiting without blocking the event loop."""
+        await self.aadmit(tokens)
+        try:
+            yield
+        finally:
+            self.release()
+
+
+# ---------- Registry ----------
+
+_limiters: Dict[Tuple[str, Optional[str]], RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def set_rate_limit(
+    provider: ModelProvider | str,
+    model_name: Optional[str] = None,
+    *,
+    requests_per_minute: Optional[int] = None,
+    tokens_per_minute: Optional[int] = None,
+    max_concurrency: Optional[int] = None,
+) -> RateLimiter:
+    """
+    Limits the requests sent to a provider (the gateway of the model, see `ModelBase.model_gateway`), or to a single
+    model of it when `model_name` is given. A limit for a model replaces the limit of its provider.
+
+    Every model instance of that provider/model shares the returned limiter, no matter which node or session uses it.
+
+    Args:
+        provider: The provider the limit applies to.
+        model_name: Optional name of the model the limit applies to.
+        requests_per_minute: The maximum number of requests started per minute.
+        tokens_per_minute: The maximum number of tokens per minute.
+        max_concurrency: The maximum number of requests in flight at the same time.
+
+    Returns:
+        RateLimiter: The limiter now in place.
+    """
+    limiter = RateLimiter(
+        requests_per_minute=requests_per_minute,
+        tokens_per_minute=tokens_per_minute,
+        max_concurrency=max_concurrency,
+    )
+    with _limiters_lock:
+        _limiters[(_provider_key(provider), model_name)] = limiter
+    return limiter
+
+
+def remove_rate_limit(
+    provider: ModelProvider | str, model_name: Optional[str] = None
+) -> None:
+    """Removes the limit of a provider (or of one of its models)."""
+    with _limiters_lock:
+        _limiters.pop((_provider_key(provider), model_name), None)
+
+
+def clear_rate_limits() -> None:
+    """Removes every rate limit."""
+    with _limiters_lock:
+        _limiters.clear()
+
+
+def get_rate_limiter(
+    provider: ModelProvider | str, model_name: Optional[str] = None
+) -> Optional[RateLimiter]:
+    """The limiter that applies to the model: its own one, otherwise the one of its provider (if any)."""
+    if not _limiters:
+        return None
+    provider = _provider_key(provider)
+    with _limiters_lock:
+        return _limiters.get((provider, model_name)) or _limiters.get((provider, None))
+
+
+def _provider_key(provider: ModelProvider | str) -> str:
+    return provider.value if isinstance(provider, ModelProvider) else str(provider)
+
+
+# ---------- Token estimates ----------
+
+
+@functools.lru_cache(maxsize=1)
+def _encoding() -> Optional[tiktoken.Encoding]:
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # the encoding files could not be loaded (e.g. no network access), estimates fall back on character counts
+        return None
+
+
+def _count_tokens(text: str) -> int:
+    encoding = _encoding()
+    if encoding is None:
+        return len(text) // 4 + 1
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def estimate_tokens(
+    messages: List[Dict[str, Any]], tools: Optional[List[Dict[str, Any]]] = None
+) -> int:
+    """
+    Estimates the number of prompt tokens of a litellm request with tiktoken.
+
+    The `cl100k_base` encoding is used for every model, which is close enough for budgeting purposes.
+    """
+    total = 0
+    for message in messages:
+        total += _TOKENS_PER_MESSAGE
+        content = message.get("content")
+        if isinstance(content, str):
+            total += _count_tokens(content)
+        elif isinstance(content, list):
+            total += sum(
+                _count_tokens(part.get("text", ""))
+                for part in content
+                if isinstance(part, dict)
+            )
+    if tools:
+        total += _count_tokens(json.dumps(tools))
+    return total
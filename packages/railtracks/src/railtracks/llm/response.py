@@ -15,6 +15,8 @@ def __init__(
         model_name: str | None = None,
         total_cost: float | None = None,
         system_fingerprint: str | None = None,
+        retries: int | None = None,
+        hedged: bool | None = None,
     ):
         """
         Creates a new instance of a message info object.
@@ -26,6 +28,8 @@ def __init__(
             model_name: The name of the model used to generate the response.
             total_cost: The total cost of the request, if applicable.
             system_fingerprint: A unique identifier for the system that processed the request.
+            retries: The number of times the request was retried after a transient failure.
+            hedged: Whether a hedged (duplicate) request was sent because the request was slow.
         """
         self.input_tokens = input_tokens
         self.output_tokens = output_tokens
@@ -33,6 +37,8 @@ def __init__(
         self.model_name = model_name
         self.total_cost = total_cost
         self.system_fingerprint = system_fingerprint
+        self.retries = retries
+        self.hedged = hedged
 
     @property
     def total_tokens(self):
@@ -53,7 +59,9 @@ def __repr__(self):
             f"latency={self.latency}, "
             f"model_name={self.model_name}, "
             f"total_cost={self.total_cost}, "
-            f"system_fingerprint={self.system_fingerprint})"
+            f"system_fingerprint={self.system_fingerprint}, "
+            f"retries={self.retries}, "
+            f"hedged={self.hedged})"
         )
 
 
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import pickle
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+
+class ResponseCache(ABC):
+    """
+    A cache of raw LLM responses keyed by a canonical hash of the request sent to the provider.
+
+    A model with a cache (see `ModelBase.set_cache`) replays the cached response of any request it has already seen
+    instead of calling the provider again. Both complete responses and the chunks of streamed responses are cached, so
+    replays go through the same handling (and produce the same `MessageInfo`) as the original call.
+
+    Entries older than `ttl` seconds are treated as misses, and the least recently used entries are evicted once the
+    cache holds more than `max_entries` of them.
+
+    Args:
+        max_entries: The maximum number of cached responses.
+        ttl: Optional number of seconds a response stays valid.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = None):
+        if max_entries < 0:
+            raise ValueError("max_entries must not be negative")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(**request: Any) -> str:
+        """
+        The cache key of a request, a hash of its canonical JSON encoding (so the order of the keys of any mapping
+        does not matter).
+        """
+        encoded = json.dumps(
+            request, sort_keys=True, separators=(",", ":"), default=_jsonable
+        )
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        """Looks up the cached response of the key, returning `None` (and counting a miss) if there is none."""
+        with self._lock:
+            entry = self._read(key)
+            if entry is not None and self._expired(entry[1]):
+                self._remove(key)
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        # every hit gets its own copy, so callers can't alter the cached response
+        return pickle.loads(entry[0])
+
+    def set(self, key: str, response: Any) -> None:
+        """Caches the response of the key."""
+        if self.max_entries == 0:
+            return
+        payload = pickle.dumps(response)
+        with self._lock:
+            self._write(key, payload, time.time())
+
+    def stats(self) -> Dict[str, int]:
+        """The hit and miss counters along with the number of cached responses."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self)}
+
+    def reset_stats(self) -> None:
+        """Resets the hit and miss counters."""
+        self.hits = 0
+        self.misses = 0
+
+    def _expired(self, created: float) -> bool:
+        return self.ttl is not None and time.time() - created > self.ttl
+
+    @abstractmethod
+    def _read(self, key: str) -> Optional[Tuple[bytes, float]]:
+        """The cached (payload, creation time) of the key, marking it as recently used."""
+        pass
+
+    @abstractmethod
+    def _write(self, key: str, payload: bytes, created: float) -> None:
+        """Stores the payload of the key and evicts the least recently used entries over `max_entries`."""
+        pass
+
+    @abstractmethod
+    def _remove(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes every cached response."""
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+
+class InMemoryResponseCache(ResponseCache):
+    """
+    A `ResponseCache` kept in memory as an LRU.
+
+    Args:
+        max_entries: The maximum number of cached responses.
+        ttl: Optional number of seconds a response stays valid.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = None):
+        super().__init__(max_entries=max_entries, ttl=ttl)
+        self._entries: OrderedDict[str, Tuple[bytes, float]] = OrderedDict()
+
+    def _read(self, key: str) -> Optional[Tuple[bytes, float]]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def _write(self, key: str, payload: bytes, created: float) -> None:
+        self._entries[key] = (payload, created)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _remove(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteResponseCache(ResponseCache):
+    """
+    A `ResponseCache` stored in a SQLite database, so cached responses survive restarts and can be shared between
+    processes (e.g. the workers of an eval suite).
+
+    Args:
+        path: Path of the SQLite database.
+        max_entries: The maximum number of cached responses.
+        ttl: Optional number of seconds a response stays valid.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_entries: int = 100_000,
+        ttl: Optional[float] = None,
+    ):
+        super().__init__(max_entries=max_entries, ttl=ttl)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, payload BLOB NOT NULL, created REAL NOT NULL, used REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS responses_used ON responses (used)"
+        )
+        self._db.commit()
+
+    def _read(self, key: str) -> Optional[Tuple[bytes, float]]:
+        row = self._db.execute(
+            "SELECT payload, created FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        self._db.execute(
+            "UPDATE responses SET used = ? WHERE key = ?", (time.time(), key)
+        )
+        self._db.commit()
+        return row[0], row[1]
+
+    def _write(self, key: str, payload: bytes, created: float) -> None:
+        self._db.execute(
+            "INSERT OR REPLACE INTO responses (key, payload, created, used) VALUES (?, ?, ?, ?)",
+            (key, payload, created, created),
+        )
+        self._db.execute(
+            "DELETE FROM responses WHERE key IN ("
+            "SELECT key FROM responses ORDER BY used DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+        self._db.commit()
+
+    def _remove(self, key: str) -> None:
+        self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+        self._db.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+
+    def close(self) -> None:
+        """Closes the connection to the database."""
+        with self._lock:
+            self._db.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+def _jsonable(value: Any) -> Any:
+    """Converts the values `json` can't encode (schemas, pydantic objects) into ones it can."""
+    if isinstance(value, type) and issubclass(value, BaseModel):
+        return value.model_json_schema()
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    return repr(value)
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import email.utils
+import random
+import threading
+import time
+from collections import deque
+from typing import Deque, Optional
+
+import litellm
+
+# status codes of errors which are worth retrying (timeouts, conflicts, rate limits and server errors)
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+_RETRYABLE_ERRORS = (
+    litellm.RateLimitError,
+    litellm.Timeout,
+    litellm.APIConnectionError,
+    litellm.InternalServerError,
+    litellm.ServiceUnavailableError,
+    TimeoutError,
+    ConnectionError,
+)
+
+
+class RetryPolicy:
+    """
+    Controls how a model retries failed requests and hedges slow ones.
+
+    Retries:
+        Requests failing with a transient error (rate limits, timeouts, connection errors and 5xx responses) are
+        retried up to `max_retries` times. The delay before retry `n` is drawn uniformly from
+        `[0, min(max_delay, initial_delay * multiplier ** n)]` ("full jitter"), unless the provider sent a
+        `Retry-After` header, which is honored (up to `max_retry_after` seconds).
+
+    Hedging:
+        When `hedge` is enabled, a duplicate of a request still unanswered after `hedge_after` seconds is sent and the
+        first reply wins. Without a fixed `hedge_after`, the delay is the `hedge_quantile` of the latencies observed by
+        this policy, once `hedge_min_samples` of them have been seen. Hedges cost extra requests (and tokens), so they
+        are off by default.
+
+    Args:
+        max_retries: The maximum number of retries of a request (0 disables retries).
+        initial_delay: The upper bound of the delay before the first retry, in seconds.
+        max_delay: The maximum upper bound of the delay before a retry, in seconds.
+        multiplier: The growth factor of the upper bound of the delay between retries.
+        respect_retry_after: Whether to wait for the duration of the `Retry-After` header of failed requests.
+        max_retry_after: The longest `Retry-After` honored, in seconds.
+        hedge: Whether to send hedged requests.
+        hedge_after: A fixed delay (in seconds) after which a hedged request is sent.
+        hedge_quantile: The latency quantile used as the hedging delay when `hedge_after` is not given.
+        hedge_min_samples: The number of latencies needed before the quantile is used (no hedging until then).
+        latency_window: The number of recent latencies the quantile is computed on.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_retries: int = 2,
+        initial_delay: float = 0.5,
+        max_delay: float = 30.0,
+        multiplier: float = 2.0,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 60.0,
+        hedge: bool = False,
+        hedge_after: Optional[float] = None,
+        hedge_quantile: float = 0.95,
+        hedge_min_samples: int = 20,
+        latency_window: int = 200,
+    ):
+        if max_retries < 0:
+            raise ValueError("max_retries must not be negative")
+        if not 0 < hedge_quantile < 1:
+            raise ValueError("hedge_quantile must be between 0 and 1")
+
+        self.max_retries = max_retries
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.hedge = hedge
+        self.hedge_after = hedge_after
+        self.hedge_quantile = hedge_quantile
+        self.hedge_min_samples = hedge_min_samples
+
+        self._latencies: Deque[float] = deque(maxlen=latency_window)
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # the lock can't be pickled (nor copied), every copy gets its own one.
+        state = self.__dict__.copy()
+        state.pop("_lock", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_retryable(error: BaseException) -> bool:
+        """Whether the error is transient, i.e. the same request may succeed if it is sent again."""
+        if isinstance(error, _RETRYABLE_ERRORS):
+            return True
+        status_code = getattr(error, "status_code", None)
+        return isinstance(status_code, int) and (
+            status_code in RETRYABLE_STATUS_CODES or status_code >= 500
+        )
+
+    def delay(self, retry: int, error: Optional[BaseException] = None) -> float:
+        """The number of seconds to wait before the given retry (counting from 0) of a request that failed with `error`."""
+        if self.respect_retry_after and error is not None:
+            retry_after = _retry_after(error)
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+
+        ceiling = min(self.max_delay, self.initial_delay * self.multiplier**retry)
+        return random.uniform(0, ceiling)
+
+    def observe_latency(self, latency: float) -> None:
+        """Records the latency of a successful request, used to compute the hedging delay."""
+        with self._lock:
+            self._latencies.append(latency)
+
+    def hedge_delay(self) -> Optional[float]:
+        """The number of seconds after which a hedged request is sent, or `None` if no hedge should be sent."""
+        if not self.hedge:
+            return None
+        if self.hedge_after is not None:
+            return self.hedge_after
+
+        with self._lock:
+            if len(self._latencies) < self.hedge_min_samples:
+                return None
+            latencies = sorted(self._latencies)
+        return latencies[
+            min(len(latencies) - 1, int(self.hedge_quantile * len(latencies)))
+        ]
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    """The number of seconds of the `Retry-After` (or `retry-after-ms`) header of the failed response, if any."""
+    headers = getattr(error, "litellm_response_headers", None)
+    if headers is None:
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    try:
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms is not None:
+            return max(0.0, float(retry_after_ms) / 1000)
+
+        retry_after = headers.get("retry-after")
+        if retry_after is None:
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            # the header may also be an HTTP date
+            retry_at = email.utils.parsedate_to_datetime(retry_after)
+            return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError, AttributeError):
+        return None
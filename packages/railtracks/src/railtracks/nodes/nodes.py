@@ -4,7 +4,7 @@
 import time
 import uuid
 from abc import ABC, abstractmethod
-from copy import deepcopy
+from copy import copy, deepcopy
 from typing import Any, Callable, Dict, Generic, Literal, TypeVar
 
 from typing_extensions import Self
@@ -39,6 +39,37 @@ def instantiate(self) -> _TNode:
         """
         return self.node
 
+    def __getstate__(self):
+        node_type = type(self.node)
+        func = getattr(getattr(node_type, "func", None), "__wrapped__", None)
+        # node types built from a function (see `function_node`) are created at runtime so they cannot be pickled by
+        # reference. Instead, we send the function they were built from and rebuild the node type on the other side.
+        if func is not None and getattr(func, "node_type", None) is node_type:
+            return {
+                "func": func,
+                "name": node_type.name(),
+                "node_dict": self.node.__dict__,
+            }
+
+        return {"node": self.node}
+
+    def __setstate__(self, state):
+        if "node" in state:
+            self.node = state["node"]
+            return
+
+        func = state["func"]
+        node_type = getattr(func, "node_type", None)
+        if node_type is None:
+            # imported here to avoid a circular import between nodes and the built nodes.
+            from railtracks.built_nodes.easy_usage_wrappers import function_node
+
+            node_type = function_node(func, name=state["name"]).node_type
+
+        node = node_type.__new__(node_type)
+        node.__dict__.update(state["node_dict"])
+        self.node = node
+
 
 class DebugDetails(dict[str, Any]):
     """
@@ -80,7 +111,11 @@ async def async_wrapper(self, *args, **kwargs):
                 ):  # check if the method is a coroutine
                     return await method(self, *args, **kwargs)
                 else:
-                    return await asyncio.to_thread(method, self, *args, **kwargs)
+                    # imported here to avoid a circular import between nodes and the context.
+                    from railtracks.context.central import run_sync
+
+                    # sync invokes run on the session's executor pools so they never block the event loop.
+                    return await run_sync(self.name(), method, self, *args, **kwargs)
 
             setattr(cls, method_name, async_wrapper)
 
@@ -168,6 +203,26 @@ def safe_copy(self) -> Self:
             setattr(result, k, deepcopy(v))
         return result
 
+    def snapshot(self) -> Self:
+        """
+        A cheap copy of the node used to record its state in the history of a run.
+
+        Unlike `safe_copy`, nothing is deep copied. The details of the node are copied one level deep, and attributes
+        holding a container (a list, dict or set, such as the message history) are shallow copied, so adding to or
+        removing from them on the original node does not alter the snapshot. The items of those containers (e.g. the
+        messages) and every other attribute (e.g. the LLM model) are shared with the original node.
+        """
+        cls = self.__class__
+        result = cls.__new__(cls)
+        result.__dict__.update(
+            {
+                k: copy(v) if isinstance(v, (list, dict, set)) else v
+                for k, v in self.__dict__.items()
+            }
+        )
+        result._details = DebugDetails({k: copy(v) for k, v in self._details.items()})
+        return result
+
     def __repr__(self):
         return f"{self.name()} <{hex(id(self))}>"
 
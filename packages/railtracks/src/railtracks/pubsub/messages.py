@@ -7,7 +7,7 @@
 
 # RT specific imports
 
-ExecutionConfigurations = Literal["async"]
+ExecutionConfigurations = Literal["async", "thread", "process"]
 
 _P = ParamSpec("_P")
 _TOutput = TypeVar("_TOutput")
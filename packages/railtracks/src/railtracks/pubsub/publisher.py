@@ -1,9 +1,20 @@
 from __future__ import annotations
 
+import asyncio
+from typing import Callable, Dict, TypeVar
+
 from railtracks.utils.logging import get_rt_logger
 from railtracks.utils.publisher import Publisher
 
-from .messages import RequestCompletionMessage, RequestCreationFailure, RequestFailure
+from .messages import (
+    FatalFailure,
+    RequestCompletionMessage,
+    RequestCreationFailure,
+    RequestFailure,
+    RequestFinishedBase,
+)
+
+_TOutput = TypeVar("_TOutput")
 
 logger = get_rt_logger("Publisher")
 
@@ -11,10 +22,17 @@
 class RTPublisher(Publisher[RequestCompletionMessage]):
     """
     A specialized Publisher class designed to handle RequestCompletionMessage objects.
+
+    On top of the regular broadcast, it keeps a map of request_id to future so that a finished request can be routed
+    directly to the single caller waiting on it (see `request_listener`). A `FatalFailure` is delivered to every
+    pending request.
     """
 
     def __init__(self):
         super().__init__()
+        self._request_listeners: Dict[
+            str, asyncio.Future[RequestFinishedBase | FatalFailure]
+        ] = {}
         self.subscribe(self.logging_sub)
 
     @classmethod
@@ -28,3 +46,56 @@ async def logging_sub(cls, message: RequestCompletionMessage):
             logger.debug(message.log_message(), exc_info=message.error)
         else:
             logger.debug(message.log_message())
+
+    async def _dispatch(self, message: RequestCompletionMessage):
+        # the broadcast must happen first so the state of the system (and any failure handling) is updated before the
+        #  waiting caller is woken up.
+        await super()._dispatch(message)
+
+        if isinstance(message, RequestFinishedBase):
+            fut = self._request_listeners.get(message.request_id)
+            if fut is not None and not fut.done():
+                fut.set_result(message)
+        elif isinstance(message, FatalFailure):
+            for fut in self._request_listeners.values():
+                if not fut.done():
+                    fut.set_result(message)
+
+    async def request_listener(
+        self,
+        request_id: str,
+        result_mapping: Callable[
+            [RequestFinishedBase | FatalFailure], _TOutput
+        ] = lambda x: x,
+    ) -> _TOutput:
+        """
+        Waits for the completion message of the given request and returns the mapped result.
+
+        Unlike `listener`, this does not register a subscriber, the completion message is looked up by its request_id
+        so the cost of routing a message does not grow with the number of open requests.
+
+        Args:
+            request_id: The identifier of the request to wait for.
+            result_mapping: A function that maps the message into a final result.
+
+        Raises:
+            ValueError: If the publisher is shutdown before the request completes.
+        """
+        if not self._running:
+            raise ValueError(
+                "Listener has been killed before receiving the correct message."
+            )
+
+        returnable_result: asyncio.Future[RequestFinishedBase | FatalFailure] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._request_listeners[request_id] = returnable_result
+        self._pending_listeners.add(returnable_result)
+
+        try:
+            message = await returnable_result
+        finally:
+            self._pending_listeners.discard(returnable_result)
+            self._request_listeners.pop(request_id, None)
+
+        return result_mapping(message)
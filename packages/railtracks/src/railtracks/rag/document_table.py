@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from typing import Dict, Iterator, Mapping, Optional, Union
+
+from .text_object import TextObject
+from .vector_store.base import SearchEntry, VectorRecord
+
+DOCUMENT_ID = "document_id"
+
+
+class DocumentTable(Mapping[str, TextObject]):
+    """
+    The documents ingested by a RAG, keyed by their id (the hash of their content).
+
+    Vector records only reference their document through the `document_id` key of their metadata, so the content of
+    a document is stored once rather than copied into every one of its chunks. The content can then be resolved from
+    a record (or search entry) when it is actually needed.
+    """
+
+    def __init__(self):
+        self._documents: Dict[str, TextObject] = {}
+
+    def add(self, text_object: TextObject) -> str:
+        """Adds (or replaces) a document, returning its id."""
+        self._documents[text_object.hash] = text_object
+        return text_object.hash
+
+    def discard(self, document_id: str) -> None:
+        """Removes a document if it is in the table."""
+        self._documents.pop(document_id, None)
+
+    def resolve(self, item: Union[SearchEntry, VectorRecord]) -> Optional[TextObject]:
+        """Returns the document a record (or search entry) was created from, if it is in the table."""
+        record = item.record if isinstance(item, SearchEntry) else item
+        document_id = (record.metadata or {}).get(DOCUMENT_ID)
+        if document_id is None:
+            return None
+        return self._documents.get(document_id)
+
+    def __getitem__(self, document_id: str) -> TextObject:
+        return self._documents[document_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._documents)
+
+    def __len__(self) -> int:
+        return len(self._documents)
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+# sqlite limits the number of parameters in a single statement
+_SQLITE_MAX_PARAMS = 500
+
+
+class EmbeddingCache:
+    """
+    A cache of embedding vectors keyed by a hash of the embedded content (and the model used).
+
+    Vectors are kept in an in-memory LRU of `max_entries` entries. When a `path` is provided, every vector is also
+    written to a SQLite database at that path so the cache survives restarts (and can be shared between processes);
+    vectors missing from memory are looked up there before they are considered a miss.
+
+    The cache is safe to use from multiple threads.
+
+    Args:
+        max_entries: The maximum number of vectors held in memory.
+        path: Optional path to a SQLite database used as a persistent second level.
+    """
+
+    def __init__(self, max_entries: int = 10_000, path: Union[str, Path, None] = None):
+        if max_entries < 0:
+            raise ValueError("max_entries must not be negative")
+
+        self.max_entries = max_entries
+        self.path = Path(path) if path is not None else None
+        self._memory: OrderedDict[str, List[float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            self._db.commit()
+
+    @staticmethod
+    def key(namespace: str, text: str) -> str:
+        """The cache key of a text embedded within the given namespace (usually the model name)."""
+        return hashlib.sha256(f"{namespace}\0{text}".encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[List[float]]]:
+        """Looks up the vectors of the keys, returning `None` for every key that is not cached."""
+        results: List[Optional[List[float]]] = []
+        missing: Dict[str, List[int]] = {}
+        with self._lock:
+            for i, key in enumerate(keys):
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                elif self._db is not None:
+                    missing.setdefault(key, []).append(i)
+                results.append(vector)
+
+            if missing:
+                for key, vector in self._select(list(missing)):
+                    self._remember(key, vector)
+                    for i in missing[key]:
+                        results[i] = vector
+        return results
+
+    def get(self, key: str) -> Optional[List[float]]:
+        """Looks up the vector of a single key."""
+        return self.get_many([key])[0]
+
+    def set_many(self, items: Iterable[Tuple[str, List[float]]]) -> None:
+        """Stores the (key, vector) pairs in memory and (if configured) on disk."""
+        items = [(key, list(vector)) for key, vector in items]
+        with self._lock:
+            for key, vector in items:
+                self._remember(key, vector)
+            if self._db is not None and items:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    [(key, array("d", vector).tobytes()) for key, vector in items],
+                )
+                self._db.commit()
+
+    def set(self, key: str, vector: List[float]) -> None:
+        """Stores a single vector."""
+        self.set_many([(key, vector)])
+
+    def clear(self) -> None:
+        """Removes every vector from the cache (including the ones on disk)."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM embeddings")
+                self._db.commit()
+
+    def close(self) -> None:
+        """Closes the connection to the on-disk cache (if any)."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def __len__(self) -> int:
+        """The number of vectors held in memory."""
+        return len(self._memory)
+
+    def _remember(self, key: str, vector: List[float]) -> None:
+        if self.max_entries == 0:
+            return
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _select(self, keys: List[str]) -> List[Tuple[str, List[float]]]:
+        found = []
+        for start in range(0, len(keys), _SQLITE_MAX_PARAMS):
+            chunk = keys[start : start + _SQLITE_MAX_PARAMS]
+            rows = self._db.execute(
+                f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(chunk))})",
+                chunk,
+            )
+            for key, blob in rows:
+                found.append((key, array("d", blob).tolist()))
+        return found
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Iterable, List, Optional, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import litellm
 
+from .embedding_cache import EmbeddingCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,10 +22,24 @@ class BaseEmbeddingService(ABC):
     def embed(self, texts: Sequence[str], *, batch_size: int = 8) -> List[List[float]]:
         raise NotImplementedError("Subclasses must implement this method.")
 
+    async def aembed(
+        self, texts: Sequence[str], *, batch_size: int = 8
+    ) -> List[List[float]]:
+        """
+        Asynchronously embeds the texts. By default this runs `embed` in a worker thread, subclasses with an async
+        client should override it.
+        """
+        return await asyncio.to_thread(self.embed, texts, batch_size=batch_size)
+
     def __repr__(self):
         return f"{self.__class__.__name__}(model={self.model})"
 
 
+def _estimate_tokens(text: str) -> int:
+    """A cheap estimate of the number of tokens in a text (about 4 characters per token for English)."""
+    return len(text) // 4 + 1
+
+
 class EmbeddingService(BaseEmbeddingService):
     """
     Embedding service that uses litellm to perform embedding tasks.
@@ -33,6 +51,10 @@ def __init__(
         self,
         model: str = DEFAULT_MODEL,
         *,
+        max_concurrency: int = 4,
+        max_batch_tokens: Optional[int] = None,
+        token_counter: Optional[Callable[[str], int]] = None,
+        cache: Optional[EmbeddingCache] = None,
         # --- litellm-specific kwargs ---
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
@@ -44,13 +66,29 @@ def __init__(
 
         Args:
             model: Model name (OpenAI, TogetherAI, etc.)
+            max_concurrency: Maximum number of batches embedded at the same time.
+            max_batch_tokens: If provided, batches are also cut so that the (estimated) number of tokens in a batch
+                stays below this limit. Batches of short texts then grow up to `batch_size` texts while long texts
+                end up in smaller batches.
+            token_counter: Counts the tokens of a text for `max_batch_tokens` (defaults to a cheap estimate of one
+                token per 4 characters).
+            cache: Optional cache of previously embedded texts. Texts found in the cache are not sent to the model.
             api_key: If None, taken from OPENAI_API_KEY env var.
             base_url: Override OpenAI base URL if using gateway / proxy.
             timeout: Per-request timeout in seconds.
             **litellm_extra: Any other args passed straight to litellm.embedding
                             (e.g. headers, organization, etc.)
         """
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be a positive integer")
+        if max_batch_tokens is not None and max_batch_tokens <= 0:
+            raise ValueError("max_batch_tokens must be a positive integer")
+
         self.model = model
+        self.max_concurrency = max_concurrency
+        self.max_batch_tokens = max_batch_tokens
+        self.token_counter = token_counter or _estimate_tokens
+        self.cache = cache
         self.litellm_extra = {
             "api_key": api_key or None,
             "base_url": base_url,
@@ -66,7 +104,56 @@ def embed(self, texts: Sequence[str], *, batch_size: int = 8) -> List[List[float
         """
         Convenience wrapper to embed many short texts in one go.
         Accepts either a sequence of strings or a single string.
+
+        Repeated texts (and texts found in the cache) are only embedded once, and up to `max_concurrency` batches
+        are embedded at the same time on a thread pool.
+        """
+        texts = self._validate(texts, batch_size)
+        results, missing = self._lookup(texts)
+        if not missing:
+            return results
+
+        batches = self._batches(missing, batch_size)
+        if self.max_concurrency > 1 and len(batches) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_concurrency, len(batches)),
+                thread_name_prefix="railtracks-embed",
+            ) as pool:
+                embedded = list(pool.map(self._embed_batch, batches))
+        else:
+            embedded = [self._embed_batch(batch) for batch in batches]
+
+        return self._fill(texts, results, missing, embedded)
+
+    async def aembed(
+        self, texts: Sequence[str], *, batch_size: int = 8
+    ) -> List[List[float]]:
+        """
+        The async counterpart of `embed`, built on `litellm.aembedding`.
+
+        Up to `max_concurrency` batches are in flight at the same time.
         """
+        texts = self._validate(texts, batch_size)
+        results, missing = self._lookup(texts)
+        if not missing:
+            return results
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                return await self._aembed_batch(batch)
+
+        embedded = await asyncio.gather(
+            *(run(batch) for batch in self._batches(missing, batch_size))
+        )
+        return self._fill(texts, results, missing, embedded)
+
+    # ─────────────────────────────────────────────────────
+    # INTERNAL HELPERS
+    # ─────────────────────────────────────────────────────
+    @staticmethod
+    def _validate(texts: Sequence[str], batch_size: int) -> Sequence[str]:
         if isinstance(texts, (str, bytes)):
             texts = [str(texts)]
 
@@ -75,16 +162,73 @@ def embed(self, texts: Sequence[str], *, batch_size: int = 8) -> List[List[float
 
         if batch_size <= 0:
             raise ValueError("batch_size must be a positive integer")
+        return texts
 
-        vectors: List[List[float]] = []
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
-            vectors.extend(self._embed_batch(batch))
-        return vectors
+    def _cache_key(self, text: str) -> str:
+        dimensions = self.litellm_extra.get("dimensions")
+        namespace = self.model if dimensions is None else f"{self.model}:{dimensions}"
+        return EmbeddingCache.key(namespace, text)
+
+    def _lookup(
+        self, texts: Sequence[str]
+    ) -> Tuple[List[Optional[List[float]]], List[str]]:
+        """
+        Finds the vectors of the texts that are already cached.
+
+        Returns the (partial) results, and the unique texts which still have to be embedded.
+        """
+        if self.cache is not None:
+            results = self.cache.get_many([self._cache_key(t) for t in texts])
+        else:
+            results = [None] * len(texts)
+
+        missing = list(dict.fromkeys(t for t, r in zip(texts, results) if r is None))
+        return results, missing
+
+    def _fill(
+        self,
+        texts: Sequence[str],
+        results: List[Optional[List[float]]],
+        missing: List[str],
+        embedded: Iterable[List[List[float]]],
+    ) -> List[List[float]]:
+        """Completes the results with the vectors of the missing texts (and caches them)."""
+        vectors = [vector for batch in embedded for vector in batch]
+        if len(vectors) != len(missing):
+            raise ValueError(
+                f"Embedding model returned {len(vectors)} embeddings for {len(missing)} inputs"
+            )
+
+        by_text = dict(zip(missing, vectors))
+        if self.cache is not None:
+            self.cache.set_many((self._cache_key(t), v) for t, v in by_text.items())
+        return [r if r is not None else by_text[t] for t, r in zip(texts, results)]
+
+    def _batches(self, texts: List[str], batch_size: int) -> List[List[str]]:
+        """Splits the texts into batches of at most `batch_size` texts (and `max_batch_tokens` tokens if set)."""
+        if self.max_batch_tokens is None:
+            return [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+
+        batches: List[List[str]] = []
+        batch: List[str] = []
+        batch_tokens = 0
+        for text in texts:
+            tokens = self.token_counter(text)
+            if batch and (
+                len(batch) >= batch_size
+                or batch_tokens + tokens > self.max_batch_tokens
+            ):
+                batches.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append(text)
+            batch_tokens += tokens
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _request_kwargs(self) -> Dict[str, Any]:
+        return {k: v for k, v in self.litellm_extra.items() if v is not None}
 
-    # ─────────────────────────────────────────────────────
-    # INTERNAL HELPERS
-    # ─────────────────────────────────────────────────────
     def _embed_batch(self, batch: Iterable[str]) -> List[List[float]]:
         """
         Low-level wrapper around litellm.embedding
@@ -97,12 +241,36 @@ def _embed_batch(self, batch: Iterable[str]) -> List[List[float]]:
             response = litellm.embedding(
                 model=self.model,
                 input=batch_list,
-                **{k: v for k, v in self.litellm_extra.items() if v is not None},
+                **self._request_kwargs(),
+            )
+        except Exception as e:
+            logger.exception("Embedding request failed: %s", e)
+            raise
+
+        return self._parse_response(response)
+
+    async def _aembed_batch(self, batch: Iterable[str]) -> List[List[float]]:
+        """
+        Low-level wrapper around litellm.aembedding
+        """
+        batch_list = list(batch)
+        if not batch_list:
+            return []
+
+        try:
+            response = await litellm.aembedding(
+                model=self.model,
+                input=batch_list,
+                **self._request_kwargs(),
             )
         except Exception as e:
             logger.exception("Embedding request failed: %s", e)
             raise
 
+        return self._parse_response(response)
+
+    @staticmethod
+    def _parse_response(response: Any) -> List[List[float]]:
         # litellm typically returns a dict with 'data' or an object with .data
         data = getattr(response, "data", None)
         if data is None and isinstance(response, dict):
@@ -1,19 +1,26 @@
 # rag.py
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Callable, Dict, List, Optional, Sequence, Union
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 from railtracks.utils.logging import get_rt_logger
 
 from .chunking_service import TextChunkingService
+from .document_table import DocumentTable
 from .embedding_service import (
     BaseEmbeddingService,
     EmbeddingService,
 )
 from .text_object import TextObject
 from .vector_store import create_store
-from .vector_store.base import AbstractVectorStore, SearchResult, VectorRecord
+from .vector_store.base import (
+    AbstractVectorStore,
+    SearchEntry,
+    SearchResult,
+    VectorRecord,
+)
 
 logger = get_rt_logger("rag_core")
 
@@ -39,22 +46,32 @@ def textobject_to_vectorrecords(text_obj: TextObject) -> List[VectorRecord]:
     """
     Convert a TextObject (with chunks and embeddings already populated) into VectorRecords.
 
-    Uses deterministic ids: {text_obj.hash}-{chunk_index} which are stable and traceable.
-    If you need global uniqueness beyond a resource, append a short uuid suffix.
+    Uses deterministic ids: {text_obj.hash}-{chunk_index} which are stable and traceable. As the hash covers the full
+    content of the document, documents only share ids when they are identical. Every record also carries a hash of
+    its own chunk (`chunk_hash` in the metadata).
     """
     chunks = text_obj.chunked_content or []
     embeddings = text_obj.embeddings or []
     n = min(len(chunks), len(embeddings))
     vector_records: List[VectorRecord] = []
     base_meta = text_obj.get_metadata()
+    hash_type = getattr(text_obj, "hash_type", "sha256")
 
     for i in range(n):
         metadata = dict(base_meta)
-        metadata.update({"chunk_index": i, "chunk": chunks[i]})
+        metadata.update(
+            {
+                "chunk_index": i,
+                "chunk": chunks[i],
+                "chunk_hash": TextObject.get_resource_hash(chunks[i], hash_type),
+            }
+        )
         # raise warning if text_obj.hash is empty, generate it on the run
         if not text_obj.hash:
             logger.warning("TextObject has no hash; generating a temporarily Hash")
-            text_obj.hash = TextObject.get_resource_hash(text_obj.raw_content)
+            text_obj.hash = TextObject.get_resource_hash(
+                text_obj.raw_content, hash_type
+            )
 
         record_id = f"{text_obj.hash}-{i}"
         vector_records.append(
@@ -84,6 +101,8 @@ class RAG:
         results = rag.search("query", top_k=3)
     """
 
+    EMBED_GROUP_SIZE = 256
+
     def __init__(
         self,
         docs: Sequence[str],
@@ -107,6 +126,10 @@ def __init__(
 
         # Initialize TextObjects
         self.text_objects: List[TextObject] = [TextObject(doc) for doc in docs]
+        # The ingested documents, their records only reference them by id
+        self.documents = DocumentTable()
+        # hash of every ingested document -> ids of its records in the vector store
+        self._indexed: Dict[str, List[str]] = {}
 
     @classmethod
     def from_docs(
@@ -130,18 +153,85 @@ def add_docs(self, docs: Sequence[str]) -> None:
 
     def embed_all(self) -> None:
         """
-        Chunk and embed all text objects; persist as vector records in the vector store.
+        Chunk and embed the text objects that are new or changed since the last call, and upsert their records into
+        the vector store.
+
+        Documents are identified by the hash of their full content: unchanged documents are skipped, identical
+        documents are only embedded once (for the first of them) and the records of documents which changed or were
+        removed since the last call are deleted from the vector store. Record ids are deterministic, so ingesting a
+        document a second time (e.g. from another RAG sharing the store) upserts its records in place.
 
-        Idempotency note: This method does not deduplicate; calling multiple times will
-        append more records for the same docs. Manage deduplication externally if needed.
+        The chunks of several documents are embedded together (in groups of about `EMBED_GROUP_SIZE` chunks) and
+        the next group is chunked while the previous one is being embedded.
         """
+        current: Dict[str, TextObject] = {}
         for tobj in self.text_objects:
-            chunks = self.chunk_service.chunk(tobj.raw_content)
-            vectors = self.embed_service.embed(chunks)
-            tobj.set_chunked(chunks)
-            tobj.set_embeddings(vectors)
-            records = textobject_to_vectorrecords(tobj)
-            # These are pre-embedded VectorRecord objects
+            # the content may have changed since the text object was created
+            tobj.hash = TextObject.get_resource_hash(tobj.raw_content, tobj.hash_type)
+            current.setdefault(tobj.hash, tobj)
+
+        stale_ids = []
+        for doc_hash in [h for h in self._indexed if h not in current]:
+            stale_ids.extend(self._indexed.pop(doc_hash))
+            self.documents.discard(doc_hash)
+        if stale_ids:
+            self.vector_store.delete(stale_ids)
+
+        pending = [
+            (doc_hash, tobj)
+            for doc_hash, tobj in current.items()
+            if doc_hash not in self._indexed
+        ]
+        if not pending:
+            return
+
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="railtracks-rag")
+        try:
+            in_flight = None
+            for group in self._chunk_groups(pending):
+                chunks = [chunk for _, tobj in group for chunk in tobj.chunked_content]
+                submitted = (group, pool.submit(self.embed_service.embed, chunks))
+                if in_flight is not None:
+                    self._store_group(*in_flight)
+                in_flight = submitted
+            if in_flight is not None:
+                self._store_group(*in_flight)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _chunk_groups(
+        self, pending: Sequence[Tuple[str, TextObject]]
+    ) -> Iterator[List[Tuple[str, TextObject]]]:
+        """Chunks the pending text objects, yielding them in groups of about `EMBED_GROUP_SIZE` chunks."""
+        group: List[Tuple[str, TextObject]] = []
+        n_chunks = 0
+        for doc_hash, tobj in pending:
+            tobj.set_chunked(self.chunk_service.chunk(tobj.raw_content))
+            group.append((doc_hash, tobj))
+            n_chunks += len(tobj.chunked_content)
+            if n_chunks >= self.EMBED_GROUP_SIZE:
+                yield group
+                group, n_chunks = [], 0
+        if group:
+            yield group
+
+    def _store_group(
+        self,
+        group: List[Tuple[str, TextObject]],
+        embedded: Future[List[List[float]]],
+    ) -> None:
+        """Attaches the embeddings of a group to its text objects and upserts their records."""
+        vectors = iter(embedded.result())
+        records: List[VectorRecord] = []
+        for doc_hash, tobj in group:
+            tobj.set_embeddings([next(vectors) for _ in tobj.chunked_content])
+            tobj_records = textobject_to_vectorrecords(tobj)
+            self._indexed[doc_hash] = [record.id for record in tobj_records]
+            self.documents.add(tobj)
+            records.extend(tobj_records)
+
+        # These are pre-embedded VectorRecord objects
+        if records:
             self.vector_store.add(records)
 
     def search(self, query: Union[str, List[float]], top_k: int = 3) -> SearchResult:
@@ -155,3 +245,27 @@ def search(self, query: Union[str, List[float]], top_k: int = 3) -> SearchResult
             return self.vector_store.search(q_vec, top_k=top_k)
         else:
             return self.vector_store.search(query, top_k=top_k)
+
+    def get_document(
+        self, item: Union[SearchEntry, VectorRecord]
+    ) -> Optional[TextObject]:
+        """
+        Looks up the document a search entry (or record) was created from.
+
+        Records only carry the id of their document, so the full content is only resolved when it is asked for.
+        """
+        return self.documents.resolve(item)
+
+    def search_many(
+        self, queries: Sequence[Union[str, List[float]]], top_k: int = 3
+    ) -> List[SearchResult]:
+        """
+        Search the vector store for relevant documents for each of the queries.
+
+        All text queries are embedded together (in batches) rather than one call per query, and the vector store scores
+        the queries together. Results are returned in the same order as the queries.
+        """
+        texts = [q for q in queries if isinstance(q, str)]
+        embedded = iter(self.embed_service.embed(texts) if texts else [])
+        vectors = [next(embedded) if isinstance(q, str) else q for q in queries]
+        return self.vector_store.search_many(vectors, top_k=top_k, embed=False)
@@ -6,6 +6,23 @@
 
 logger = logging.getLogger(__name__)
 
+_HASH_BLOCK_CHARS = 1 << 20
+_HASH_BLOCK_BYTES = 1 << 20
+_XXHASH_TYPES = {"xxh3_64", "xxh3_128", "xxh64", "xxh128"}
+
+
+def _new_hash(hash_type: str):
+    """Creates a hash object of the given type (a `hashlib` algorithm or one of the `xxhash` algorithms)."""
+    if hash_type in _XXHASH_TYPES:
+        try:
+            import xxhash
+        except ImportError:
+            raise ImportError(
+                f"The '{hash_type}' hash needs the xxhash package. Please install railtracks[rag]."
+            )
+        return getattr(xxhash, hash_type)()
+    return hashlib.new(hash_type)
+
 
 class ResourceInstance:
     """Base class for any resource object (text, image, video, etc.)."""
@@ -43,9 +60,30 @@ def get_name_from_path(path: str) -> str:
 
     @staticmethod
     def get_resource_hash(file_content: str, _hash_type="sha256") -> str:
-        hash_obj = hashlib.new(_hash_type)
-        # hash on first 8192 bytes to avoid very large files
-        hash_obj.update(file_content[:8192].encode("utf-8"))
+        """
+        Hashes the full content. The content is encoded and fed to the hash in blocks, so a large document is never
+        copied as a whole.
+
+        Any `hashlib` algorithm can be used, as well as the much faster (non-cryptographic) "xxh3_64" and "xxh3_128"
+        which need the optional `xxhash` package.
+        """
+        hash_obj = _new_hash(_hash_type)
+        for start in range(0, len(file_content), _HASH_BLOCK_CHARS):
+            hash_obj.update(
+                file_content[start : start + _HASH_BLOCK_CHARS].encode(
+                    "utf-8", "surrogatepass"
+                )
+            )
+
+        return hash_obj.hexdigest()
+
+    @staticmethod
+    def get_file_hash(path: str, _hash_type="sha256") -> str:
+        """Hashes the full content of a file, reading it in blocks."""
+        hash_obj = _new_hash(_hash_type)
+        with open(path, "rb") as f:
+            while block := f.read(_HASH_BLOCK_BYTES):
+                hash_obj.update(block)
 
         return hash_obj.hexdigest()
 
@@ -69,10 +107,17 @@ def __str__(self):
 class TextObject(ResourceInstance):
     """Text-specific metadata and embedding storage."""
 
-    def __init__(self, raw_content: str, path: Optional[str] = None, **kwargs):
+    def __init__(
+        self,
+        raw_content: str,
+        path: Optional[str] = None,
+        hash_type: str = "sha256",
+        **kwargs,
+    ):
         super().__init__(path=path, type="text", **kwargs)
         self.raw_content: str = raw_content
-        self.hash: str = self.get_resource_hash(raw_content)
+        self.hash_type = hash_type
+        self.hash: str = self.get_resource_hash(raw_content, hash_type)
         self.chunked_content: List[str] = []
         self.embeddings: List[List[float]] = []
 
@@ -83,10 +128,15 @@ def set_embeddings(self, vectors: List[List[float]]):
         self.embeddings = vectors
 
     def get_metadata(self) -> dict:
+        """
+        Serializable metadata dictionary. The content itself is not included (it would be copied into every chunk
+        record), only the id of the document which can be used to look it up.
+        """
         meta = super().get_metadata()
         meta.update(
             {
-                "raw_content": self.raw_content,
+                "document_id": self.hash,
+                "content_length": len(self.raw_content),
                 "num_chunks": len(self.chunked_content),
                 "embeddings": f"{len(self.embeddings)} vectors",
             }
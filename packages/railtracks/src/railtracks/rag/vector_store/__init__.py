@@ -1,13 +1,15 @@
 """
 Vector-Store package entry-point.
 
-from vector_store import create_store, InMemoryVectorStore
+from vector_store import create_store, InMemoryVectorStore, IVFVectorStore
 """
 
 from .factory import create_store
 from .in_memory import InMemoryVectorStore
+from .ivf import IVFVectorStore
 
 __all__ = [
     "create_store",
     "InMemoryVectorStore",
+    "IVFVectorStore",
 ]
@@ -150,6 +150,29 @@ def search(
         """
         ...
 
+    def search_many(
+        self,
+        queries: Sequence[Union[str, Vector]],
+        top_k: int = 5,
+        *,
+        embed: bool = True,
+    ) -> List[List[SearchEntry]]:
+        """
+        Search for the top-k most similar vectors for each of the queries.
+
+        The default implementation runs `search` for every query, stores should override it when they can batch the
+        queries.
+
+        Args:
+            queries: Input texts (if embed=True) or vectors to search against the collection.
+            top_k: Number of top results to return per query.
+            embed: If True, the queries are assumed to be strings to embed.
+
+        Returns:
+            A list of search results for each query, in the same order as the queries.
+        """
+        return [self.search(query, top_k, embed=embed) for query in queries]
+
     @abc.abstractmethod
     def delete(self, ids: Sequence[str]) -> int:
         """
@@ -4,6 +4,7 @@
 
 from ..embedding_service import EmbeddingService
 from .in_memory import InMemoryVectorStore
+from .ivf import IVFVectorStore
 
 
 def create_store(
@@ -15,7 +16,7 @@ def create_store(
     Factory utility.
     Example cfg:
         {
-            "backend": "memory"
+            "backend": "memory",  # or "ivf" for an approximate nearest-neighbour index
             "metric": "cosine",
             "workspace": "~/.vector_store",
             "dim": 768
@@ -28,5 +29,7 @@ def create_store(
 
     if backend in {"memory", "inmemory"}:
         return InMemoryVectorStore(**kwargs)
+    if backend == "ivf":
+        return IVFVectorStore(**kwargs)
 
     raise ValueError(f"Unknown backend '{backend}'")
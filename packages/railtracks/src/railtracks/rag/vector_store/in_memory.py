@@ -1,21 +1,81 @@
 from __future__ import annotations
 
+import copy
+import os
 import pickle
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Union
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
+
+import numpy as np
 
 from ..embedding_service import BaseEmbeddingService
 from .base import AbstractVectorStore, Metric, SearchEntry, SearchResult, VectorRecord
-from .utils import distance, normalize_vector, uuid_str
+from .utils import uuid_str
+
+_DTYPE = np.float32
+
+MMAP_VECTORS_FILE = "vectors.npy"
+MMAP_RECORDS_FILE = "records.pkl"
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Normalizes every row of the matrix to unit length (rows with a zero norm are left as is)."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return matrix / norms
+
+
+class _VectorView(Mapping[str, List[float]]):
+    """A read only view mapping record ids to their (stored) vectors."""
+
+    def __init__(self, store: InMemoryVectorStore):
+        self._store = store
+
+    def __getitem__(self, id: str) -> List[float]:
+        return self._store._matrix[self._store._rows[id]].tolist()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store._rows)
+
+    def __len__(self) -> int:
+        return len(self._store._rows)
+
+
+class _RecordView(Mapping[str, Any]):
+    """A read only view mapping record ids to their records (with the stored vector attached)."""
+
+    def __init__(self, store: InMemoryVectorStore):
+        self._store = store
+
+    def __getitem__(self, id: str):
+        return self._store._full_record(id)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store._rows)
+
+    def __len__(self) -> int:
+        return len(self._store._rows)
 
 
 class InMemoryVectorStore(AbstractVectorStore):
     """
     In-memory implementation of AbstractVectorStore.
 
-    Stores vectors and records in Python dictionaries. Supports optional embedding
-    of raw texts into vectors via an injected BaseEmbeddingService, multiple
-    similarity metrics, normalization, basic CRUD, and persistence via pickle.
+    Stores vectors in a contiguous float32 matrix (one row per record) so a search
+    is a single matrix-vector product followed by a partial sort for the top-k.
+    Supports optional embedding of raw texts into vectors via an injected
+    BaseEmbeddingService, multiple similarity metrics, normalization, basic CRUD,
+    and persistence via pickle or a memory-mappable folder of raw vectors.
 
     Args:
         embedding_service: Optional embedding service for converting text to vectors.
@@ -28,10 +88,16 @@ class InMemoryVectorStore(AbstractVectorStore):
         metric: Metric used for similarity/distance.
         _dim: Expected dimension of all vectors in the store.
         _normalize: Whether normalization is applied on add/search/update.
-        _vectors: Maps record ids to vectors (List[float]).
-        _record: Maps record ids to VectorRecord objects containing metadata and text.
+        _matrix: The stored vectors, one row per record. Only the first `count()` rows are in use.
+        _ids: Maps rows of the matrix to record ids.
+        _rows: Maps record ids to rows of the matrix.
+        _records: Maps record ids to their records (stored without their vector).
+        _vectors: A read only view mapping record ids to vectors (List[float]).
+        _record: A read only view mapping record ids to their full records.
     """
 
+    QUERY_BLOCK_SIZE = 256
+
     def __init__(
         self,
         *,
@@ -68,8 +134,74 @@ def __init__(
             self._normalize = normalize
 
         self._dim = dim
-        self._vectors: Dict[str, List[float]] = {}
-        self._record: Dict[str, VectorRecord] = {}
+        self._matrix = np.empty((0, dim or 0), dtype=_DTYPE)
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._records: Dict[str, Any] = {}
+        self._vectors = _VectorView(self)
+        self._record = _RecordView(self)
+
+    # ---------- Storage ----------
+
+    def _full_record(self, id: str):
+        """Returns a copy of the stored record for the id with its vector attached."""
+        record = copy.copy(self._records[id])
+        record.vector = self._matrix[self._rows[id]].tolist()
+        return record
+
+    def _prepare_vectors(self, vectors: Sequence[Sequence[float]]) -> np.ndarray:
+        """Validates the dimension of the vectors and converts them into (normalized) matrix rows."""
+        for vec in vectors:
+            if self._dim is None:
+                self._dim = len(vec)
+            if len(vec) != self._dim:
+                raise ValueError(f"Expected dim={self._dim}, got {len(vec)}")
+
+        block = np.asarray(vectors, dtype=_DTYPE).reshape(len(vectors), self._dim)
+        return _normalize_rows(block) if self._normalize else block
+
+    def _reserve(self, n_rows: int) -> None:
+        """Makes sure the matrix has room for `n_rows` more rows, growing it geometrically if needed."""
+        needed = len(self._ids) + n_rows
+        capacity, dim = self._matrix.shape
+        if needed <= capacity and dim == self._dim:
+            return
+
+        grown = np.empty((max(needed, 2 * capacity, 16), self._dim), dtype=_DTYPE)
+        if self._ids:
+            grown[: len(self._ids)] = self._matrix[: len(self._ids)]
+        self._matrix = grown
+
+    def _write(self, ids: Sequence[str], block: np.ndarray) -> None:
+        """Writes the rows of the block for the given ids, overwriting the rows of ids that already exist."""
+        self._reserve(len(ids))
+        rows = []
+        for _id in ids:
+            row = self._rows.get(_id)
+            if row is None:
+                row = len(self._ids)
+                self._rows[_id] = row
+                self._ids.append(_id)
+            rows.append(row)
+
+        self._matrix[rows] = block
+
+    def _adopt_rows(self, ids: List[str], matrix: np.ndarray) -> None:
+        """Uses the given matrix (one row per id, already normalized if needed) as the storage of the store."""
+        self._matrix = matrix
+        self._ids = ids
+        self._rows = {_id: row for row, _id in enumerate(ids)}
+
+    def _remove(self, id: str) -> None:
+        """Removes the row of the id, moving the last row into the gap so the used rows stay contiguous."""
+        row = self._rows.pop(id)
+        last = len(self._ids) - 1
+        if row != last:
+            moved = self._ids[last]
+            self._matrix[row] = self._matrix[last]
+            self._ids[row] = moved
+            self._rows[moved] = row
+        self._ids.pop()
 
     # ---------- CRUD ----------
 
@@ -99,6 +231,8 @@ def add(
             RuntimeError: If embedding is required but embedding_service is not provided.
         """
         ids: List[str] = []
+        vectors: List[Sequence[float]] = []
+        records = []
 
         if metadata is not None and len(metadata) != len(texts_or_records):
             raise ValueError("metadata length must match texts/records length")
@@ -135,24 +269,23 @@ def add(
             else:
                 raise TypeError("Unsupported type for add()")
 
-            # Dimension checks and autodetection
-            if self._dim is None:
-                self._dim = len(vec)
-            if len(vec) != self._dim:
-                raise ValueError(f"Expected dim={self._dim}, got {len(vec)}")
+            # The vector lives in the matrix, the record only keeps the id/text/metadata
+            records.append(
+                VectorRecord(id=_id, vector=None, text=rec_text, metadata=rec_meta)
+            )
+            vectors.append(vec)
+            ids.append(_id)
 
-            # Optional normalization
-            stored_vec = normalize_vector(vec) if self._normalize else vec
+        if not ids:
+            return ids
 
-            # Ensure the stored record mirrors the final id/vector/text/metadata
-            record = VectorRecord(
-                id=_id, vector=stored_vec, text=rec_text, metadata=rec_meta
-            )
+        # Dimension checks (and autodetection) and optional normalization happen for the whole batch at once
+        block = self._prepare_vectors(vectors)
 
-            # Persist
-            self._vectors[_id] = stored_vec
-            self._record[_id] = record
-            ids.append(_id)
+        # Persist
+        self._write(ids, block)
+        for record in records:
+            self._records[record.id] = record
 
         return ids
 
@@ -191,25 +324,129 @@ def search(
                 raise ValueError("embed=True but raw vector supplied.")
             q = query
 
-        if self._normalize:
-            q = normalize_vector(q)
+        return self._search_block(np.asarray([q], dtype=_DTYPE), top_k)[0]
 
-        # Brute-force distance against all items
-        scores = [
-            (vid, distance(q, v, metric=self.metric.value))
-            for vid, v in self._vectors.items()
-        ]
-        scores.sort(key=lambda t: t[1])  # lower is better
+    def search_many(
+        self,
+        queries: Sequence[Union[str, List[float]]],
+        top_k: int = 5,
+        *,
+        embed: bool = False,
+    ) -> List[SearchResult]:
+        """
+        Find the top-k most similar items for each of the queries.
+
+        All text queries are embedded with a single call to the embedding service, and the queries are scored
+        together with matrix-matrix products (in blocks of `QUERY_BLOCK_SIZE` queries to bound memory use).
+
+        Args:
+            queries: Input texts (with embed=True) or vectors.
+            top_k: The number of results to return per query.
+            embed: Whether to embed the query strings (default False).
+
+        Returns:
+            A list with a SearchResult for each query, in the same order as the queries.
 
-        results = SearchResult(
-            SearchEntry(
-                score=score,
-                record=self._record[vid],
+        Raises:
+            ValueError: If wrong input type for embed setting.
+            RuntimeError: If embedding is required but missing service.
+        """
+        texts = [q for q in queries if isinstance(q, str)]
+        if texts and not embed:
+            raise ValueError("embed=False but query is text.")
+        if len(texts) != len(queries) and embed:
+            raise ValueError("embed=True but raw vector supplied.")
+        if texts and not self.embedding_service:
+            raise RuntimeError("BaseEmbeddingService required but missing.")
+
+        if texts:
+            vectors = self.embedding_service.embed(texts)
+        else:
+            vectors = list(queries)
+
+        if len(vectors) == 0:
+            return []
+
+        block = np.asarray(vectors, dtype=_DTYPE)
+        results: List[SearchResult] = []
+        for start in range(0, len(block), self.QUERY_BLOCK_SIZE):
+            results.extend(
+                self._search_block(block[start : start + self.QUERY_BLOCK_SIZE], top_k)
             )
-            for vid, score in scores[: max(0, top_k)]
-        )
         return results
 
+    def _search_block(self, queries: np.ndarray, top_k: int) -> List[SearchResult]:
+        """Finds the top-k rows for every query (row) of the provided matrix."""
+        n = len(self._ids)
+        k = min(max(0, top_k), n)
+        if k == 0:
+            return [SearchResult() for _ in range(len(queries))]
+
+        scores = self._scores(queries)
+
+        # only the top-k are sorted, the rest are left in an arbitrary order by the partition.
+        if k < n:
+            top = np.argpartition(scores, k - 1, axis=1)[:, :k]
+        else:
+            top = np.broadcast_to(np.arange(n), scores.shape)
+        order = np.argsort(
+            np.take_along_axis(scores, top, axis=1), axis=1, kind="stable"
+        )
+        top = np.take_along_axis(top, order, axis=1)
+
+        return [
+            SearchResult(
+                SearchEntry(
+                    score=float(scores[i, row]),
+                    record=self._full_record(self._ids[row]),
+                )
+                for row in rows
+            )
+            for i, rows in enumerate(top)
+        ]
+
+    def _scores(
+        self, queries: np.ndarray, matrix: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Scores every query (row) against every stored vector, lower is better (similarities are negated).
+
+        This is the vectorized equivalent of `utils.distance`, the result has a row of scores for each query. When a
+        matrix is provided the queries are scored against its rows instead of the whole store.
+        """
+        if matrix is None:
+            matrix = self._matrix[: len(self._ids)]
+        metric = self.metric.value
+
+        if self._normalize:
+            queries = _normalize_rows(queries)
+
+        similarity = queries @ matrix.T
+
+        if metric == "dot":
+            return -similarity
+
+        if metric == "l2":
+            # ||x - q||^2 = ||x||^2 - 2 x.q + ||q||^2
+            squared = (
+                np.einsum("ij,ij->i", matrix, matrix)[None, :]
+                - 2 * similarity
+                + np.einsum("ij,ij->i", queries, queries)[:, None]
+            )
+            return np.maximum(squared, 0)
+
+        if metric == "cosine":
+            if not self._normalize:
+                # the stored vectors (and queries) are only already normalized when normalization is on.
+                norms = np.outer(
+                    np.linalg.norm(queries, axis=1), np.linalg.norm(matrix, axis=1)
+                )
+                norms[norms == 0] = 1
+                similarity = similarity / norms
+            return -similarity
+
+        raise ValueError(f"Unsupported metric {metric}")
+
     def delete(self, ids: Sequence[str]) -> int:
         """
         Remove vectors and metadata entries by id.
@@ -222,9 +459,9 @@ def delete(self, ids: Sequence[str]) -> int:
         """
         removed = 0
         for _id in ids:
-            if _id in self._vectors:
-                self._vectors.pop(_id, None)
-                self._record.pop(_id, None)
+            if _id in self._rows:
+                self._remove(_id)
+                self._records.pop(_id, None)
                 removed += 1
         return removed
 
@@ -250,10 +487,10 @@ def update(
             ValueError: If input types do not match embed flag.
             RuntimeError: If embedding required but missing service.
         """
-        if id not in self._vectors:
+        if id not in self._rows:
             raise KeyError(id)
 
-        existing = self._record[id]
+        existing = self._records[id]
 
         if isinstance(new_text_or_vector, str):
             if not embed:
@@ -269,24 +506,24 @@ def update(
             vec = new_text_or_vector
             new_text = existing.text
 
-        # Normalize if needed
-        vec = normalize_vector(vec) if self._normalize else vec
+        # Validate and normalize if needed
+        block = self._prepare_vectors([vec])
 
         # Merge/update metadata: preserve existing, apply new fields
         existing_meta = getattr(existing, "metadata", None) or {}
         new_meta = dict(existing_meta)
         new_meta.update(metadata)
 
-        # Rebuild the record with updated vector/text/metadata
+        # Rebuild the record with updated text/metadata (the vector lives in the matrix)
         updated = VectorRecord(
             id=id,
-            vector=vec,
+            vector=None,
             text=new_text,
             metadata=new_meta,
         )
 
-        self._vectors[id] = vec
-        self._record[id] = updated
+        self._write([id], block)
+        self._records[id] = updated
 
     # ---------- Misc ----------
 
@@ -297,53 +534,103 @@ def count(self) -> int:
         Returns:
             The number of records in the store.
         """
-        return len(self._vectors)
+        return len(self._ids)
+
+    def _persisted_options(self) -> Dict[str, Any]:
+        """Any extra constructor arguments (beyond the metric, dim and normalize) to persist alongside the store."""
+        return {}
+
+    def _persisted_header(self) -> Dict[str, Any]:
+        """The settings and records of the store in a picklable form (without any vectors)."""
+        return {
+            "metric": getattr(self.metric, "value", self.metric),
+            "dim": self._dim,
+            "normalize": self._normalize,
+            "options": self._persisted_options(),
+            "ids": list(self._ids),
+            "record": {
+                rid: {
+                    "id": rec.id,
+                    "text": rec.text,
+                    "metadata": getattr(rec, "metadata", None),
+                }
+                for rid, rec in self._records.items()
+            },
+        }
 
-    def persist(self, path: Union[str, Path, None] = None) -> None:
+    def persist(
+        self,
+        path: Union[str, Path, None] = None,
+        *,
+        format: Literal["pickle", "mmap"] = "pickle",
+    ) -> None:
         """
-        Persist the vector store to disk as a pickle file.
+        Persist the vector store to disk.
+
+        With the default "pickle" format the whole store is written to a single pickle file. With the "mmap" format
+        the path is treated as a folder holding two files: a raw float32 `vectors.npy` block and a compact
+        `records.pkl` file with the settings, ids and records. Loading that folder memory-maps the vectors instead of
+        reading them, so a cold start is near-instant and worker processes loading the same folder share the vector
+        pages through the OS page cache.
 
         Args:
             path: Folder or file path. If a folder (or not ending with .pkl),
-                  'in_memory_store.pkl' is used within that folder.
+                  'in_memory_store.pkl' is used within that folder. For the "mmap" format this is the folder to
+                  write to (created if missing).
+            format: The on-disk format to use ("pickle" or "mmap").
         """
+        if format == "mmap":
+            self._persist_mmap(Path(path or "."))
+            return
+        if format != "pickle":
+            raise ValueError(f"Unknown persist format: {format!r}")
+
         pickle_path = Path(path or ".")
         if pickle_path.is_dir() or not str(pickle_path).endswith(".pkl"):
             pickle_path /= "in_memory_store.pkl"
         with open(pickle_path, "wb") as f:
-            records_serialized = {
-                rid: {
-                    "id": rec.id,
-                    "vector": rec.vector,
-                    "text": rec.text,
-                    "metadata": getattr(rec, "metadata", None),
-                }
-                for rid, rec in self._record.items()
-            }
-
-            pickle.dump(
-                {
-                    "metric": getattr(self.metric, "value", self.metric),
-                    "dim": self._dim,
-                    "normalize": self._normalize,
-                    "vectors": self._vectors,
-                    "record": records_serialized,
-                },
+            data = self._persisted_header()
+            data["matrix"] = self._matrix[: len(self._ids)].copy()
+            pickle.dump(data, f)
+
+    def _persist_mmap(self, folder: Path) -> None:
+        folder.mkdir(parents=True, exist_ok=True)
+        vectors_path = folder / MMAP_VECTORS_FILE
+        records_path = folder / MMAP_RECORDS_FILE
+
+        # Both files are written next to their final location and then swapped in. Processes which still have the
+        # old vectors mapped keep reading the old (now unlinked) file instead of seeing a half written one.
+        tmp_vectors = vectors_path.with_name(vectors_path.name + ".tmp")
+        with open(tmp_vectors, "wb") as f:
+            np.save(
                 f,
+                np.ascontiguousarray(self._matrix[: len(self._ids)], dtype=_DTYPE),
+                allow_pickle=False,
             )
+        tmp_records = records_path.with_name(records_path.name + ".tmp")
+        with open(tmp_records, "wb") as f:
+            pickle.dump(self._persisted_header(), f)
+
+        os.replace(tmp_vectors, vectors_path)
+        os.replace(tmp_records, records_path)
 
     @classmethod
     def load(cls, path: Union[str, Path]) -> "InMemoryVectorStore":
         """
-        Load a vector store from a pickle file.
+        Load a vector store from disk.
 
         Args:
-            path: Path to the pickle file.
+            path: Path to the pickle file, or to a folder written with `persist(..., format="mmap")`. In the latter
+                  case the vectors are memory-mapped copy-on-write: they are paged in from the file as they are
+                  searched, and changes made to the loaded store never reach the file.
 
         Returns:
             An InMemoryVectorStore instance reloaded from disk.
         """
         path = Path(path)
+        if path.is_dir() and (path / MMAP_VECTORS_FILE).exists():
+            return cls._load_mmap(path)
+
         with open(path, "rb") as f:
             data = pickle.load(f)
 
@@ -351,15 +638,29 @@ def load(cls, path: Union[str, Path]) -> "InMemoryVectorStore":
             metric=data["metric"],
             dim=data["dim"],
             normalize=data["normalize"],
+            **data.get("options", {}),
         )
-        store._vectors = data["vectors"]
+        if "matrix" in data:
+            ids = data["ids"]
+            block = np.asarray(data["matrix"], dtype=_DTYPE)
+        else:
+            # Older pickles store the vectors as a dictionary of lists
+            ids = list(data["vectors"].keys())
+            block = np.asarray(list(data["vectors"].values()), dtype=_DTYPE)
+
+        if store._dim is None and len(ids) > 0:
+            store._dim = block.shape[1]
+        if len(ids) > 0:
+            # the stored vectors were already normalized (if needed) when they were added
+            store._write(ids, block.reshape(len(ids), store._dim))
+
         raw_records = data["record"]
         recs = {}
         for rid, rec in raw_records.items():
             if isinstance(rec, dict):
                 recs[rid] = VectorRecord(
                     id=rec.get("id", rid),
-                    vector=rec.get("vector"),
+                    vector=None,
                     text=rec.get("text"),
                     metadata=rec.get("metadata"),
                 )
@@ -367,5 +668,40 @@ def load(cls, path: Union[str, Path]) -> "InMemoryVectorStore":
                 # Fallback: already an object (older pickle)
                 recs[rid] = rec
 
-        store._record = recs
+        store._records = recs
+        return store
+
+    @classmethod
+    def _load_mmap(cls, folder: Path) -> "InMemoryVectorStore":
+        with open(folder / MMAP_RECORDS_FILE, "rb") as f:
+            data = pickle.load(f)
+        matrix = np.load(folder / MMAP_VECTORS_FILE, mmap_mode="c", allow_pickle=False)
+
+        ids = data["ids"]
+        if len(ids) != matrix.shape[0]:
+            raise ValueError(
+                f"{folder} holds {matrix.shape[0]} vectors for {len(ids)} ids; the files are out of sync."
+            )
+
+        store = cls(
+            metric=data["metric"],
+            dim=data["dim"],
+            normalize=data["normalize"],
+            **data.get("options", {}),
+        )
+        if len(ids) > 0:
+            if store._dim is None:
+                store._dim = matrix.shape[1]
+            # the rows are used as is, the matrix is only copied into memory once the store has to grow.
+            store._adopt_rows(list(ids), matrix)
+
+        store._records = {
+            rid: VectorRecord(
+                id=rec.get("id", rid),
+                vector=None,
+                text=rec.get("text"),
+                metadata=rec.get("metadata"),
+            )
+            for rid, rec in data["record"].items()
+        }
         return store
@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+import math
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional, Sequence, Union
+
+import numpy as np
+
+from ..embedding_service import BaseEmbeddingService
+from .base import Metric, SearchEntry, SearchResult
+from .in_memory import _DTYPE, InMemoryVectorStore, _normalize_rows
+
+_KMEANS_BLOCK_SIZE = 8192
+
+
+class _InvertedList:
+    """A growable array of the matrix rows assigned to one centroid."""
+
+    __slots__ = ("rows", "size")
+
+    def __init__(self):
+        self.rows = np.empty(0, dtype=np.int64)
+        self.size = 0
+
+    def extend(self, rows: np.ndarray) -> None:
+        needed = self.size + len(rows)
+        if needed > len(self.rows):
+            grown = np.empty(max(needed, 2 * len(self.rows), 16), dtype=np.int64)
+            grown[: self.size] = self.rows[: self.size]
+            self.rows = grown
+        self.rows[self.size : needed] = rows
+        self.size = needed
+
+    def view(self) -> np.ndarray:
+        return self.rows[: self.size]
+
+
+class IVFVectorStore(InMemoryVectorStore):
+    """
+    An approximate nearest-neighbour variant of the InMemoryVectorStore using an inverted file (IVF) index.
+
+    The stored vectors are clustered with k-means into `n_lists` lists. A search only scores the vectors in the
+    `n_probe` lists whose centroids are closest to the query, trading recall for latency. Raising `n_probe` (which
+    can be changed at any time) improves recall at the cost of speed, `n_probe >= n_lists` is an exact search.
+
+    The index is trained once the store holds `train_threshold` vectors (until then searches are exact) and is
+    retrained as the store keeps growing. Inserts between trainings are assigned to their nearest list. Deletes (and
+    the old rows of overwritten records) are tombstoned and skipped by the search; the rows are reclaimed once
+    tombstones make up half of the matrix, or when the store is persisted.
+
+    Args:
+        embedding_service: Optional embedding service for converting text to vectors.
+        metric: Metric used for similarity (e.g., 'cosine', 'l2', 'dot').
+        dim: Optionally restrict vectors to a fixed dimension for validation.
+        normalize: Whether to normalize vectors (default True for cosine metric).
+        n_lists: The number of lists (k-means clusters). Defaults to about 4 * sqrt(n) at training time.
+        n_probe: The number of lists to scan for every query.
+        train_threshold: The number of vectors needed before the index is trained.
+        kmeans_iters: The number of k-means iterations used when training.
+        max_train_size: The maximum number of vectors sampled to train k-means.
+        seed: Seed for the k-means sampling and initialization.
+    """
+
+    RETRAIN_GROWTH = 4
+
+    def __init__(
+        self,
+        *,
+        embedding_service: Optional[BaseEmbeddingService] = None,
+        metric: Union[str, Metric] = Metric.cosine,
+        dim: Optional[int] = None,
+        normalize: Optional[bool] = None,
+        n_lists: Optional[int] = None,
+        n_probe: int = 8,
+        train_threshold: int = 4096,
+        kmeans_iters: int = 10,
+        max_train_size: int = 65536,
+        seed: int = 0,
+    ):
+        if n_lists is not None and n_lists < 1:
+            raise ValueError("n_lists must be at least 1")
+        if n_probe < 1:
+            raise ValueError("n_probe must be at least 1")
+
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.train_threshold = train_threshold
+        self.kmeans_iters = kmeans_iters
+        self.max_train_size = max_train_size
+        self.seed = seed
+
+        self._alive = np.zeros(0, dtype=bool)
+        self._assign = np.zeros(0, dtype=np.int64)
+        self._centroids: Optional[np.ndarray] = None
+        self._lists: List[_InvertedList] = []
+        self._trained_size = 0
+        self._n_tombstones = 0
+        super().__init__(
+            embedding_service=embedding_service,
+            metric=metric,
+            dim=dim,
+            normalize=normalize,
+        )
+
+    # ---------- Storage ----------
+
+    @property
+    def is_trained(self) -> bool:
+        """Whether the k-means index has been trained (until then searches scan every vector)."""
+        return self._centroids is not None
+
+    def _reserve(self, n_rows: int) -> None:
+        super()._reserve(n_rows)
+        capacity = len(self._matrix)
+        if len(self._alive) < capacity:
+            alive = np.zeros(capacity, dtype=bool)
+            alive[: len(self._alive)] = self._alive
+            assign = np.full(capacity, -1, dtype=np.int64)
+            assign[: len(self._assign)] = self._assign
+            self._alive, self._assign = alive, assign
+
+    def _write(self, ids: Sequence[str], block: np.ndarray) -> None:
+        # rows are never overwritten in place, the old row is tombstoned so it can stay in its list.
+        for _id in ids:
+            if _id in self._rows:
+                self._remove(_id)
+
+        start = len(self._ids)
+        super()._write(ids, block)
+        new_rows = np.arange(start, len(self._ids))
+        self._alive[new_rows] = True
+
+        if self.is_trained:
+            self._add_to_lists(new_rows)
+        self._maintain()
+
+    def _adopt_rows(self, ids: List[str], matrix: np.ndarray) -> None:
+        super()._adopt_rows(ids, matrix)
+        self._alive = np.ones(len(ids), dtype=bool)
+        self._assign = np.full(len(ids), -1, dtype=np.int64)
+        self._n_tombstones = 0
+        self._maintain()
+
+    def _remove(self, id: str) -> None:
+        row = self._rows.pop(id)
+        self._ids[row] = None
+        self._alive[row] = False
+        self._n_tombstones += 1
+
+    def delete(self, ids: Sequence[str]) -> int:
+        removed = super().delete(ids)
+        self._maintain()
+        return removed
+
+    def count(self) -> int:
+        return len(self._rows)
+
+    def _maintain(self) -> None:
+        """Reclaims tombstoned rows and (re)trains the index when the store has grown enough."""
+        if self._n_tombstones > 0 and 2 * self._n_tombstones >= len(self._ids):
+            self.compact()
+
+        n = self.count()
+        if n >= self.train_threshold and (
+            not self.is_trained or n >= self.RETRAIN_GROWTH * self._trained_size
+        ):
+            self.train()
+
+    def compact(self) -> None:
+        """Drops the tombstoned rows from the matrix, keeping the lists of the remaining rows."""
+        if self._n_tombstones == 0:
+            return
+
+        used = len(self._ids)
+        live = np.flatnonzero(self._alive[:used])
+        self._matrix = np.ascontiguousarray(self._matrix[live])
+        self._ids = [self._ids[row] for row in live]
+        self._rows = {_id: row for row, _id in enumerate(self._ids)}
+        self._alive = np.ones(len(live), dtype=bool)
+        self._assign = self._assign[live]
+        self._n_tombstones = 0
+        if self.is_trained:
+            self._rebuild_lists()
+
+    # ---------- Index ----------
+
+    def train(self) -> None:
+        """
+        Clusters the stored vectors with k-means and assigns every vector to the list of its nearest centroid.
+
+        This is done automatically as the store grows, but can be called to rebuild the index on demand.
+        """
+        used = len(self._ids)
+        live = np.flatnonzero(self._alive[:used])
+        if len(live) == 0:
+            return
+
+        n_lists = self.n_lists or max(1, int(4 * math.sqrt(len(live))))
+        n_lists = min(n_lists, len(live))
+        rng = np.random.default_rng(self.seed)
+        sample_rows = live
+        if len(live) > self.max_train_size:
+            sample_rows = rng.choice(live, self.max_train_size, replace=False)
+        sample = np.asarray(self._matrix[sample_rows], dtype=_DTYPE)
+
+        centroids = sample[rng.choice(len(sample), n_lists, replace=False)].copy()
+        for _ in range(self.kmeans_iters):
+            labels = _nearest(sample, centroids)
+            counts = np.bincount(labels, minlength=n_lists)
+            order = np.argsort(labels, kind="stable")
+            non_empty = np.flatnonzero(counts)
+            starts = np.concatenate(([0], np.cumsum(counts)[:-1]))[non_empty]
+            sums = np.add.reduceat(sample[order], starts, axis=0)
+            centroids[non_empty] = sums / counts[non_empty, None]
+            # empty clusters are restarted on random points of the sample
+            empty = np.flatnonzero(counts == 0)
+            if len(empty) > 0:
+                centroids[empty] = sample[rng.choice(len(sample), len(empty))]
+
+        self._centroids = centroids
+        self._trained_size = len(live)
+        self._assign[:used] = -1
+        self._assign[live] = _nearest(
+            np.asarray(self._matrix[live], dtype=_DTYPE), centroids
+        )
+        self._rebuild_lists()
+
+    def _rebuild_lists(self) -> None:
+        used = len(self._ids)
+        assign = self._assign[:used]
+        rows = np.flatnonzero(self._alive[:used] & (assign >= 0))
+        self._lists = [_InvertedList() for _ in range(len(self._centroids))]
+        order = rows[np.argsort(assign[rows], kind="stable")]
+        counts = np.bincount(assign[rows], minlength=len(self._lists))
+        start = 0
+        for inverted_list, count in zip(self._lists, counts):
+            inverted_list.extend(order[start : start + count])
+            start += count
+
+    def _add_to_lists(self, rows: np.ndarray) -> None:
+        labels = _nearest(np.asarray(self._matrix[rows], dtype=_DTYPE), self._centroids)
+        self._assign[rows] = labels
+        for label in np.unique(labels):
+            self._lists[label].extend(rows[labels == label])
+
+    # ---------- Search ----------
+
+    def _search_block(self, queries: np.ndarray, top_k: int) -> List[SearchResult]:
+        used = len(self._ids)
+        if top_k <= 0 or self.count() == 0:
+            return [SearchResult() for _ in range(len(queries))]
+
+        if not self.is_trained or self.n_probe >= len(self._lists):
+            candidates = np.flatnonzero(self._alive[:used])
+            return [self._rank(q, candidates, top_k) for q in queries]
+
+        probe_queries = _normalize_rows(queries) if self._normalize else queries
+        distances = _distances(probe_queries, self._centroids)
+        probes = np.argpartition(distances, self.n_probe - 1, axis=1)[:, : self.n_probe]
+
+        results = []
+        for q, probed in zip(queries, probes):
+            candidates = np.concatenate([self._lists[p].view() for p in probed])
+            candidates = candidates[self._alive[candidates]]
+            results.append(self._rank(q, candidates, top_k))
+        return results
+
+    def _rank(
+        self, query: np.ndarray, candidates: np.ndarray, top_k: int
+    ) -> SearchResult:
+        """Scores the query against the candidate rows and returns the top-k of them."""
+        k = min(top_k, len(candidates))
+        if k == 0:
+            return SearchResult()
+
+        scores = self._scores(query[None, :], self._matrix[candidates])[0]
+        if k < len(candidates):
+            top = np.argpartition(scores, k - 1)[:k]
+        else:
+            top = np.arange(len(candidates))
+        top = top[np.argsort(scores[top], kind="stable")]
+
+        return SearchResult(
+            SearchEntry(
+                score=float(scores[i]),
+                record=self._full_record(self._ids[candidates[i]]),
+            )
+            for i in top
+        )
+
+    # ---------- Misc ----------
+
+    def _persisted_options(self) -> Dict[str, Any]:
+        return {
+            "n_lists": self.n_lists,
+            "n_probe": self.n_probe,
+            "train_threshold": self.train_threshold,
+            "kmeans_iters": self.kmeans_iters,
+            "max_train_size": self.max_train_size,
+            "seed": self.seed,
+        }
+
+    def persist(
+        self,
+        path: Union[str, Path, None] = None,
+        *,
+        format: Literal["pickle", "mmap"] = "pickle",
+    ) -> None:
+        """
+        Persist the vector store to disk (see `InMemoryVectorStore.persist`).
+
+        Tombstoned rows are reclaimed first. Only the vectors and the index settings are written, the index itself
+        is retrained when the store is loaded.
+        """
+        self.compact()
+        super().persist(path, format=format)
+
+
+def _distances(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Squared l2 distance (up to a per-vector constant) between every vector and every centroid."""
+    return np.einsum("ij,ij->i", centroids, centroids)[None, :] - 2 * (
+        vectors @ centroids.T
+    )
+
+
+def _nearest(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """The index of the nearest centroid for every vector, computed in blocks to bound memory use."""
+    labels = np.empty(len(vectors), dtype=np.int64)
+    for start in range(0, len(vectors), _KMEANS_BLOCK_SIZE):
+        block = vectors[start : start + _KMEANS_BLOCK_SIZE]
+        labels[start : start + len(block)] = np.argmin(
+            _distances(block, centroids), axis=1
+        )
+    return labels
@@ -68,13 +68,14 @@ class Forest(Generic[T]):
     """
 
     def __init__(self, heap: Dict[str, T] | None = None):
+        self._lock = threading.RLock()
         if heap is not None:
             self._heap = heap
             self._full_data = self._create_full_data_from_heap(heap)
         else:
             self._heap: Dict[str, T] = {}
             self._full_data: List[T] = []
-        self._lock = threading.RLock()
+        self._rebuild_index()
 
     @classmethod
     def _create_full_data_from_heap(cls, heap: Dict[str, T]):
@@ -160,8 +161,29 @@ def _update_heap(self, item: T):
                     "The parent of an item not present in the heap must be None"
                 )
 
+            previous = self._heap.get(item.identifier, None)
             self._heap[item.identifier] = item
             self._full_data.append(item)
+            self._index_item(item, previous)
+
+    def _rebuild_index(self):
+        """
+        A hook for subclasses to build any secondary indexes they keep over the heap from scratch.
+
+        It is called whenever the heap is replaced outside of `_update_heap` (construction, `time_machine` and
+        unpickling).
+        """
+        pass
+
+    def _index_item(self, item: T, previous: Optional[T]):
+        """
+        A hook for subclasses to incrementally update any secondary indexes after `item` has been placed in the heap.
+
+        Args:
+            item (T): The item that was just added to the heap
+            previous (Optional[T]): The item it replaced in the heap, None if the identifier is new.
+        """
+        pass
 
     def time_machine(self, step: int | None, item_list: Optional[List[str]] = None):
         """
@@ -193,6 +215,8 @@ def time_machine(self, step: int | None, item_list: Optional[List[str]] = None):
             else:
                 self._heap[identifier] = item
 
+        self._rebuild_index()
+
     def __getstate__(self):
         # we cannot serialize the _lock because it bricks things
         return {k: v for k, v in self.__dict__.items() if k != "_lock"}
@@ -200,3 +224,4 @@ def __getstate__(self):
     def __setstate__(self, state):
         self.__dict__.update(state)
         self._lock = threading.RLock()
+        self._rebuild_index()
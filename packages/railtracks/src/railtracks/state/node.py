@@ -65,6 +65,9 @@ def __init__(self, node_heap: Dict[str, LinkedNode] | None = None):
         """
         super().__init__(node_heap)
 
+        # nodes which have been added but not yet run. They are handed out by `checkout` without being copied.
+        self._pending: Dict[str, Node] = {}
+
         self.id_type_mapping: Dict[str, Type[Node]] = (
             {node.identifier: type(node.node) for node in node_heap.values()}
             if node_heap
@@ -81,6 +84,36 @@ def __getitem__(self, item):
         node = self._heap[item]
         return node
 
+    def checkout(self, identifier: str) -> Node:
+        """
+        Collects the node of the given id so that it can be run.
+
+        The first time a node is checked out after it was added, the node itself is returned without copying it. The
+        heap holds a `Node.snapshot()` of it instead, so running the node does not change which attributes, messages or
+        details were recorded. Objects shared with the snapshot (the messages themselves, the LLM model, ...) are not
+        copied though, so altering them in place would show in the heap. Any later checkout will return a copy of the
+        most recent version of the node.
+
+        Note it will throw a NodeCopyError if the node needs to be copied and cannot be.
+        """
+        with self._lock:
+            node = self._pending.pop(identifier, None)
+
+        if node is not None:
+            return node
+
+        return self._heap[identifier].node
+
+    def __getstate__(self):
+        # nodes waiting to be run belong to the live session, they are not part of the recorded state.
+        state = super().__getstate__()
+        state.pop("_pending", None)
+        return state
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._pending = {}
+
     def to_vertices(self):
         """
         Converts the current heap into a list of `Vertex` objects.
@@ -105,9 +138,16 @@ def update(self, new_node: Node, stamp: Stamp):
         with self._lock:
             parent = self._heap.get(new_node.uuid, None)
 
+            if parent is None:
+                # the node is yet to be run, so we record a snapshot and hold onto the node to hand it out for running.
+                self._pending[new_node.uuid] = new_node
+                recorded_node = new_node.snapshot()
+            else:
+                recorded_node = new_node
+
             new_linked_node = LinkedNode(
                 identifier=new_node.uuid,
-                _node=new_node,
+                _node=recorded_node,
                 stamp=stamp,
                 parent=parent,
             )
@@ -2,8 +2,7 @@
 
 import uuid
 from dataclasses import dataclass
-from functools import reduce
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 from railtracks.utils.profiling import Stamp
 from railtracks.utils.serialization.graph import Edge
@@ -129,6 +128,19 @@ def upstream(cls, requests: Iterable[RequestTemplate], sink_id: str):
         """Collects the requests one level upstream from the provided sink_id."""
         return [x for x in requests if x.sink_id == sink_id]
 
+    @classmethod
+    def downstream_map(
+        cls, requests: Iterable[RequestTemplate]
+    ) -> Dict[Optional[str], List[RequestTemplate]]:
+        """
+        Groups the provided requests by their source_id in a single pass so repeated downstream lookups are O(1).
+        """
+        downstream_map: Dict[Optional[str], List[RequestTemplate]] = {}
+        for x in requests:
+            downstream_map.setdefault(x.source_id, []).append(x)
+
+        return downstream_map
+
     @classmethod
     def all_downstream(
         cls, requests: Iterable[RequestTemplate], source_id: Optional[str]
@@ -136,10 +148,19 @@ def all_downstream(
         """
         Collects all the downstream requests from the provided source_id.
         """
-        downstream_requests = cls.downstream(requests, source_id)
+        downstream_map = cls.downstream_map(requests)
+        return cls._all_downstream(lambda s_id: downstream_map.get(s_id, []), source_id)
+
+    @classmethod
+    def _all_downstream(
+        cls,
+        children_of: Callable[[Optional[str]], List[RequestTemplate]],
+        source_id: Optional[str],
+    ) -> List[RequestTemplate]:
+        downstream_requests = children_of(source_id)
         additions = []
         for x in downstream_requests:
-            additions += cls.all_downstream(requests, x.sink_id)
+            additions += cls._all_downstream(children_of, x.sink_id)
 
         return downstream_requests + additions
 
@@ -151,24 +172,41 @@ def open_tails(cls, requests: Iterable[RequestTemplate], source_id: Optional[str
         Open Tail: is defined as any node which currently holds an open request and does not have any open ones beneath
         it.
         """
-        open_downstream_requests = [
-            x for x in cls.downstream(requests, source_id) if not x.closed
-        ]
+        requests = list(requests)
+        downstream_map = cls.downstream_map(requests)
+        upstream_map: Dict[str, List[RequestTemplate]] = {}
+        for x in requests:
+            upstream_map.setdefault(x.sink_id, []).append(x)
+
+        return cls._open_tails(
+            lambda s_id: downstream_map.get(s_id, []),
+            lambda s_id: upstream_map.get(s_id, []),
+            source_id,
+        )
+
+    @classmethod
+    def _open_tails(
+        cls,
+        children_of: Callable[[Optional[str]], List[RequestTemplate]],
+        parents_of: Callable[[Optional[str]], List[RequestTemplate]],
+        source_id: Optional[str],
+    ) -> List[RequestTemplate]:
+        open_downstream_requests = [x for x in children_of(source_id) if not x.closed]
 
         # BASE CASE
         if len(open_downstream_requests) == 0:
-            open_upstreams = cls.upstream(requests, source_id)
+            open_upstreams = parents_of(source_id)
             assert len(open_upstreams) <= 1, (
                 f"There should only be one or 0 upstream request, instead there was {len(open_upstreams)}"
             )
             return [r for r in open_upstreams if not r.closed]
 
         # RECURSIVE CASE
-        return reduce(
-            lambda x, y: x + y,
-            [cls.open_tails(requests, x.sink_id) for x in open_downstream_requests],
-            [],
-        )
+        open_tails = []
+        for x in open_downstream_requests:
+            open_tails += cls._open_tails(children_of, parents_of, x.sink_id)
+
+        return open_tails
 
     @classmethod
     def children_complete(
@@ -190,9 +228,46 @@ def __init__(
     ):
         """
         Creates a new instance of a request heap with no objects present.
+
+        On top of the heap, the forest keeps incremental indexes (source_id -> requests, sink_id -> requests and the
+        open requests overall and per source_id) so that traversals do not need to scan the whole heap.
         """
         super().__init__(heap=request_heap)
 
+    def _rebuild_index(self):
+        self._by_source: Dict[Optional[str], List[str]] = {}
+        self._by_sink: Dict[str, List[str]] = {}
+        self._open: Set[str] = set()
+        self._open_by_source: Dict[Optional[str], Set[str]] = {}
+        for request in self._heap.values():
+            self._index_item(request, None)
+
+    def _index_item(self, item: RequestTemplate, previous: Optional[RequestTemplate]):
+        if previous is not None:
+            self._open.discard(previous.identifier)
+            self._open_by_source.get(previous.source_id, set()).discard(
+                previous.identifier
+            )
+            # the edge of a request should never move, but we keep the indexes honest if it does.
+            if previous.source_id != item.source_id or previous.sink_id != item.sink_id:
+                self._by_source[previous.source_id].remove(item.identifier)
+                self._by_sink[previous.sink_id].remove(item.identifier)
+                previous = None
+
+        if previous is None:
+            self._by_source.setdefault(item.source_id, []).append(item.identifier)
+            self._by_sink.setdefault(item.sink_id, []).append(item.identifier)
+
+        if not item.closed:
+            self._open.add(item.identifier)
+            self._open_by_source.setdefault(item.source_id, set()).add(item.identifier)
+
+    def _downstream(self, source_id: Optional[str]) -> List[RequestTemplate]:
+        return [self._heap[r_id] for r_id in self._by_source.get(source_id, [])]
+
+    def _upstream(self, sink_id: Optional[str]) -> List[RequestTemplate]:
+        return [self._heap[r_id] for r_id in self._by_sink.get(sink_id, [])]
+
     def __getitem__(self, item):
         with self._lock:
             try:
@@ -303,7 +378,14 @@ def children(self, parent_id: str):
         Finds all the children of the provided parent_id.
         """
         with self._lock:
-            return RequestTemplate.downstream(self._heap.values(), parent_id)
+            return self._downstream(parent_id)
+
+    def all_downstream(self, source_id: Optional[str]):
+        """
+        Collects all the downstream requests from the provided source_id. See `RequestTemplate.all_downstream`.
+        """
+        with self._lock:
+            return RequestTemplate._all_downstream(self._downstream, source_id)
 
     @classmethod
     def generate_graph(
@@ -345,7 +427,7 @@ def get_request_from_child_id(self, child_id: str):
         Via the invariants of the system. There must only be 1 request that satisfies the above requirement.
         """
         with self._lock:
-            upstreams = RequestTemplate.upstream(list(self._heap.values()), child_id)
+            upstreams = self._upstream(child_id)
             if len(upstreams) == 0:
                 raise RequestDoesNotExistError(
                     f"Request with child id {child_id} does not exist in the heap."
@@ -361,7 +443,9 @@ def open_tails(self):
         """
         # the insertion request will have a none source_id
         with self._lock:
-            o_t = RequestTemplate.open_tails(list(self._heap.values()), None)
+            if len(self._open) == 0:
+                return []
+            o_t = RequestTemplate._open_tails(self._downstream, self._upstream, None)
             return o_t
 
     def children_requests_complete(self, parent_node_id: str):
@@ -380,12 +464,8 @@ def children_requests_complete(self, parent_node_id: str):
         """
 
         with self._lock:
-            if RequestTemplate.children_complete(
-                list(self._heap.values()), parent_node_id
-            ):
-                upstreams = RequestTemplate.upstream(
-                    list(self._heap.values()), parent_node_id
-                )
+            if len(self._open_by_source.get(parent_node_id, ())) == 0:
+                upstreams = self._upstream(parent_node_id)
                 assert len(upstreams) == 1, (
                     f"Expected 1 upstream request, instead got {len(upstreams)}"
                 )
@@ -399,7 +479,8 @@ def insertion_request(self):
 
         They will be returned in the order that they were created.
         """
-        insertions = [v for v in self._heap.values() if v.source_id is None]
+        with self._lock:
+            insertions = self._downstream(None)
 
         return insertions
 
@@ -146,6 +146,8 @@ def encode_request_details(details: RequestDetails) -> dict[str, Any]:
         "total_cost": details.total_cost,
         "system_fingerprint": details.system_fingerprint,
         "latency": details.latency,
+        "retries": details.retries,
+        "hedged": details.hedged,
     }
 
 
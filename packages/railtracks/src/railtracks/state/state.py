@@ -7,6 +7,7 @@
 from ..execution.coordinator import Coordinator
 from ..execution.task import Task
 from ..pubsub.messages import (
+    ExecutionConfigurations,
     FatalFailure,
     RequestCompletionMessage,
     RequestCreation,
@@ -100,6 +101,7 @@ async def handle(self, item: RequestCompletionMessage) -> None:
                 node=item.new_node_type,
                 args=item.args,
                 kwargs=item.kwargs,
+                mode=item.running_mode,
             )
 
     def shutdown(self):
@@ -206,6 +208,7 @@ async def call_nodes(
         node: Callable[_P, Node[_TOutput]],
         args: _P.args,
         kwargs: _P.kwargs,
+        mode: ExecutionConfigurations = "async",
     ):
         """
         This function will handle the creation of the node and the subsequent running of the node returning the result.
@@ -219,6 +222,7 @@ async def call_nodes(
             node: The node you would like to create.
             args: The arguments to pass to the node.
             kwargs: The keyword arguments to pass to the node.
+            mode: The execution mode the node should be run in.
 
         Returns:
             The output of the node that was run. It will match the output type of the child node that was run.
@@ -247,7 +251,7 @@ async def call_nodes(
             self.logger.exception(rfa.to_logging_msg())
             raise e
         # you have to run this in a task so it isn't blocking other completions
-        outputs = asyncio.create_task(self._run_request(request_id))
+        outputs = asyncio.create_task(self._run_request(request_id, mode))
 
         return outputs
 
@@ -301,7 +305,9 @@ def _create_new_request_set(
 
         return request_ids
 
-    async def _run_request(self, request_id: str):
+    async def _run_request(
+        self, request_id: str, mode: ExecutionConfigurations = "async"
+    ):
         """
         Runs the request for the given request id.
 
@@ -312,14 +318,15 @@ async def _run_request(self, request_id: str):
 
         Args:
             request_id: The identifier for the request you would like to run
+            mode: The execution mode the node should be run in.
 
 
         """
         child_node_id = self._request_heap[request_id].sink_id
-        node = self._node_heap[child_node_id].node
+        node = self._node_heap.checkout(child_node_id)
         return await self.rc_coordinator.submit(
             task=Task(request_id=request_id, node=node),
-            mode="async",
+            mode=mode,
         )
 
     async def _handle_failed_request(
@@ -1,11 +1,38 @@
 from __future__ import annotations
 
 import os
-from typing import Callable, Coroutine
+from typing import Callable, Coroutine, Dict, Literal
 
 from railtracks.utils.logging.config import AllowableLogLevels, str_to_log_level
 
 
+class PoolConfig:
+    def __init__(
+        self,
+        *,
+        max_workers: int | None = None,
+        kind: Literal["thread", "process"] = "thread",
+    ):
+        """
+        PoolConfig describes a dedicated executor pool that synchronous nodes of a given type will run on.
+
+        Args:
+            max_workers (int | None): The maximum number of workers in the pool. If None, the `concurrent.futures` default is used.
+            kind (Literal["thread", "process"]): Whether the pool is made of threads or processes. Note that anything sent
+                to a process pool (the function and its arguments) must be picklable.
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        if kind not in ("thread", "process"):
+            raise ValueError(f"kind must be one of 'thread' or 'process', got {kind}")
+
+        self.max_workers = max_workers
+        self.kind = kind
+
+    def __repr__(self):
+        return f"PoolConfig(max_workers={self.max_workers}, kind={self.kind})"
+
+
 class ExecutorConfig:
     def __init__(
         self,
@@ -19,6 +46,8 @@ def __init__(
         ) = None,
         prompt_injection: bool = True,
         save_state: bool = True,
+        sync_pool_size: int | None = None,
+        node_pools: Dict[str, PoolConfig] | None = None,
     ):
         """
         ExecutorConfig is special configuration object designed to allow customization of the executor in the RT system.
@@ -31,6 +60,10 @@ def __init__(
             broadcast_callback (Callable or Coroutine): A function or coroutine that will handle streaming messages.
             prompt_injection (bool): If true, prompts can be injected with global context
             save_state (bool): If true, the state of the executor will be saved to disk.
+            sync_pool_size (int | None): The number of threads in the session's pool for synchronous nodes. If None, the
+                `concurrent.futures` default is used.
+            node_pools (Dict[str, PoolConfig] | None): Dedicated pools for specific node types, keyed by the node name.
+                Synchronous nodes with a matching name run on their own pool instead of the shared one.
         """
         self.timeout = timeout
         self.end_on_error = end_on_error
@@ -39,6 +72,8 @@ def __init__(
         self.log_file = log_file
         self.prompt_injection = prompt_injection
         self.save_state = save_state
+        self.sync_pool_size = sync_pool_size
+        self.node_pools = node_pools
 
     @property
     def logging_setting(self) -> AllowableLogLevels:
@@ -64,6 +99,8 @@ def precedence_overwritten(
         ) = None,
         prompt_injection: bool | None = None,
         save_state: bool | None = None,
+        sync_pool_size: int | None = None,
+        node_pools: Dict[str, PoolConfig] | None = None,
     ):
         """
         If any of the parameters are provided (not None), it will create a new update the current instance with the new values and return a deep copied reference to it.
@@ -84,6 +121,10 @@ def precedence_overwritten(
             if prompt_injection is not None
             else self.prompt_injection,
             save_state=save_state if save_state is not None else self.save_state,
+            sync_pool_size=sync_pool_size
+            if sync_pool_size is not None
+            else self.sync_pool_size,
+            node_pools=node_pools if node_pools is not None else self.node_pools,
         )
 
     def __repr__(self):
@@ -91,5 +132,6 @@ def __repr__(self):
             f"ExecutorConfig(timeout={self.timeout}, end_on_error={self.end_on_error}, "
             f"logging_setting={self.logging_setting}, log_file={self.log_file}, "
             f"prompt_injection={self.prompt_injection}, "
-            f"save_state={self.save_state})"
+            f"save_state={self.save_state}, sync_pool_size={self.sync_pool_size}, "
+            f"node_pools={self.node_pools})"
         )
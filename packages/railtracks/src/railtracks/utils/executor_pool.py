@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import contextvars
+import functools
+import os
+from dataclasses import dataclass
+from typing import Callable, Dict, Literal, TypeVar
+
+from .config import ExecutorConfig, PoolConfig
+
+_TOutput = TypeVar("_TOutput")
+
+
+@dataclass(frozen=True)
+class PoolDetail:
+    """
+    A point in time summary of the work an executor pool is handling.
+
+    Args:
+        kind (Literal["thread", "process"]): Whether the pool is made of threads or processes.
+        max_workers (int): The maximum number of workers in the pool.
+        running (int): The number of calls currently held by a worker.
+        queued (int): The number of calls waiting for a free worker.
+        completed (int): The number of calls that have finished over the lifetime of the pool.
+    """
+
+    kind: Literal["thread", "process"]
+    max_workers: int
+    running: int
+    queued: int
+    completed: int
+
+
+def _default_workers(kind: Literal["thread", "process"]) -> int:
+    # these mirror the defaults used by `concurrent.futures`
+    if kind == "process":
+        return os.cpu_count() or 1
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+class ExecutorPool:
+    """
+    A `concurrent.futures` executor which keeps track of how much work is waiting on it.
+
+    The underlying executor is only created once the first call is submitted. Calls are submitted from the event loop
+    so the counters are only ever touched from a single thread.
+    """
+
+    def __init__(self, config: PoolConfig):
+        self.kind = config.kind
+        self.max_workers = config.max_workers or _default_workers(config.kind)
+        self._executor: concurrent.futures.Executor | None = None
+        self._in_flight = 0
+        self._completed = 0
+
+    def _get_executor(self) -> concurrent.futures.Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.max_workers
+                )
+            else:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="railtracks-sync",
+                )
+        return self._executor
+
+    async def run(self, func: Callable[..., _TOutput], *args, **kwargs) -> _TOutput:
+        """
+        Runs the provided function on the pool and waits for the result without blocking the event loop.
+
+        For thread pools the current context variables are carried over to the worker (like `asyncio.to_thread`). For
+        process pools the function and its arguments must be picklable.
+        """
+        if self.kind == "thread":
+            call = functools.partial(
+                contextvars.copy_context().run, func, *args, **kwargs
+            )
+        else:
+            call = functools.partial(func, *args, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        self._in_flight += 1
+        try:
+            return await loop.run_in_executor(self._get_executor(), call)
+        finally:
+            self._in_flight -= 1
+            self._completed += 1
+
+    def detail(self) -> PoolDetail:
+        running = min(self._in_flight, self.max_workers)
+        return PoolDetail(
+            kind=self.kind,
+            max_workers=self.max_workers,
+            running=running,
+            queued=self._in_flight - running,
+            completed=self._completed,
+        )
+
+    def shutdown(self):
+        if self._executor is not None:
+            # any work still running belongs to a session that is closing, so we do not wait on it.
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+class ExecutorPools:
+    """
+    The collection of executor pools that a session runs its synchronous nodes on.
+
+    There is a single shared thread pool, plus a dedicated pool for every node type configured in
+    `ExecutorConfig.node_pools`. This keeps slow synchronous tools from starving the rest of the system (and the event
+    loop's default executor).
+    """
+
+    def __init__(self, executor_config: ExecutorConfig):
+        self.shared = ExecutorPool(
+            PoolConfig(max_workers=executor_config.sync_pool_size)
+        )
+        self.dedicated: Dict[str, ExecutorPool] = {
+            name: ExecutorPool(config)
+            for name, config in (executor_config.node_pools or {}).items()
+        }
+
+    def pool_for(self, node_name: str) -> ExecutorPool:
+        """Returns the pool that nodes with the given name should run on."""
+        return self.dedicated.get(node_name, self.shared)
+
+    async def run(
+        self, node_name: str, func: Callable[..., _TOutput], *args, **kwargs
+    ) -> _TOutput:
+        """Runs the function on the pool for the given node name."""
+        return await self.pool_for(node_name).run(func, *args, **kwargs)
+
+    def pool_details(self) -> Dict[str | None, PoolDetail]:
+        """
+        Collects the details of every pool. The shared pool is keyed by `None` and the dedicated pools by node name.
+        """
+        details: Dict[str | None, PoolDetail] = {None: self.shared.detail()}
+        for name, pool in self.dedicated.items():
+            details[name] = pool.detail()
+        return details
+
+    def shutdown(self):
+        self.shared.shutdown()
+        for pool in self.dedicated.values():
+            pool.shutdown()
@@ -2,7 +2,7 @@
 
 import asyncio
 import uuid
-from typing import Callable, Coroutine, Generic, List, TypeVar
+from typing import Callable, Coroutine, Generic, List, Set, TypeVar
 
 from .logging.create import get_rt_logger
 
@@ -11,6 +11,9 @@
 
 logger = get_rt_logger("Publisher")
 
+# placed on the queue by `shutdown` to wake the publisher loop and tell it to exit.
+_SHUTDOWN = object()
+
 
 class Subscriber(Generic[_T]):
     """A simple wrapper class of a callback function."""
@@ -44,15 +47,17 @@ class Publisher(Generic[_T]):
     - If you add a broadcast_callback during the operation it will handle any new messages that come in after the subscription
         took place
     - Calling the shutdown method will kill the publisher forever. You will have to make a new one after.
+    - The publisher is fully event driven. Nothing wakes up unless a message is published or the publisher is shut
+        down.
     """
 
-    timeout = 0.001
-
     def __init__(
         self,
     ):
-        self._queue: asyncio.Queue[_T] | None = None
+        self._queue: asyncio.Queue[_T | object] | None = None
         self._subscribers: List[Subscriber[_T]] = []
+        # the futures of all the listeners that are currently waiting on a message.
+        self._pending_listeners: Set[asyncio.Future[_T]] = set()
 
         self._running = False
 
@@ -90,30 +95,32 @@ async def publish(self, message: _T):
 
     async def _published_data_loop(self):
         """
-        A loop designed to be run in a thread that will continuously check for new messages in the queue and trigger
-        subscribers as they are received
+        A loop that will wait for new messages in the queue and trigger subscribers as they are received.
+
+        The loop sleeps on the queue itself and exits once it receives the shutdown sentinel.
         """
-        while self._running:
-            try:
-                message = await asyncio.wait_for(
-                    self._queue.get(), timeout=self.timeout
-                )
+        while True:
+            message = await self._queue.get()
 
-                try:
-                    contracts = [sub.trigger(message) for sub in self._subscribers]
+            if message is _SHUTDOWN:
+                break
 
-                    await asyncio.gather(*contracts)
+            try:
+                await self._dispatch(message)
 
-                # we need a broad exception clause to catch any errors that might occur in the subs.
-                except Exception:
-                    pass
+            # we need a broad exception clause to catch any errors that might occur in the subs.
+            except Exception:
+                pass
 
-                # will only reach this section after all the messages have been handled
+            # will only reach this section after all the messages have been handled
 
-            # this exception is raised when the queue is empty for `self.timeout` seconds.
-            # we do this so we can check is the self._running flag.
-            except asyncio.TimeoutError:
-                continue
+    async def _dispatch(self, message: _T):
+        """
+        Delivers a single message to all the subscribers. Subclasses can override this method to add their own routing.
+        """
+        contracts = [sub.trigger(message) for sub in self._subscribers]
+
+        await asyncio.gather(*contracts)
 
     def subscribe(
         self,
@@ -172,52 +179,55 @@ async def listener(
             listener_name: Optional name for the listener, mainly used for debugging.
         """
 
-        async def single_listener():
-            returnable_result: asyncio.Future[_T] = asyncio.Future()
-            # we are gonna use the asyncio.event system instead of threading
-            listener_event = asyncio.Event()
-
-            async def special_subscriber(message: _T):
-                nonlocal returnable_result
-                if message_filter(message):
-                    # this will trigger the end of the listener loop
-                    returnable_result.set_result(message)
-                    listener_event.set()
-                    return
-
-            sub_id = self.subscribe(
-                callback=special_subscriber,
-                name=listener_name,
+        if not self._running:
+            raise ValueError(
+                "Listener has been killed before receiving the correct message."
             )
 
-            while True:
-                try:
-                    await asyncio.wait_for(listener_event.wait(), timeout=self.timeout)
-                    break
-                except asyncio.TimeoutError:
-                    pass
+        returnable_result: asyncio.Future[_T] = (
+            asyncio.get_running_loop().create_future()
+        )
 
-                if not self._running:
-                    raise ValueError(
-                        "Listener has been killed before receiving the correct message."
-                    )
+        def special_subscriber(message: _T):
+            if not returnable_result.done() and message_filter(message):
+                # resolving the future wakes up the listener directly.
+                returnable_result.set_result(message)
 
-            unwrapped_returned_result: _T = returnable_result.result()
+        sub_id = self.subscribe(
+            callback=special_subscriber,
+            name=listener_name,
+        )
+        self._pending_listeners.add(returnable_result)
+
+        try:
+            unwrapped_returned_result: _T = await returnable_result
+        finally:
+            self._pending_listeners.discard(returnable_result)
             self.unsubscribe(sub_id)
-            return result_mapping(unwrapped_returned_result)
 
-        return await single_listener()
+        return result_mapping(unwrapped_returned_result)
 
     async def shutdown(self):
         """
         Shutdowns the publisher and halts the listener loop.
 
         Note that this will work slowly, as it will wait for the current messages in the queue to be processed before
-        shutting down.
+        shutting down. Any listener still waiting on a message after that will raise a `ValueError`.
         """
+        if self._running:
+            self._running = False
+            await self._queue.put(_SHUTDOWN)
 
-        self._running = False
-        await self.pub_loop
+        if self.pub_loop is not None:
+            await self.pub_loop
+
+        for fut in list(self._pending_listeners):
+            if not fut.done():
+                fut.set_exception(
+                    ValueError(
+                        "Listener has been killed before receiving the correct message."
+                    )
+                )
 
         return
 
@@ -1,7 +1,16 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
-from typing import TYPE_CHECKING, Callable, Optional, TypeVar, Union, overload
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Iterable,
+    Optional,
+    TypeVar,
+    Union,
+    overload,
+)
 from uuid import uuid4
 
 from .chunking.base_chunker import Chunk
@@ -81,6 +90,9 @@ def __init__(
         embedding_function: Callable[[list[str]], list[list[float]]],
         *,
         path: str,
+        embedding_batch_size: int = 256,
+        embedding_concurrency: int = 1,
+        upsert_batch_size: int = 5000,
     ) -> None: ...
 
     @overload
@@ -91,6 +103,9 @@ def __init__(
         *,
         host: str,
         port: int,
+        embedding_batch_size: int = 256,
+        embedding_concurrency: int = 1,
+        upsert_batch_size: int = 5000,
     ) -> None: ...
 
     @overload
@@ -98,6 +113,10 @@ def __init__(
         self,
         collection_name: str,
         embedding_function: Callable[[list[str]], list[list[float]]],
+        *,
+        embedding_batch_size: int = 256,
+        embedding_concurrency: int = 1,
+        upsert_batch_size: int = 5000,
     ) -> None: ...
 
     def __init__(
@@ -107,6 +126,10 @@ def __init__(
         path: Optional[str] = None,
         host: Optional[str] = None,
         port: Optional[int] = None,
+        *,
+        embedding_batch_size: int = 256,
+        embedding_concurrency: int = 1,
+        upsert_batch_size: int = 5000,
     ):
         """Create a ChromaVectorStore instance.
 
@@ -117,9 +140,28 @@ def __init__(
             path: Optional path for persistent Chroma storage.
             host: Optional HTTP host for remote Chroma.
             port: Optional HTTP port for remote Chroma.
+            embedding_batch_size: Maximum number of strings passed to
+                ``embedding_function`` in a single call.
+            embedding_concurrency: Number of embedding batches that may run at
+                the same time (on a thread pool). 1 embeds the batches one after
+                the other.
+            upsert_batch_size: Maximum number of vectors sent to Chroma in a
+                single ``upsert`` call.
         """
+        if (
+            embedding_batch_size < 1
+            or embedding_concurrency < 1
+            or upsert_batch_size < 1
+        ):
+            raise ValueError(
+                "embedding_batch_size, embedding_concurrency and upsert_batch_size must be at least 1."
+            )
+
         self._collection_name = collection_name
         self._embedding_function = embedding_function
+        self._embedding_batch_size = embedding_batch_size
+        self._embedding_concurrency = embedding_concurrency
+        self._upsert_batch_size = upsert_batch_size
 
         ChromaVectorStore.class_init(path, host, port)
         self._collection = self._chroma.get_or_create_collection(collection_name)
@@ -135,9 +177,9 @@ def upsert(self, content: OneOrMany[Chunk] | OneOrMany[str]) -> OneOrMany[str]:
         """Upsert a batch of chunks or raw strings into the collection.
 
         The method accepts a list of :class:`Chunk` instances or plain strings.
-        Each element is embedded via ``embedding_function`` and stored along
-        with metadata that always contains the original content under the
-        key defined in :data:`CONTENT`.
+        The contents are embedded via ``embedding_function`` in batches of
+        ``embedding_batch_size`` and stored along with metadata that always
+        contains the original content under the key defined in :data:`CONTENT`.
 
         Args:
             content: List of or singular chunks or strings to upsert.
@@ -146,7 +188,7 @@ def upsert(self, content: OneOrMany[Chunk] | OneOrMany[str]) -> OneOrMany[str]:
             OneOrMany[str]: Generated ids for the inserted items.
         """
         ids = []
-        embeddings = []
+        contents = []
         metadatas = []
         documents = []
         is_many = True
@@ -160,27 +202,72 @@ def upsert(self, content: OneOrMany[Chunk] | OneOrMany[str]) -> OneOrMany[str]:
 
         for item in content:
             if isinstance(item, Chunk):
-                id = item.id
-                embedding = self._embedding_function([item.content])[0]
-                metadata = item.metadata
-                metadata[CONTENT] = item.content
+                ids.append(item.id)
+                contents.append(item.content)
+                metadatas.append({**item.metadata, CONTENT: item.content})
                 documents.append(item.document)
 
             else:
-                id = str(uuid4())
-                embedding = self._embedding_function([item])[0]
-                metadata = {CONTENT: item}
+                ids.append(str(uuid4()))
+                contents.append(item)
+                metadatas.append({CONTENT: item})
                 documents.append(None)
 
-            ids.append(id)
-            embeddings.append(embedding)
-            metadatas.append(metadata)
+        embeddings = self._embed(contents)
 
-        self._collection.upsert(
-            ids=ids, embeddings=embeddings, metadatas=metadatas, documents=documents
-        )
+        for start in range(0, len(ids), self._upsert_batch_size):
+            end = start + self._upsert_batch_size
+            self._collection.upsert(
+                ids=ids[start:end],
+                embeddings=embeddings[start:end],
+                metadatas=metadatas[start:end],
+                documents=documents[start:end],
+            )
         return ids if is_many else ids[0]
 
+    def upsert_iter(
+        self,
+        content: Iterable[Chunk | str],
+        batch_size: Optional[int] = None,
+    ) -> list[str]:
+        """Upsert a (possibly very large or lazily produced) stream of chunks or strings.
+
+        Only ``batch_size`` items are held in memory at once. By default a batch
+        holds enough items to keep every concurrent embedding call busy.
+
+        Args:
+            content: An iterable of chunks or strings to upsert.
+            batch_size: The number of items to embed and upsert at a time.
+
+        Returns:
+            The ids of every upserted vector, in the order of the input.
+        """
+        if batch_size is None:
+            batch_size = self._embedding_batch_size * self._embedding_concurrency
+        return super().upsert_iter(content, batch_size)
+
+    def _embed(self, contents: list[str]) -> list[list[float]]:
+        """Embeds the contents in batches of ``embedding_batch_size``, keeping their order."""
+        batches = [
+            contents[start : start + self._embedding_batch_size]
+            for start in range(0, len(contents), self._embedding_batch_size)
+        ]
+        if self._embedding_concurrency > 1 and len(batches) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(self._embedding_concurrency, len(batches)),
+                thread_name_prefix="railtracks-embed",
+            ) as pool:
+                results = list(pool.map(self._embedding_function, batches))
+        else:
+            results = [self._embedding_function(batch) for batch in batches]
+
+        embeddings = [embedding for result in results for embedding in result]
+        if len(embeddings) != len(contents):
+            raise ValueError(
+                f"Embedding function returned {len(embeddings)} embeddings for {len(contents)} inputs."
+            )
+        return embeddings
+
     def fetch(
         self,
         ids: Optional[OneOrMany[str]] = None,
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Optional, TypeVar, Union, overload
+from itertools import islice
+from typing import Any, Callable, Iterable, Optional, TypeVar, Union, overload
 
 from .chunking.base_chunker import Chunk
 
@@ -146,6 +147,33 @@ def upsert(
         """
         pass
 
+    def upsert_iter(
+        self,
+        content: Iterable[Chunk | str],
+        batch_size: int = 1000,
+    ) -> list[str]:
+        """Upsert a (possibly very large or lazily produced) stream of chunks or strings.
+
+        The stream is consumed ``batch_size`` items at a time, and each batch is
+        passed to :meth:`upsert` before the next one is read, so only a single
+        batch is held in memory at once.
+
+        Args:
+            content: An iterable of chunks or strings to add to the vector store.
+            batch_size: The number of items to upsert at a time.
+
+        Returns:
+            The ids of every upserted vector, in the order of the input.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+
+        ids: list[str] = []
+        iterator = iter(content)
+        while batch := list(islice(iterator, batch_size)):
+            ids.extend(self.upsert(batch))
+        return ids
+
     @abstractmethod
     def fetch(self, ids: OneOrMany[str]) -> FetchResponse:
         """Fetch vectors for the given identifiers.
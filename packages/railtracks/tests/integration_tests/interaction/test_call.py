@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import asyncio
+import os
 import random
 from copy import deepcopy
 from typing import List
 
 import pytest
 import railtracks as rt
-from railtracks.exceptions import GlobalTimeOutError
+from railtracks.exceptions import ContextError, GlobalTimeOutError
 from railtracks.nodes.nodes import Node
 
 
@@ -515,3 +516,55 @@ async def test_timeout_thrower():
 
 
 # ============================================ END Many calls and Timeout tests ============================================
+
+
+def square_sum(n: int):
+    rt.context.put("worker_pid", os.getpid())
+    return sum(i * i for i in range(n)), os.getpid()
+
+
+SquareSum = rt.function_node(square_sum)
+
+
+def explode():
+    raise ValueError("bad input")
+
+
+Explode = rt.function_node(explode)
+
+
+async def nested_call():
+    return await rt.call(SquareSum, 10)
+
+
+NestedCall = rt.function_node(nested_call)
+
+
+@pytest.mark.timeout(30)
+@pytest.mark.asyncio
+@pytest.mark.parametrize("execution_mode", ["async", "thread", "process"])
+async def test_execution_modes(execution_mode):
+    with rt.Session(logging_setting="NONE", save_state=False):
+        result, pid = await rt.call(SquareSum, 1000, execution_mode=execution_mode)
+
+        assert result == sum(i * i for i in range(1000))
+        assert (pid != os.getpid()) == (execution_mode == "process")
+        assert rt.context.get("worker_pid") == pid
+
+
+@pytest.mark.timeout(30)
+@pytest.mark.asyncio
+@pytest.mark.parametrize("execution_mode", ["thread", "process"])
+async def test_execution_mode_errors_are_raised(execution_mode):
+    with rt.Session(logging_setting="NONE", save_state=False):
+        with pytest.raises(ValueError, match="bad input"):
+            await rt.call(Explode, execution_mode=execution_mode)
+
+
+@pytest.mark.timeout(30)
+@pytest.mark.asyncio
+@pytest.mark.parametrize("execution_mode", ["thread", "process"])
+async def test_execution_mode_nodes_cannot_call_nodes(execution_mode):
+    with rt.Session(logging_setting="NONE", save_state=False):
+        with pytest.raises(ContextError):
+            await rt.call(NestedCall, execution_mode=execution_mode)
@@ -1,3 +1,6 @@
+import asyncio
+import threading
+
 import pytest
 import railtracks as rt
 from typing import Generator
@@ -112,3 +115,45 @@ async def test_structured_llm_streaming(mock_llm, simple_output_model):
 
 
 
+
+
+@pytest.mark.parametrize("structured", [False, True], ids=["terminal", "structured"])
+@pytest.mark.asyncio
+async def test_streaming_llm_reads_the_stream_on_the_event_loop(
+    mock_llm, simple_output_model, monkeypatch, structured
+):
+    """The streaming LLMs await the async stream of the model instead of reading the sync one in a worker thread."""
+    llm = mock_llm(stream=True, custom_response='{"text":"hello world", "number":"42"}')
+    threads = set()
+
+    async def as_async_stream(chunks):
+        for chunk in chunks:
+            threads.add(threading.get_ident())
+            yield chunk
+
+    async def achat(messages):
+        return as_async_stream(llm._base_chat())
+
+    async def astructured(messages, schema):
+        return as_async_stream(llm._base_structured(messages, schema))
+
+    async def no_thread(*args, **kwargs):
+        raise AssertionError("the stream must not be read in a worker thread")
+
+    llm._achat = achat
+    llm._astructured = astructured
+    monkeypatch.setattr(asyncio, "to_thread", no_thread)
+
+    agent = rt.agent_node(
+        name="Streaming LLM",
+        system_message="You are a helpful assistant.",
+        llm=llm,
+        output_schema=simple_output_model if structured else None,
+    )
+
+    with rt.Session(logging_setting="NONE"):
+        response = await rt.call(agent, user_input="hello world")
+        chunks = list(response)
+
+    assert threads == {threading.get_ident()}
+    assert isinstance(chunks[-1], StructuredResponse if structured else StringResponse)
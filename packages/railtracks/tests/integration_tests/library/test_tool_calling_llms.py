@@ -1,4 +1,7 @@
 from polars import String
+import asyncio
+import threading
+
 import pytest
 import railtracks as rt
 from railtracks.built_nodes.concrete.response import StringResponse
@@ -64,6 +67,50 @@ def secret_phrase():
             
 
 
+    @pytest.mark.asyncio
+    async def test_streaming_tool_calls_read_the_stream_on_the_event_loop(
+        self, mock_llm, monkeypatch
+    ):
+        def secret_phrase():
+            return "Constantinople"
+
+        llm = mock_llm(
+            requested_tool_calls=[
+                ToolCall(name="secret_phrase", identifier="id_42424242", arguments={})
+            ],
+            stream=True,
+        )
+        threads = set()
+
+        async def as_async_stream(chunks):
+            for chunk in chunks:
+                threads.add(threading.get_ident())
+                yield chunk
+
+        async def achat_with_tools(messages, tools):
+            return as_async_stream(llm._base_chat_with_tools(messages))
+
+        async def no_thread(*args, **kwargs):
+            raise AssertionError("the stream must not be read in a worker thread")
+
+        llm._achat_with_tools = achat_with_tools
+        monkeypatch.setattr(asyncio, "to_thread", no_thread)
+
+        agent = rt.agent_node(
+            tool_nodes={rt.function_node(secret_phrase)},
+            name="Secret Phrase Maker",
+            system_message="You are a helpful assistant.",
+            llm=llm,
+        )
+
+        with rt.Session(logging_setting="NONE"):
+            response = await rt.call(agent, user_input="What is the secret phrase?")
+            chunks = list(response)
+
+        # one stream for the tool call turn and one for the final answer
+        assert threads == {threading.get_ident()}
+        assert "Constantinople" in chunks[-1].text
+
 
 class TestLimitedToolCalling:
     @pytest.mark.asyncio
@@ -76,7 +123,7 @@ def magic_number():
             return 42
 
         # ============ mock llm config =========
-        def invoke_tool(messages, tools):
+        async def invoke_tool(messages, tools):
             assert len(tools) == 1
             assert tools[0].name == "magic_number"
             tool_response = magic_number()
@@ -87,7 +134,7 @@ def invoke_tool(messages, tools):
             )
 
         llm = mock_llm()
-        llm._chat_with_tools = invoke_tool
+        llm._achat_with_tools = invoke_tool
         # =======================================
 
         agent = rt.agent_node(
@@ -163,4 +163,44 @@ async def function_returning_multiple_values():
     assert result1 == result2
     assert session1._identifier != session2._identifier
 
-# ================ END Session: Decorator Integration Tests ===============
\ No newline at end of file
+# ================ END Session: Decorator Integration Tests ===============
+
+# ================= START Session: Executor Pool Integration Tests ===============
+
+def _pid():
+    import os
+
+    return os.getpid()
+
+
+PidNode = rt.function_node(_pid, name="PID Tool")
+
+
+@pytest.mark.asyncio
+async def test_sync_nodes_run_on_session_pool():
+    with rt.Session(save_state=False, sync_pool_size=2) as sess:
+        await rt.call(E1)
+        await rt.call(E2)
+
+    details = sess.executor_pools.pool_details()
+    assert details[None].max_workers == 2
+    assert details[None].completed == 2
+
+
+@pytest.mark.asyncio
+async def test_node_type_sent_to_process_pool():
+    import os
+
+    with rt.Session(
+        save_state=False,
+        node_pools={"PID Tool": rt.PoolConfig(max_workers=1, kind="process")},
+    ) as sess:
+        pid = await rt.call(PidNode)
+        assert await rt.call(E1) == "hello world"
+
+    assert pid != os.getpid()
+    details = sess.executor_pools.pool_details()
+    assert details["PID Tool"].completed == 1
+    assert details[None].completed == 1
+
+# ================ END Session: Executor Pool Integration Tests ===============
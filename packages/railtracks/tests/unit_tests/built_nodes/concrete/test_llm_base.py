@@ -0,0 +1,57 @@
+from railtracks.built_nodes.concrete._llm_base import (
+    MessageLog,
+    MessageSnapshot,
+    RequestDetails,
+)
+from railtracks.llm import AssistantMessage, MessageHistory, UserMessage
+
+
+def test_snapshots_share_growing_history():
+    log = MessageLog()
+    history = MessageHistory([UserMessage("hi")])
+    first = log.snapshot(history)
+
+    history.append(AssistantMessage("hello"))
+    history.append(UserMessage("how are you?"))
+    second = log.snapshot(history)
+
+    assert len(log) == 3
+    assert first.new_messages == () and second.new_messages == ()
+    assert len(first) == 1 and len(second) == 3
+    assert [m.content for m in first.materialize()] == ["hi"]
+    assert [m.content for m in second.materialize()] == ["hi", "hello", "how are you?"]
+
+
+def test_snapshot_of_rewritten_history_keeps_shared_prefix():
+    log = MessageLog()
+    shared = UserMessage("hi")
+    log.snapshot(MessageHistory([shared, AssistantMessage("hello")]))
+
+    snapshot = log.snapshot(MessageHistory([shared, AssistantMessage("bye")]))
+
+    assert len(log) == 2
+    assert snapshot.offset == 1
+    assert [m.content for m in snapshot.materialize()] == ["hi", "bye"]
+
+
+def test_snapshot_is_not_affected_by_later_appends():
+    log = MessageLog()
+    history = MessageHistory([UserMessage("hi")])
+    snapshot = log.snapshot(history)
+    history.append(AssistantMessage("hello"))
+    log.snapshot(history)
+
+    assert [m.content for m in snapshot.materialize()] == ["hi"]
+
+
+def test_request_details_input_accepts_history_or_snapshot():
+    history = MessageHistory([UserMessage("hi")])
+    from_history = RequestDetails(history, None, "model", "provider")
+    from_snapshot = RequestDetails(
+        MessageLog().snapshot(history), None, "model", "provider"
+    )
+
+    assert from_history.input is history
+    assert isinstance(from_snapshot._input, MessageSnapshot)
+    assert isinstance(from_snapshot.input, MessageHistory)
+    assert [m.content for m in from_snapshot.input] == ["hi"]
@@ -2,8 +2,10 @@
 import railtracks as rt
 
 from railtracks.built_nodes.concrete.rag import (
+    RagConfig,
+    RetrievalCache,
     _prepare_messages,
-    _random_contiguous_subsequence,
+    _recent_windows,
     _parse_message_combos,
     update_context,
 )
@@ -41,19 +43,46 @@ def test_prepare_messages_list(user_msg, assistant_msg):
 
 
 # ---------------------------------------------------------
-# _random_contiguous_subsequence
+# _recent_windows
 # ---------------------------------------------------------
-def test_random_contiguous_subsequence_basic():
+def test_recent_windows_newest_first():
     seq = [("U1", "A1"), ("U2", "A2")]
-    out = _random_contiguous_subsequence(seq)
+    out = _recent_windows(seq)
 
     assert out == [
-        "U1\nA1",
-        "U1\nA1\nU2\nA2",
         "U2\nA2",
+        "U1\nA1\nU2\nA2",
+        "U1\nA1",
     ]
 
 
+def test_recent_windows_covers_every_window_when_unbounded():
+    seq = [(f"U{i}", f"A{i}") for i in range(5)]
+    expected = [
+        "\n".join(f"U{k}\nA{k}" for k in range(i, j))
+        for i in range(5)
+        for j in range(i + 1, 6)
+    ]
+    assert sorted(_recent_windows(seq)) == sorted(expected)
+
+
+def test_recent_windows_only_uses_recent_turns():
+    seq = [(f"U{i}", f"A{i}") for i in range(30)]
+    out = _recent_windows(seq, max_turns=3)
+
+    assert len(out) == 6
+    assert all("U26" not in q for q in out)
+    assert out[0] == "U29\nA29"
+
+
+def test_recent_windows_respects_query_budget():
+    seq = [(f"U{i}", f"A{i}") for i in range(30)]
+    out = _recent_windows(seq, max_turns=10, max_queries=4)
+
+    assert len(out) == 4
+    assert all("U29" in q for q in out)
+
+
 # ---------------------------------------------------------
 # _parse_message_combos
 # ---------------------------------------------------------
@@ -208,6 +237,89 @@ def fake_search(query, top_k, **kwargs):
     assert "Z" in text
 
 
+class FakeItem:
+    def __init__(self, id, content):
+        self.id = id
+        self.content = content
+
+
+def _conversation(n_turns):
+    messages = []
+    for i in range(n_turns):
+        messages.append(rt.llm.UserMessage(f"user{i}"))
+        messages.append(rt.llm.AssistantMessage(f"assistant{i}"))
+    return rt.llm.MessageHistory(messages)
+
+
+def test_update_context_uses_cache_for_seen_turns(mock_vector_store):
+    searched = []
+
+    def fake_search(query, top_k, **kwargs):
+        searched.append(list(query))
+        return [[FakeItem(q, f"CTX for {q}")] for q in query]
+
+    mock_vector_store._custom_search = fake_search
+    cache = RetrievalCache()
+
+    update_context(_conversation(3), mock_vector_store, max_turns=3, cache=cache)
+    assert len(searched[0]) == 6
+
+    # only the windows including the new turn are searched
+    out = update_context(_conversation(4), mock_vector_store, max_turns=3, cache=cache)
+    assert len(searched) == 2
+    assert len(searched[1]) == 3
+    assert all("user3" in q for q in searched[1])
+    # cached results are still injected
+    assert "CTX for user: user2\nassistant: assistant2" in out[0].content
+
+    # nothing new to search
+    update_context(_conversation(4), mock_vector_store, max_turns=3, cache=cache)
+    assert len(searched) == 2
+
+
+def test_update_context_bounds_queries(mock_vector_store):
+    searched = []
+
+    def fake_search(query, top_k, **kwargs):
+        searched.extend(query)
+        return [[] for _ in query]
+
+    mock_vector_store._custom_search = fake_search
+
+    update_context(_conversation(30), mock_vector_store, max_turns=4, max_queries=5)
+    assert len(searched) == 5
+
+
+def test_update_context_does_not_copy_messages(mock_vector_store):
+    mock_vector_store._custom_search = lambda q, top_k, **_: []
+
+    history = _conversation(2)
+    out = update_context(history, mock_vector_store)
+
+    assert out is not history
+    assert all(a is b for a, b in zip(out[1:], history))
+
+
+def test_retrieval_cache_evicts_least_recently_used():
+    cache = RetrievalCache(max_entries=2)
+    cache.set("a", 3, [1])
+    cache.set("b", 3, [2])
+    assert cache.get("a", 3) == [1]
+    cache.set("c", 3, [3])
+
+    assert cache.get("b", 3) is None
+    assert cache.get("a", 3) == [1]
+    assert cache.get("a", 5) is None
+    assert len(cache) == 2
+
+
+def test_rag_config_defaults(mock_vector_store):
+    config = RagConfig(mock_vector_store)
+    assert config.max_turns == 4
+    assert config.max_queries == 10
+    assert isinstance(config.cache, RetrievalCache)
+
+
 # ---------------------------------------------------------
 # Optional: ensure valid text separator formatting
 # ---------------------------------------------------------
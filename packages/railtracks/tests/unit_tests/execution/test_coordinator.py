@@ -4,7 +4,7 @@
 from typing import get_args
 
 from railtracks.execution.coordinator import (
-    Job, CoordinatorState, Coordinator
+    Job, CoordinatorState, Coordinator, SystemDetail
 )
 from railtracks.execution.task import Task
 from railtracks.pubsub.messages import (
@@ -58,6 +58,51 @@ def test_coordinator_state_end_job_not_found():
     state = CoordinatorState.empty()
     with pytest.raises(ValueError):
         state.end_job("not-found", "success")
+
+def test_coordinator_state_closed_jobs_are_bounded(mock_node):
+    state = CoordinatorState(max_closed_jobs=3)
+    for i in range(10):
+        state.add_job(Task(request_id=f"req-{i}", node=mock_node))
+        state.end_job(f"req-{i}", "success" if i % 2 == 0 else "failure")
+
+    assert len(state.closed_jobs) == 3
+    assert [j.request_id for j in state.job_list] == ["req-7", "req-8", "req-9"]
+    assert state.open_jobs == {}
+    assert state.succeeded == 5
+    assert state.failed == 5
+
+def test_coordinator_state_end_job_twice_raises(mock_task):
+    state = CoordinatorState.empty()
+    state.add_job(mock_task)
+    state.end_job("req-1", "success")
+    with pytest.raises(ValueError):
+        state.end_job("req-1", "success")
+
+def test_coordinator_state_detail(mock_node):
+    state = CoordinatorState.empty()
+    assert state.detail() == SystemDetail(
+        in_flight=0, succeeded=0, failed=0, latency_percentiles={}
+    )
+
+    for i in range(4):
+        state.add_job(Task(request_id=f"req-{i}", node=mock_node))
+    for i in range(3):
+        state.end_job(f"req-{i}", "success")
+        state.closed_jobs[-1].start_time = 0.0
+        state.closed_jobs[-1].end_time = float(i + 1)
+
+    detail = state.detail()
+    assert detail.in_flight == 1
+    assert detail.completed == 3
+    assert detail.latency_percentiles == {"p50": 2.0, "p90": 3.0, "p99": 3.0}
+
+def test_coordinator_state_from_job_list():
+    opened = Job("a", "n", "n", "opened", start_time=1.0)
+    closed = Job("b", "n", "n", "closed", result="failure", start_time=1.0, end_time=2.0)
+    state = CoordinatorState(job_list=[opened, closed])
+    assert state.open_jobs == {"a": opened}
+    assert list(state.closed_jobs) == [closed]
+    assert state.failed == 1
 # ============ END CoordinatorState Tests ===============
 
 # ============ START Coordinator Fixtures ===============
@@ -70,11 +115,15 @@ def mock_execution_strategy():
 
 @pytest.fixture
 def all_execution_modes(mock_execution_strategy):
-    # Provide all required execution modes
-    return {
-        mode: mock_execution_strategy
-        for mode in get_args(ExecutionConfigurations)
-    }
+    # Provide all required execution modes, the first one being the strategy under test
+    modes = {}
+    for mode in get_args(ExecutionConfigurations):
+        strat = MagicMock()
+        strat.execute = AsyncMock(return_value="exec-result")
+        strat.shutdown = MagicMock()
+        modes[mode] = strat
+    modes[get_args(ExecutionConfigurations)[0]] = mock_execution_strategy
+    return modes
 
 @pytest.fixture
 def coordinator(all_execution_modes):
@@ -113,6 +162,19 @@ def test_coordinator_handle_item_creation_failure_does_nothing(coordinator, mock
     coordinator.handle_item(msg)
     # Should not close the job
     assert coordinator.state.job_list[0].status == "opened"
+
+def test_coordinator_system_detail(coordinator, mock_task):
+    coordinator.state.add_job(mock_task)
+    assert coordinator.system_detail() is coordinator.state
+
+def test_coordinator_summary(coordinator, mock_task):
+    coordinator.state.add_job(mock_task)
+    assert coordinator.summary().in_flight == 1
+    coordinator.handle_item(RequestSuccess(request_id="req-1", node_state="dummy", result="dummy"))
+    detail = coordinator.summary()
+    assert detail.in_flight == 0
+    assert detail.succeeded == 1
+    assert set(detail.latency_percentiles) == {"p50", "p90", "p99"}
 # ============ END Coordinator Message Handling Tests ===============
 
 # ============ START Coordinator Shutdown Tests ===============
@@ -7,6 +7,7 @@ def mock_publisher():
     publisher = Mock()
     publisher.publish = AsyncMock()
     publisher.listener = AsyncMock()
+    publisher.request_listener = AsyncMock()
     return publisher
 
 
@@ -6,10 +6,8 @@
 from railtracks.exceptions import GlobalTimeOutError
 from railtracks.interaction._call import (
     _execute,
-    _regular_message_filter,
     _run,
     _start,
-    _top_level_message_filter,
     call,
 )
 from railtracks.nodes.nodes import Node
@@ -59,52 +57,6 @@ def __init__(self, error: str = "Fatal error"):
 # ============================ END Helper Classes ==============================
 
 
-# ============================ START Message Filter Tests ============================
-
-
-def test_regular_message_filter_matches_correct_request_id():
-    """Test that regular message filter correctly identifies matching request IDs."""
-    request_id = "test_request_123"
-    filter_func = _regular_message_filter(request_id)
-
-    # Test matching message
-    matching_message = MockRequestFinished(request_id, "result")
-    assert filter_func(matching_message) is True
-
-    # Test non-matching message
-    non_matching_message = MockRequestFinished("different_id", "result")
-    assert filter_func(non_matching_message) is False
-
-    # Test non-RequestFinishedBase message
-    other_message = Mock(spec=RequestCompletionMessage)
-    assert filter_func(other_message) is False
-
-
-def test_top_level_message_filter_matches_request_id_and_fatal_failure():
-    """Test that top-level message filter matches both request ID and fatal failures."""
-    request_id = "test_request_123"
-    filter_func = _top_level_message_filter(request_id)
-
-    # Test matching request ID
-    matching_message = MockRequestFinished(request_id, "result")
-    assert filter_func(matching_message) is True
-
-    # Test non-matching request ID
-    non_matching_message = MockRequestFinished("different_id", "result")
-    assert filter_func(non_matching_message) is False
-
-    # Test fatal failure (should always match)
-    fatal_failure = MockFatalFailure("Error occurred")
-    assert filter_func(fatal_failure) is True
-
-    # Test other message types
-    other_message = Mock(spec=RequestCompletionMessage)
-    assert filter_func(other_message) is False
-
-
-# ============================ END Message Filter Tests ==============================
-
-
 # ============================ START Call Function Tests ============================
 @pytest.mark.asyncio
 @patch(
@@ -129,7 +81,7 @@ async def test_call_with_no_context_creates_runner(
     assert result == "test_result"
     mock_session_class.assert_called_once()
     mock_start.assert_called_once_with(
-        mock_node, args=("arg1",), kwargs={"kwarg1": "kwarg1"}
+        mock_node, args=("arg1",), kwargs={"kwarg1": "kwarg1"}, mode="async"
     )
 
 
@@ -149,7 +101,7 @@ async def test_call_with_inactive_context_calls_start(
 
     assert result == "test_result"
     mock_start.assert_called_once_with(
-        mock_node, args=("arg1",), kwargs={"kwarg1": "kwarg1"}
+        mock_node, args=("arg1",), kwargs={"kwarg1": "kwarg1"}, mode="async"
     )
 
 
@@ -166,7 +118,7 @@ async def test_call_with_active_context_calls_run(mock_context_functions, mock_r
 
     assert result == "test_result"
     mock_run.assert_called_once_with(
-        MockNode, args=("arg1",), kwargs={"kwarg1": "kwarg1"}
+        MockNode, args=("arg1",), kwargs={"kwarg1": "kwarg1"}, mode="async"
     )
 
 
@@ -243,8 +195,8 @@ async def timeout_execute(*args, **kwargs):
 
 
 @pytest.mark.asyncio
-async def test_run_calls_execute_with_regular_filter(mock_execute):
-    """Test that _run calls _execute with the regular message filter."""
+async def test_run_calls_execute(mock_execute):
+    """Test that _run calls _execute with the provided arguments."""
     mock_node = MockNode
     mock_execute.return_value = "test_result"
 
@@ -258,8 +210,29 @@ async def test_run_calls_execute_with_regular_filter(mock_execute):
     assert call_args[0][0] == mock_node
     assert call_args[1]["args"] == ("arg1",)
     assert call_args[1]["kwargs"] == {"kwarg1": "value1"}
-    # message_filter should be _regular_message_filter
-    assert callable(call_args[1]["message_filter"])
+    assert call_args[1]["mode"] == "async"
+
+
+@pytest.mark.asyncio
+async def test_call_passes_execution_mode(mock_context_functions, mock_run):
+    """Test that the execution mode picked in call is passed down to _run."""
+    mock_context_functions["is_context_present"].return_value = True
+    mock_context_functions["is_context_active"].return_value = True
+    mock_run.return_value = "test_result"
+
+    await call(MockNode, "arg1", execution_mode="process")
+
+    mock_run.assert_called_once_with(
+        MockNode, args=("arg1",), kwargs={}, mode="process"
+    )
+
+
+@pytest.mark.asyncio
+async def test_call_rejects_unknown_execution_mode(mock_run):
+    with pytest.raises(ValueError, match="execution_mode"):
+        await call(MockNode, execution_mode="gpu")
+
+    mock_run.assert_not_called()
 
 
 # ============================ END Run Function Tests ==============================
@@ -276,10 +249,9 @@ async def test_execute_publishes_request_and_waits_for_response(full_context_set
     # Mock the listener to return the expected result
     future_result = asyncio.Future()
     future_result.set_result("execution_result")
-    full_context_setup["publisher"].listener.return_value = future_result
+    full_context_setup["publisher"].request_listener.return_value = future_result
 
-    message_filter = _regular_message_filter
-    result = await _execute(mock_node, ("arg1",), {"kwarg1": "value1"}, message_filter)
+    result = await _execute(mock_node, ("arg1",), {"kwarg1": "value1"})
 
     assert result._result == "execution_result"
 
@@ -293,8 +265,10 @@ async def test_execute_publishes_request_and_waits_for_response(full_context_set
     assert published_message.args == ("arg1",)
     assert published_message.kwargs == {"kwarg1": "value1"}
 
-    # Verify listener was set up correctly
-    full_context_setup["publisher"].listener.assert_called_once()
+    # Verify listener was set up for the published request
+    full_context_setup["publisher"].request_listener.assert_called_once()
+    listened_request_id = full_context_setup["publisher"].request_listener.call_args[0][0]
+    assert listened_request_id == published_message.new_request_id
 
 
 # ============================ END Execute Function Tests ==============================
@@ -1,8 +1,11 @@
 from typing import List, Callable, Type
 import pytest
+from litellm.litellm_core_utils.streaming_handler import CustomStreamWrapper
+from litellm.types.utils import ModelResponse, ModelResponseStream
 from pydantic import BaseModel
 import railtracks.llm as llm
-from railtracks.llm import MessageHistory, Tool, AssistantMessage, UserMessage
+from railtracks.llm import MessageHistory, ModelProvider, Tool, AssistantMessage, UserMessage
+from railtracks.llm.models._litellm_wrapper import LiteLLMWrapper
 from railtracks.llm.response import Response
 from railtracks.llm.history import MessageHistory
 
@@ -35,3 +38,88 @@ def user_response():
     return Response(message)
 
 # ====================================== END Responses ======================================
+
+
+# ====================================== START LiteLLM Stubs ======================================
+class StubLLM(LiteLLMWrapper):
+    """A LiteLLM wrapper for an OpenAI model, answered by whatever the test puts in place of `litellm.completion`."""
+
+    @classmethod
+    def model_gateway(cls):
+        return ModelProvider.OPENAI
+
+    def model_provider(self):
+        return self.model_gateway()
+
+
+class FakeStream(CustomStreamWrapper):
+    """Iterates over the given chunks without going through litellm's chunk parsing."""
+
+    def __init__(self, chunks):
+        self._hidden_params = {}
+        self.chunks = chunks
+
+    def __iter__(self):
+        return iter(self.chunks)
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+
+
+def _usage(total_tokens):
+    return {
+        "prompt_tokens": 10,
+        "completion_tokens": total_tokens - 10,
+        "total_tokens": total_tokens,
+    }
+
+
+def _make_response(content="hello", total_tokens=100):
+    response = ModelResponse(
+        choices=[{"message": {"content": content}, "finish_reason": "stop"}],
+        usage=_usage(total_tokens),
+        model="mock-model",
+    )
+    response._hidden_params["response_cost"] = 0.25
+    return response
+
+
+def _make_stream(content="hello", total_tokens=100):
+    chunks = [ModelResponseStream(choices=[{"delta": {"content": c}}]) for c in content]
+    chunks.append(ModelResponseStream(choices=[{"delta": {}, "finish_reason": "stop"}]))
+    # like openai, the usage of the request comes in a last chunk after the one finishing the stream
+    chunks.append(
+        ModelResponseStream(
+            choices=[{"delta": {}}], model="mock-model", usage=_usage(total_tokens)
+        )
+    )
+    return FakeStream(chunks)
+
+
+@pytest.fixture
+def stub_llm() -> Type[StubLLM]:
+    """
+    Fixture to provide the LiteLLM wrapper class used by tests that replace `litellm.completion`/`litellm.acompletion`.
+    """
+    return StubLLM
+
+
+@pytest.fixture
+def make_response() -> Callable[..., ModelResponse]:
+    """
+    Fixture to build litellm responses: `make_response(content="hello", total_tokens=100)`. The responses also report
+    10 prompt tokens and a cost of 0.25.
+    """
+    return _make_response
+
+
+@pytest.fixture
+def make_stream() -> Callable[..., FakeStream]:
+    """
+    Fixture to build litellm streams: `make_stream(content="hello", total_tokens=100)` streams the content one
+    character per chunk, and its final chunk reports the usage.
+    """
+    return _make_stream
+
+# ====================================== END LiteLLM Stubs ======================================
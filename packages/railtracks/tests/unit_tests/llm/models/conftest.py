@@ -6,12 +6,24 @@
 from railtracks.llm.providers import ModelProvider
 from railtracks.llm.tools import Tool, Parameter
 from railtracks.llm.models._litellm_wrapper import LiteLLMWrapper
+from railtracks.llm.retry import RetryPolicy
 
 from typing import Any, Optional, Tuple, Union
 from litellm.utils import CustomStreamWrapper, ModelResponse  # type: ignore
 import logging
 
 
+# ====================================== START Retry Delay ======================================
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    """
+    Fixture to retry failing requests right away, so the failure tests of the models don't sleep on the random
+    backoff of their default RetryPolicy.
+    """
+    monkeypatch.setattr(RetryPolicy, "delay", lambda self, retry, error=None: 0.0)
+# ====================================== END Retry Delay ======================================
+
+
 # ====================================== START Tool Fixtures ======================================
 @pytest.fixture
 def tool():
@@ -140,6 +152,9 @@ def _llm_caching_handler(self):
     def success_handler(self, *args, **kwargs):
         pass
 
+    async def async_success_handler(self, *args, **kwargs):
+        pass
+
 
 
 class MockDelta(BaseModel):
@@ -268,13 +283,24 @@ async def _astream_gen():
                                     content=char,
                                     tool_calls=self.tool_calls,
                                 ),
-                                finish_reason=(
-                                    "stop" if i == len(self.content) else ""
-                                ),
+                                finish_reason="",
                             )
                         ],
                     )
-                
+
+                yield ChatCompletionChunk(
+                    id=str(len(self.content)),
+                    choices=[
+                        MockChoice(
+                            delta=MockDelta(
+                                content=None,
+                                tool_calls=None,
+                            ),
+                            finish_reason="stop",
+                        )
+                    ],
+                )
+
                 yield ChatCompletionChunk(
                     id=str(len(self.content) + 1),
                     choices=[],
@@ -1,6 +1,8 @@
-from typing import Generator
+from typing import AsyncGenerator, Generator
 import pytest
+from types import SimpleNamespace
 from railtracks.llm.models._litellm_wrapper import (
+    StreamedToolCall,
     _parameters_to_json_schema,
     _to_litellm_tool,
 )
@@ -10,7 +12,7 @@
 from railtracks.llm.response import Response
 from json import JSONDecodeError
 import litellm
-from railtracks.llm.content import Stream
+from railtracks.llm.content import Stream, ToolCall
 import json
 
 class TestHelpers:
@@ -57,6 +59,21 @@ def test_to_litellm_tool(self, tool):
         assert litellm_tool["function"]["description"] == "This is an example tool."
         assert "parameters" in litellm_tool["function"]
 
+    def test_to_litellm_tool_is_compiled_once(self, tool, monkeypatch):
+        """
+        Test _to_litellm_tool only builds the schema once per Tool, but hands out a fresh dict every time.
+        """
+        import railtracks.llm.models._litellm_wrapper as wrapper
+
+        first = _to_litellm_tool(tool)
+        monkeypatch.setattr(
+            wrapper, "_parameters_to_json_schema", lambda p: pytest.fail("rebuilt")
+        )
+        second = _to_litellm_tool(tool)
+
+        assert first == second
+        assert first is not second
+
     # =================================== END _to_litellm_tool Tests ====================================
 
     # =================================== START _to_litellm_message Tests ==================================
@@ -99,7 +116,7 @@ def test_to_litellm_message_tool_call_list(self, mock_litellm_wrapper, tool_call
         litellm_message = wrapper._to_litellm_message(message)
         assert litellm_message["role"] == "assistant"
         assert len(litellm_message["tool_calls"]) == 1
-        assert litellm_message["tool_calls"][0].function.name == "example_tool"
+        assert litellm_message["tool_calls"][0]["function"]["name"] == "example_tool"
 
     def test_to_litellm_message_user_message_with_attachments(
         self,
@@ -186,6 +203,47 @@ async def test_chat(self, mock_litellm_wrapper, message_history, method_name, is
             assert isinstance(result.message, AssistantMessage)
             assert result.message.content == content
 
+    @pytest.mark.asyncio
+    async def test_achat_streaming(self, mock_litellm_wrapper, message_history):
+        content = "Mission: Impossible"
+        wrapper = mock_litellm_wrapper(content=content, stream=True)
+        result = await wrapper._achat(message_history)
+
+        assert isinstance(result, AsyncGenerator)
+
+        chunks = [chunk async for chunk in result]
+        assert "".join(c for c in chunks if isinstance(c, str)) == content
+        assert isinstance(chunks[-1], Response)
+        assert chunks[-1].message.content == content
+
+    @pytest.mark.asyncio
+    async def test_astructured_streaming(self, mock_litellm_wrapper, message_history):
+        class ExampleSchema(BaseModel):
+            field: str
+
+        wrapper = mock_litellm_wrapper(content='{"field": "VAL"}', stream=True)
+        result = await wrapper._astructured(message_history, schema=ExampleSchema)
+
+        chunks = [chunk async for chunk in result]
+        assert isinstance(chunks[-1], Response)
+        assert isinstance(chunks[-1].message.content, ExampleSchema)
+        assert chunks[-1].message.content.field == "VAL"
+
+    @pytest.mark.asyncio
+    async def test_achat_streaming_runs_post_hooks(
+        self, mock_litellm_wrapper, message_history
+    ):
+        wrapper = mock_litellm_wrapper(content="Hello", stream=True)
+        seen = []
+        wrapper.add_post_hook(lambda mh, r: seen.append(r) or r)
+
+        result = await wrapper.achat(message_history)
+        chunks = [chunk async for chunk in result]
+
+        assert len(seen) == 1
+        assert chunks[-1] is seen[0]
+        assert [c for c in chunks if isinstance(c, str)] == list("Hello")
+
     @pytest.mark.parametrize("method_name,is_async,stream", [
         ("_structured", False, False),
         ("_astructured", True, False),
@@ -323,4 +381,127 @@ async def test_chat_with_tools(
             assert calls[0].arguments == {"foo": 1}
             assert calls[0].identifier == "id123"
 
-# ================= END completion methods tests =========================
\ No newline at end of file
+# ================= END completion methods tests =========================
+
+
+# ================= START stream accumulation tests =========================
+
+
+def _chunk(content=None, tool_calls=None, finish_reason=None):
+    delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+    return SimpleNamespace(
+        choices=[SimpleNamespace(delta=delta, finish_reason=finish_reason)]
+    )
+
+
+def _call_delta(index, id=None, name=None, arguments=None):
+    return SimpleNamespace(
+        index=index, id=id, function=SimpleNamespace(name=name, arguments=arguments)
+    )
+
+
+def _stream(chunks):
+    return [*chunks, _chunk(finish_reason="stop"), _chunk()]
+
+
+def test_streamed_tool_call_buffers_fragments():
+    streamed = StreamedToolCall(
+        tool=ToolCall(identifier="1", name="t", arguments={}), args=""
+    )
+    for fragment in ['{"a"', ": ", "[1, ", "2]}"]:
+        streamed.append(fragment)
+
+    assert streamed.args == '{"a": [1, 2]}'
+    streamed.load_args()
+    assert streamed.tool.arguments == {"a": [1, 2]}
+
+
+def test_streamed_tool_call_without_arguments():
+    streamed = StreamedToolCall(tool=ToolCall(identifier="1", name="t", arguments={}))
+    assert streamed.args is None
+    streamed.load_args()
+    assert streamed.tool.arguments == {}
+
+
+def test_stream_handler_joins_long_content(mock_litellm_wrapper):
+    wrapper = mock_litellm_wrapper(stream=True)
+    pieces = [f"token{i} " for i in range(5000)]
+
+    out = list(wrapper._stream_handler_base(_stream(_chunk(p) for p in pieces), 0.0))
+
+    assert out[:-1] == pieces
+    assert out[-1].message.content == "".join(pieces)
+
+
+def test_stream_handler_accumulates_parallel_tool_calls(mock_litellm_wrapper):
+    wrapper = mock_litellm_wrapper(stream=True)
+    chunks = [
+        # the first fragment of the arguments comes along with the start of the call
+        _chunk(tool_calls=[_call_delta(0, id="a", name="first", arguments='{"x": ')]),
+        _chunk(
+            tool_calls=[
+                _call_delta(0, arguments="1}"),
+                _call_delta(1, id="b", name="second"),
+            ]
+        ),
+        _chunk(tool_calls=[_call_delta(1, arguments='{"y": "')]),
+        _chunk(tool_calls=[_call_delta(1, arguments='two"}')]),
+    ]
+
+    response = list(wrapper._stream_handler_base(_stream(chunks), 0.0))[-1]
+
+    calls = response.message.content
+    assert [(c.identifier, c.name, c.arguments) for c in calls] == [
+        ("a", "first", {"x": 1}),
+        ("b", "second", {"y": "two"}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_stream_handler_joins_content(mock_litellm_wrapper):
+    wrapper = mock_litellm_wrapper(stream=True)
+
+    class AsyncChunks:
+        def __init__(self, chunks):
+            self.chunks = chunks
+
+        async def __aiter__(self):
+            for chunk in self.chunks:
+                yield chunk
+
+    out = [
+        c
+        async for c in wrapper._astream_handler_base(
+            AsyncChunks(_stream([_chunk("a"), _chunk("b")])), 0.0
+        )
+    ]
+    assert out[-1].message.content == "ab"
+
+
+# ================= END stream accumulation tests =========================
+
+
+# ================= START message conversion cache tests =========================
+def test_prepare_request_reuses_converted_messages(
+    mock_litellm_wrapper, message_history, monkeypatch
+):
+    wrapper = mock_litellm_wrapper()
+    converted = []
+    to_litellm_message = type(wrapper)._to_litellm_message
+
+    def counting(self, msg):
+        converted.append(msg)
+        return to_litellm_message(self, msg)
+
+    monkeypatch.setattr(type(wrapper), "_to_litellm_message", counting)
+
+    first = wrapper._prepare_request(message_history)["messages"]
+    message_history.append(UserMessage("And one more thing"))
+    second = mock_litellm_wrapper()._prepare_request(message_history)["messages"]
+
+    assert second[: len(first)] == first
+    assert second[-1] == {"role": "user", "content": "And one more thing"}
+    assert converted == list(message_history)
+
+
+# ================= END message conversion cache tests =========================
@@ -36,3 +36,87 @@ def test_multiline_hist_string():
         str(message_hist)
         == "user: What is going on in this beautiful world?\nassistant: Nothing much as of now"
     )
+
+
+def _counting_renderer():
+    rendered = []
+
+    def render(message):
+        rendered.append(message)
+        return {"role": message.role.value, "content": message.content}
+
+    return render, rendered
+
+
+def test_render_only_converts_new_messages():
+    render, rendered = _counting_renderer()
+    message_hist = rt.llm.MessageHistory([rt.llm.UserMessage("Hello")])
+
+    assert message_hist.render(render) == [{"role": "user", "content": "Hello"}]
+
+    message_hist.append(rt.llm.AssistantMessage("Hi there!"))
+    copied = rt.llm.MessageHistory(message_hist)
+    assert copied.render(render) == [
+        {"role": "user", "content": "Hello"},
+        {"role": "assistant", "content": "Hi there!"},
+    ]
+    assert rendered == list(message_hist)
+
+
+def test_render_returns_copies():
+    render, _ = _counting_renderer()
+    message_hist = rt.llm.MessageHistory([rt.llm.UserMessage("Hello")])
+
+    message_hist.render(render)[0]["content"] = "altered"
+
+    assert message_hist.render(render) == [{"role": "user", "content": "Hello"}]
+
+
+def test_render_keys_are_separate():
+    message_hist = rt.llm.MessageHistory([rt.llm.UserMessage("Hello")])
+
+    assert message_hist.render(lambda m: {"n": 1}, key="a") == [{"n": 1}]
+    assert message_hist.render(lambda m: {"n": 2}, key="b") == [{"n": 2}]
+    assert message_hist.render(lambda m: {"n": 3}, key="a") == [{"n": 1}]
+
+
+def test_render_after_fill_prompt():
+    render, rendered = _counting_renderer()
+    message = rt.llm.UserMessage("Hello {name}")
+    message_hist = rt.llm.MessageHistory([message])
+    message_hist.render(render)
+
+    message.fill_prompt({"name": "world"})
+
+    assert message_hist.render(render) == [{"role": "user", "content": "Hello world"}]
+    assert len(rendered) == 2
+
+
+def test_render_returns_deep_copies():
+    message_hist = rt.llm.MessageHistory([rt.llm.UserMessage("Hello")])
+    render = lambda m: {"content": [{"type": "text", "text": m.content}]}  # noqa: E731
+
+    message_hist.render(render)[0]["content"][0]["text"] = "altered"
+    message_hist.render(render)[0]["content"].append({"type": "image_url"})
+
+    assert message_hist.render(render) == [
+        {"content": [{"type": "text", "text": "Hello"}]}
+    ]
+
+
+def test_render_after_tool_call_assigned():
+    rendered = []
+
+    def render(message):
+        rendered.append(message)
+        return {"calls": [dict(t.arguments) for t in message.content]}
+
+    tool_call = rt.llm.ToolCall(identifier="1", name="add", arguments={"a": 1})
+    message_hist = rt.llm.MessageHistory([rt.llm.AssistantMessage([tool_call])])
+    message_hist.render(render)
+    message_hist.render(render)
+
+    tool_call.arguments = {"a": 2}
+
+    assert message_hist.render(render) == [{"calls": [{"a": 2}]}]
+    assert len(rendered) == 2
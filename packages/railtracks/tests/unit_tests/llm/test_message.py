@@ -56,6 +56,21 @@ def test_tool_message():
     assert message.content.identifier == "123"
 
 
+
+def test_revision_counts_content_changes():
+    user_message = UserMessage("Hello {name}")
+    tool_call = ToolCall(name="tool1", identifier="123", arguments={})
+    assistant_message = AssistantMessage([tool_call])
+    revisions = (user_message.revision, assistant_message.revision)
+
+    user_message.fill_prompt({"name": "world"})
+    tool_call.name = "tool2"
+
+    assert user_message.revision > revisions[0]
+    assert assistant_message.revision > revisions[1]
+    # the counter is not part of the tool call itself
+    assert tool_call == ToolCall(name="tool2", identifier="123", arguments={})
+
 @pytest.mark.parametrize(
     "invalid_content, expected_exception",
     [
@@ -65,6 +65,17 @@ def test_simple_message_with_post_hook(mock_llm):
 
     assert response.message.content == hello_world.upper()
 
+def test_copy_with_hooks_isolates_hooks(mock_llm):
+    model = mock_llm("Hello world")
+    model.add_post_hook(lambda x, y: Response(AssistantMessage(y.message.content.upper())))
+
+    copied = model.copy_with_hooks()
+    copied.add_post_hook(lambda x, y: Response(AssistantMessage(y.message.content + "!")))
+    mess_hist = MessageHistory([UserMessage("Say hello")])
+
+    assert copied.chat(mess_hist).message.content == "HELLO WORLD!"
+    assert model.chat(mess_hist).message.content == "HELLO WORLD"
+
 def test_simple_message_with_multiple_post_hook(mock_llm):
     hello_world = "Hello world"
 
@@ -0,0 +1,305 @@
+import asyncio
+import contextvars
+import threading
+import time
+
+import litellm
+import pytest
+import railtracks.context.central as central
+from railtracks.llm import (
+    MessageHistory,
+    ModelProvider,
+    RateLimiter,
+    UserMessage,
+    clear_rate_limits,
+    get_rate_limiter,
+    remove_rate_limit,
+    set_rate_limit,
+)
+from railtracks.llm.rate_limit import estimate_tokens
+
+
+@pytest.fixture(autouse=True)
+def no_rate_limits():
+    clear_rate_limits()
+    yield
+    clear_rate_limits()
+
+
+@pytest.fixture
+def fake_session(monkeypatch):
+    """Makes `session_id` return the value of a context variable, so every task can pretend to be in a session."""
+    current = contextvars.ContextVar("session", default=None)
+    monkeypatch.setattr(central, "session_id", lambda: current.get())
+    return current
+
+
+# ================= Limiter =================
+
+
+def test_requests_per_minute_bucket():
+    limiter = RateLimiter(requests_per_minute=600)
+    limiter._requests.level = 0
+
+    start = time.monotonic()
+    with limiter.acquire():
+        pass
+    # the bucket refills 10 requests per second
+    assert time.monotonic() - start >= 0.09
+
+
+def test_burst_up_to_the_budget_is_not_delayed():
+    limiter = RateLimiter(requests_per_minute=100)
+    start = time.monotonic()
+    for _ in range(100):
+        with limiter.acquire():
+            pass
+    assert time.monotonic() - start < 0.5
+
+
+def test_tokens_per_minute_bucket():
+    limiter = RateLimiter(tokens_per_minute=6000)
+    with limiter.acquire(tokens=5000):
+        pass
+    assert limiter._tokens.level == pytest.approx(1000, abs=5)
+
+    start = time.monotonic()
+    with limiter.acquire(tokens=1100):
+        pass
+    # 100 tokens were missing, the bucket refills 100 tokens per second
+    assert time.monotonic() - start >= 0.09
+
+
+def test_requests_larger_than_the_budget_are_admitted():
+    limiter = RateLimiter(tokens_per_minute=100)
+    with limiter.acquire(tokens=10_000):
+        pass
+
+
+def test_record_usage_corrects_the_budget():
+    limiter = RateLimiter(tokens_per_minute=6000)
+    with limiter.acquire(tokens=100):
+        pass
+    limiter.record_usage(estimated=100, actual=2100)
+    assert limiter._tokens.level == pytest.approx(3900, abs=5)
+
+
+def test_max_concurrency_with_threads():
+    limiter = RateLimiter(max_concurrency=2)
+    peak = 0
+    lock = threading.Lock()
+
+    def work():
+        nonlocal peak
+        with limiter.acquire():
+            with lock:
+                peak = max(peak, limiter.in_flight)
+            time.sleep(0.01)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert peak == 2
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency_with_tasks():
+    limiter = RateLimiter(max_concurrency=3)
+    peak = 0
+
+    async def work():
+        nonlocal peak
+        async with limiter.aacquire():
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(work() for _ in range(10)))
+    assert peak == 3
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_sessions_take_turns(fake_session):
+    limiter = RateLimiter(max_concurrency=1)
+    order = []
+
+    async def work(name):
+        async with limiter.aacquire():
+            order.append(name)
+            await asyncio.sleep(0.001)
+
+    async def in_session(session, name):
+        fake_session.set(session)
+        await work(name)
+
+    async with limiter.aacquire():
+        tasks = []
+        for session, name in [("a", "a1"), ("a", "a2"), ("a", "a3"), ("b", "b1")]:
+            tasks.append(asyncio.create_task(in_session(session, name)))
+            await asyncio.sleep(0)
+
+    await asyncio.gather(*tasks)
+    assert order == ["a1", "b1", "a2", "a3"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_the_queue():
+    limiter = RateLimiter(max_concurrency=1)
+
+    async def wait():
+        async with limiter.aacquire():
+            pass
+
+    async with limiter.aacquire():
+        waiter = asyncio.create_task(wait())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    assert not limiter._queues
+    async with limiter.aacquire():
+        pass
+
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        RateLimiter(requests_per_minute=0)
+    with pytest.raises(ValueError):
+        RateLimiter(max_concurrency=0)
+
+
+# ================= Registry =================
+
+
+def test_model_limit_overrides_provider_limit():
+    provider_limiter = set_rate_limit(ModelProvider.OPENAI, requests_per_minute=10)
+    model_limiter = set_rate_limit(
+        ModelProvider.OPENAI, "gpt-4o", requests_per_minute=5
+    )
+
+    assert get_rate_limiter(ModelProvider.OPENAI, "gpt-4o") is model_limiter
+    assert get_rate_limiter(ModelProvider.OPENAI, "gpt-4o-mini") is provider_limiter
+    assert get_rate_limiter(ModelProvider.ANTHROPIC, "claude") is None
+
+    remove_rate_limit(ModelProvider.OPENAI, "gpt-4o")
+    assert get_rate_limiter(ModelProvider.OPENAI, "gpt-4o") is provider_limiter
+
+
+def test_estimate_tokens():
+    short = estimate_tokens([{"role": "user", "content": "hi"}])
+    long = estimate_tokens([{"role": "user", "content": "hi " * 100}])
+    with_tools = estimate_tokens(
+        [{"role": "user", "content": "hi"}],
+        tools=[{"type": "function", "function": {"name": "lookup"}}],
+    )
+    assert 0 < short < long
+    assert with_tools > short
+
+
+# ================= Model integration =================
+
+
+def test_model_calls_are_limited(monkeypatch, stub_llm, make_response):
+    limiter = set_rate_limit(
+        ModelProvider.OPENAI, "gpt-4o", max_concurrency=1, tokens_per_minute=60_000
+    )
+    seen_in_flight = []
+
+    def fake_completion(**kwargs):
+        seen_in_flight.append(limiter.in_flight)
+        return make_response()
+
+    monkeypatch.setattr(litellm, "completion", fake_completion)
+    stub_llm("gpt-4o").chat(MessageHistory([UserMessage("hi")]))
+
+    assert seen_in_flight == [1]
+    assert limiter.in_flight == 0
+    # the whole 100 tokens of usage were taken from the budget
+    assert limiter._tokens.level == pytest.approx(59_900, abs=5)
+
+
+@pytest.mark.asyncio
+async def test_async_model_calls_are_limited(monkeypatch, stub_llm, make_response):
+    limiter = set_rate_limit(ModelProvider.OPENAI, max_concurrency=2)
+    peak = 0
+
+    async def fake_acompletion(**kwargs):
+        nonlocal peak
+        peak = max(peak, limiter.in_flight)
+        await asyncio.sleep(0.01)
+        return make_response()
+
+    monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+    model = stub_llm("gpt-4o")
+    await asyncio.gather(
+        *(model.achat(MessageHistory([UserMessage("hi")])) for _ in range(6))
+    )
+
+    assert peak == 2
+
+
+def test_unlimited_models_are_not_affected(monkeypatch, stub_llm, make_response):
+    set_rate_limit(ModelProvider.ANTHROPIC, max_concurrency=1)
+    monkeypatch.setattr(litellm, "completion", lambda **kwargs: make_response())
+
+    response = stub_llm("gpt-4o").chat(MessageHistory([UserMessage("hi")]))
+    assert response.message.content == "hello"
+
+
+def test_streams_hold_their_slot_until_read(monkeypatch, stub_llm, make_stream):
+    limiter = set_rate_limit(
+        ModelProvider.OPENAI, max_concurrency=1, tokens_per_minute=60_000
+    )
+    monkeypatch.setattr(litellm, "completion", lambda **kwargs: make_stream("ab"))
+
+    stream = stub_llm("gpt-4o", stream=True).chat(MessageHistory([UserMessage("hi")]))
+    assert limiter.in_flight == 1
+
+    chunks = list(stream)
+    assert [chunk for chunk in chunks if isinstance(chunk, str)] == ["a", "b"]
+    assert limiter.in_flight == 0
+    # the usage of the final chunk was taken from the budget
+    assert limiter._tokens.level == pytest.approx(59_900, abs=5)
+
+
+def test_dropped_streams_release_their_slot(monkeypatch, stub_llm, make_stream):
+    limiter = set_rate_limit(ModelProvider.OPENAI, max_concurrency=1)
+    monkeypatch.setattr(litellm, "completion", lambda **kwargs: make_stream("a"))
+    model = stub_llm("gpt-4o", stream=True)
+
+    stream = model.chat(MessageHistory([UserMessage("hi")]))
+    next(stream)
+    del stream
+
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_async_streams_cap_concurrency(monkeypatch, stub_llm, make_stream):
+    limiter = set_rate_limit(ModelProvider.OPENAI, max_concurrency=2)
+    reading = peak = 0
+
+    async def fake_acompletion(**kwargs):
+        return make_stream("ab")
+
+    async def read(model):
+        nonlocal reading, peak
+        stream = await model.achat(MessageHistory([UserMessage("hi")]))
+        reading += 1
+        peak = max(peak, reading)
+        async for _ in stream:
+            await asyncio.sleep(0.01)
+        reading -= 1
+
+    monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+    model = stub_llm("gpt-4o", stream=True)
+    await asyncio.gather(*(read(model) for _ in range(6)))
+
+    # only two streams are read at the same time, the others wait for their slot
+    assert peak == 2
+    assert limiter.in_flight == 0
@@ -0,0 +1,220 @@
+import time
+
+import litellm
+import pytest
+from pydantic import BaseModel
+from railtracks.llm import (
+    InMemoryResponseCache,
+    MessageHistory,
+    SQLiteResponseCache,
+    UserMessage,
+)
+
+
+class Answer(BaseModel):
+    value: int
+
+
+@pytest.fixture
+def completions(monkeypatch, make_response, make_stream):
+    calls = []
+
+    def fake_completion(**kwargs):
+        calls.append(kwargs)
+        if kwargs["stream"]:
+            return make_stream()
+        if "response_format" in kwargs:
+            return make_response('{"value": 3}')
+        return make_response()
+
+    async def fake_acompletion(**kwargs):
+        return fake_completion(**kwargs)
+
+    monkeypatch.setattr(litellm, "completion", fake_completion)
+    monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+    return calls
+
+
+@pytest.fixture
+def history():
+    return MessageHistory([UserMessage("hi")])
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryResponseCache(max_entries=2)
+    return SQLiteResponseCache(tmp_path / "responses.db", max_entries=2)
+
+
+# ================= Cache backends =================
+
+
+def test_key_is_canonical():
+    a = InMemoryResponseCache.key(
+        model="m", messages=[{"role": "user", "content": "x"}]
+    )
+    b = InMemoryResponseCache.key(
+        messages=[{"content": "x", "role": "user"}], model="m"
+    )
+    c = InMemoryResponseCache.key(
+        model="m", messages=[{"role": "user", "content": "y"}]
+    )
+    assert a == b
+    assert a != c
+
+
+def test_key_includes_response_format():
+    assert InMemoryResponseCache.key(
+        model="m", response_format=Answer
+    ) != InMemoryResponseCache.key(model="m")
+
+
+def test_get_set_and_counters(cache):
+    assert cache.get("a") is None
+    cache.set("a", {"x": 1})
+    assert cache.get("a") == {"x": 1}
+    assert cache.stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+    cache.reset_stats()
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_hits_are_copies(cache):
+    cache.set("a", [1, 2])
+    cache.get("a").append(3)
+    assert cache.get("a") == [1, 2]
+
+
+def test_size_eviction_is_lru(cache):
+    cache.set("a", 1)
+    time.sleep(0.01)
+    cache.set("b", 2)
+    time.sleep(0.01)
+    assert cache.get("a") == 1
+    time.sleep(0.01)
+    cache.set("c", 3)
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_expiry(cache):
+    cache.ttl = 0.05
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    time.sleep(0.1)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_clear(cache):
+    cache.set("a", 1)
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_sqlite_cache_persists(tmp_path, make_response):
+    cache = SQLiteResponseCache(tmp_path / "responses.db")
+    cache.set("a", make_response())
+    cache.close()
+
+    reopened = SQLiteResponseCache(tmp_path / "responses.db")
+    assert reopened.get("a").choices[0].message.content == "hello"
+
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        InMemoryResponseCache(max_entries=-1)
+    with pytest.raises(ValueError):
+        InMemoryResponseCache(ttl=0)
+
+
+# ================= Model integration =================
+
+
+def test_chat_is_replayed_from_cache(completions, history, stub_llm):
+    model = stub_llm("mock-model")
+    model.set_cache(InMemoryResponseCache())
+
+    first = model.chat(history)
+    second = model.chat(history)
+
+    assert len(completions) == 1
+    assert second.message.content == first.message.content == "hello"
+    info = second.message_info
+    assert (info.input_tokens, info.output_tokens, info.total_cost) == (10, 90, 0.25)
+    assert model.cache.stats()["hits"] == 1
+
+
+def test_different_requests_are_not_shared(completions, history, stub_llm):
+    model = stub_llm("mock-model")
+    model.set_cache(InMemoryResponseCache())
+
+    model.chat(history)
+    model.chat(MessageHistory([UserMessage("something else")]))
+    model.structured(history, Answer)
+    other_model = stub_llm("other-model")
+    other_model.set_cache(model.cache)
+    other_model.chat(history)
+
+    assert len(completions) == 4
+
+
+def test_structured_is_replayed_from_cache(completions, history, stub_llm):
+    model = stub_llm("mock-model")
+    model.set_cache(InMemoryResponseCache())
+
+    model.structured(history, Answer)
+    response = model.structured(history, Answer)
+
+    assert len(completions) == 1
+    assert response.message.content == Answer(value=3)
+
+
+def test_stream_is_replayed_from_cache(completions, history, stub_llm):
+    model = stub_llm("mock-model", stream=True)
+    model.set_cache(InMemoryResponseCache())
+
+    first = list(model.chat(history))
+    second = list(model.chat(history))
+
+    assert len(completions) == 1
+    assert [c for c in second if isinstance(c, str)] == list("hello")
+    assert second[-1].message.content == first[-1].message.content == "hello"
+
+
+@pytest.mark.asyncio
+async def test_async_stream_is_replayed_from_cache(completions, history, stub_llm):
+    model = stub_llm("mock-model", stream=True)
+    model.set_cache(InMemoryResponseCache())
+
+    for _ in range(2):
+        chunks = [c async for c in await model.achat(history)]
+        assert chunks[-1].message.content == "hello"
+
+    assert len(completions) == 1
+
+
+@pytest.mark.asyncio
+async def test_achat_is_replayed_from_cache(completions, history, stub_llm):
+    model = stub_llm("mock-model")
+    model.set_cache(InMemoryResponseCache())
+
+    await model.achat(history)
+    response = await model.achat(history)
+
+    assert len(completions) == 1
+    assert response.message.content == "hello"
+
+
+def test_without_cache_every_call_goes_to_the_provider(completions, history, stub_llm):
+    model = stub_llm("mock-model")
+    model.chat(history)
+    model.set_cache(InMemoryResponseCache())
+    model.remove_cache()
+    model.chat(history)
+
+    assert len(completions) == 2
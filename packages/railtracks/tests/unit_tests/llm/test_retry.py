@@ -0,0 +1,319 @@
+import asyncio
+import copy
+import pickle
+import threading
+import time
+
+import httpx
+import litellm
+import pytest
+import railtracks as rt
+from railtracks.llm import (
+    MessageHistory,
+    ModelProvider,
+    UserMessage,
+    remove_rate_limit,
+    set_rate_limit,
+)
+from railtracks.llm.models._litellm_wrapper import _hedge_executor
+from railtracks.llm.retry import RetryPolicy
+from railtracks.state.serialize import encode_request_details
+
+
+def rate_limit_error(headers=None):
+    response = httpx.Response(
+        429, headers=headers or {}, request=httpx.Request("POST", "https://x")
+    )
+    return litellm.RateLimitError(
+        "slow down", llm_provider="openai", model="m", response=response
+    )
+
+
+def bad_request_error():
+    return litellm.BadRequestError("bad", model="m", llm_provider="openai")
+
+
+@pytest.fixture
+def history():
+    return MessageHistory([UserMessage("hi")])
+
+
+@pytest.fixture
+def fast_policy():
+    return RetryPolicy(max_retries=3, initial_delay=0.001, max_delay=0.001)
+
+
+def failing_completion(errors, reply):
+    """A fake litellm.completion raising the given errors (one per call) before replying."""
+    calls = []
+
+    def fake(**kwargs):
+        calls.append(kwargs)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return reply
+
+    fake.calls = calls
+    return fake
+
+
+# ================= Policy =================
+
+
+@pytest.mark.parametrize(
+    "error, retryable",
+    [
+        (rate_limit_error(), True),
+        (litellm.Timeout("t", model="m", llm_provider="openai"), True),
+        (litellm.APIConnectionError("c", llm_provider="openai", model="m"), True),
+        (litellm.InternalServerError("i", llm_provider="openai", model="m"), True),
+        (bad_request_error(), False),
+        (litellm.AuthenticationError("a", llm_provider="openai", model="m"), False),
+        (ValueError("not an api error"), False),
+    ],
+)
+def test_is_retryable(error, retryable):
+    assert RetryPolicy.is_retryable(error) is retryable
+
+
+def test_delay_has_jitter_within_the_backoff_ceiling():
+    policy = RetryPolicy(initial_delay=1.0, multiplier=2.0, max_delay=5.0)
+    delays = [policy.delay(2) for _ in range(200)]
+    assert all(0 <= d <= 4.0 for d in delays)
+    assert len(set(delays)) > 1
+    assert all(policy.delay(10) <= 5.0 for _ in range(50))
+
+
+@pytest.mark.parametrize(
+    "headers, expected",
+    [
+        ({"retry-after": "3"}, 3.0),
+        ({"retry-after-ms": "1500"}, 1.5),
+        ({"retry-after": "120"}, 60.0),
+    ],
+)
+def test_delay_honors_retry_after(headers, expected):
+    policy = RetryPolicy(max_retry_after=60.0)
+    assert policy.delay(0, rate_limit_error(headers)) == expected
+
+
+def test_hedge_delay_uses_latency_quantile():
+    policy = RetryPolicy(hedge=True, hedge_min_samples=10)
+    for latency in range(9):
+        policy.observe_latency(latency)
+    assert policy.hedge_delay() is None
+
+    for latency in range(9, 100):
+        policy.observe_latency(latency)
+    assert policy.hedge_delay() == 95
+
+    assert RetryPolicy(hedge=True, hedge_after=0.2).hedge_delay() == 0.2
+    assert RetryPolicy().hedge_delay() is None
+
+
+# ================= Model integration =================
+
+
+def test_transient_errors_are_retried(
+    monkeypatch, history, fast_policy, stub_llm, make_response
+):
+    fake = failing_completion([rate_limit_error(), rate_limit_error()], make_response())
+    monkeypatch.setattr(litellm, "completion", fake)
+    model = stub_llm("gpt-4o")
+    model.set_retry_policy(fast_policy)
+
+    response = model.chat(history)
+
+    assert response.message.content == "hello"
+    assert len(fake.calls) == 3
+    assert response.message_info.retries == 2
+    assert response.message_info.hedged is False
+
+
+def test_retries_give_up_after_max_retries(
+    monkeypatch, history, fast_policy, stub_llm, make_response
+):
+    fake = failing_completion([rate_limit_error()] * 10, make_response())
+    monkeypatch.setattr(litellm, "completion", fake)
+    model = stub_llm("gpt-4o")
+    model.set_retry_policy(fast_policy)
+
+    with pytest.raises(litellm.RateLimitError):
+        model.chat(history)
+    assert len(fake.calls) == 4
+
+
+def test_permanent_errors_are_not_retried(
+    monkeypatch, history, fast_policy, stub_llm, make_response
+):
+    fake = failing_completion([bad_request_error()], make_response())
+    monkeypatch.setattr(litellm, "completion", fake)
+    model = stub_llm("gpt-4o")
+    model.set_retry_policy(fast_policy)
+
+    with pytest.raises(litellm.BadRequestError):
+        model.chat(history)
+    assert len(fake.calls) == 1
+
+
+def test_no_policy_sends_once(monkeypatch, history, stub_llm, make_response):
+    fake = failing_completion([rate_limit_error()], make_response())
+    monkeypatch.setattr(litellm, "completion", fake)
+    model = stub_llm("gpt-4o")
+    model.set_retry_policy(None)
+
+    with pytest.raises(litellm.RateLimitError):
+        model.chat(history)
+    assert len(fake.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_transient_errors_are_retried(
+    monkeypatch, history, fast_policy, stub_llm, make_response
+):
+    fake = failing_completion([rate_limit_error()], make_response())
+
+    async def fake_acompletion(**kwargs):
+        return fake(**kwargs)
+
+    monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+    model = stub_llm("gpt-4o")
+    model.set_retry_policy(fast_policy)
+
+    response = await model.achat(history)
+    assert response.message_info.retries == 1
+
+
+def test_slow_request_is_hedged(monkeypatch, history, stub_llm, make_response):
+    calls = []
+    lock = threading.Lock()
+
+    def fake_completion(**kwargs):
+        with lock:
+            calls.append(kwargs)
+            first = len(calls) == 1
+        if first:
+            time.sleep(0.5)
+            return make_response("slow")
+        return make_response("fast")
+
+    monkeypatch.setattr(litellm, "completion", fake_completion)
+    model = stub_llm("gpt-4o")
+    model.set_retry_policy(RetryPolicy(hedge=True, hedge_after=0.05))
+
+    start = time.monotonic()
+    response = model.chat(history)
+
+    assert time.monotonic() - start < 0.4
+    assert response.message.content == "fast"
+    assert response.message_info.hedged is True
+    assert len(calls) == 2
+
+
+def test_fast_request_is_not_hedged(monkeypatch, history, stub_llm, make_response):
+    fake = failing_completion([], make_response())
+    monkeypatch.setattr(litellm, "completion", fake)
+    model = stub_llm("gpt-4o")
+    model.set_retry_policy(RetryPolicy(hedge=True, hedge_after=1.0))
+
+    response = model.chat(history)
+    assert response.message_info.hedged is False
+    assert len(fake.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_slow_request_is_hedged_and_loser_cancelled(
+    monkeypatch, history, stub_llm, make_response
+):
+    calls = []
+    cancelled = []
+
+    async def fake_acompletion(**kwargs):
+        calls.append(kwargs)
+        if len(calls) == 1:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return make_response("slow")
+        return make_response("fast")
+
+    monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+    model = stub_llm("gpt-4o")
+    model.set_retry_policy(RetryPolicy(hedge=True, hedge_after=0.05))
+
+    response = await model.achat(history)
+    await asyncio.sleep(0)
+
+    assert response.message.content == "fast"
+    assert response.message_info.hedged is True
+    assert cancelled == [True]
+
+
+def test_request_details_record_retries(
+    monkeypatch, fast_policy, stub_llm, make_response
+):
+    fake = failing_completion([rate_limit_error()], make_response())
+
+    async def fake_acompletion(**kwargs):
+        return fake(**kwargs)
+
+    monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+    model = stub_llm("gpt-4o")
+    model.set_retry_policy(fast_policy)
+
+    node = rt.agent_node(llm=model)(user_input="hi")
+    asyncio.run(node.invoke())
+
+    details = node.details["llm_details"][-1]
+    assert (details.retries, details.hedged) == (1, False)
+    assert encode_request_details(details)["retries"] == 1
+
+
+def test_hedges_share_one_bounded_executor():
+    executor = _hedge_executor()
+    assert executor is _hedge_executor()
+    assert executor._max_workers <= 32
+
+
+def test_losing_stream_gives_back_its_limiter_slot(monkeypatch, stub_llm, make_stream):
+    limiter = set_rate_limit(ModelProvider.OPENAI, "hedged-model", max_concurrency=2)
+    calls = []
+    lock = threading.Lock()
+
+    def fake_completion(**kwargs):
+        with lock:
+            calls.append(kwargs)
+            first = len(calls) == 1
+        if first:
+            time.sleep(0.2)
+            return make_stream("slow")
+        return make_stream("fast")
+
+    monkeypatch.setattr(litellm, "completion", fake_completion)
+    model = stub_llm("hedged-model")
+    model.set_retry_policy(RetryPolicy(hedge=True, hedge_after=0.05))
+
+    try:
+        completion, hedged = model._send_hedged(
+            {"model": "hedged-model", "messages": []}
+        )
+        assert hedged is True
+        assert "".join(c.choices[0].delta.content or "" for c in completion) == "fast"
+        # the slower run still holds its slot until its reply comes in
+        assert limiter.in_flight == 1
+        time.sleep(0.4)
+        assert limiter.in_flight == 0
+    finally:
+        remove_rate_limit(ModelProvider.OPENAI, "hedged-model")
+
+
+def test_models_with_a_retry_policy_can_be_copied_and_pickled(stub_llm):
+    model = stub_llm("gpt-4o")
+    model.retry_policy.observe_latency(1.0)
+
+    for copied in (copy.deepcopy(model), pickle.loads(pickle.dumps(model))):
+        assert list(copied.retry_policy._latencies) == [1.0]
+        copied.retry_policy.observe_latency(2.0)
+    assert list(model.retry_policy._latencies) == [1.0]
@@ -83,11 +83,11 @@ def tool_nodes(cls):
 
 @pytest.mark.asyncio
 async def test_structured_tool_call_llm_return_output_exception(mock_llm, schema, mock_tool):
-    def mock_structured(message_history, base_model):
+    async def mock_structured(message_history, base_model):
         raise ValueError("fail")
     
     model = mock_llm(AssistantMessage("Hello world"))
-    model._structured = mock_structured
+    model._astructured = mock_structured
 
     node = structured_tool_call_llm(
         system_message="system prompt",
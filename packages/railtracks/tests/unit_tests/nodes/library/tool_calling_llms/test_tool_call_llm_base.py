@@ -0,0 +1,67 @@
+import pytest
+import railtracks as rt
+from railtracks.built_nodes.concrete._tool_call_base import CompiledTools
+from railtracks.exceptions import LLMError
+
+
+def add(x: int, y: int) -> int:
+    """
+    Adds two numbers.
+
+    Args:
+        x (int): The first number.
+        y (int): The second number.
+    """
+    return x + y
+
+
+def subtract(x: int, y: int) -> int:
+    """
+    Subtracts two numbers.
+
+    Args:
+        x (int): The first number.
+        y (int): The second number.
+    """
+    return x - y
+
+
+def test_compiled_tools_are_cached_on_the_class(mock_llm, monkeypatch):
+    add_node = rt.function_node(add).node_type
+    agent = rt.agent_node(tool_nodes=[add_node], llm=mock_llm())
+
+    compiled = agent.compiled_tools()
+    monkeypatch.setattr(
+        add_node, "tool_info", classmethod(lambda cls: pytest.fail("recompiled"))
+    )
+
+    assert agent.compiled_tools() is compiled
+    assert [t.name for t in agent.tools()] == ["add"]
+    assert agent(user_input="hi").get_node_from_name("add") is add_node
+
+
+def test_compiled_tools_are_not_shared_between_classes(mock_llm):
+    add_node = rt.function_node(add).node_type
+    subtract_node = rt.function_node(subtract).node_type
+    adder = rt.agent_node(tool_nodes=[add_node], llm=mock_llm())
+    subtractor = rt.agent_node(tool_nodes=[subtract_node], llm=mock_llm())
+
+    assert [t.name for t in adder.tools()] == ["add"]
+    assert [t.name for t in subtractor.tools()] == ["subtract"]
+
+
+def test_compiled_tools_are_hashable():
+    add_node = rt.function_node(add).node_type
+    compiled = CompiledTools.compile([add_node])
+
+    assert compiled == CompiledTools(tools=compiled.tools, nodes_by_name={})
+    assert {compiled: 1}[CompiledTools(tools=compiled.tools, nodes_by_name={})] == 1
+    assert set(compiled.nodes_by_name) == {"add"}
+
+
+def test_get_node_from_name_unknown_tool(mock_llm):
+    add_node = rt.function_node(add).node_type
+    agent = rt.agent_node(tool_nodes=[add_node], llm=mock_llm())
+
+    with pytest.raises(LLMError):
+        agent(user_input="hi").get_node_from_name("multiply")
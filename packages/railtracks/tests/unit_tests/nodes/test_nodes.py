@@ -44,6 +44,45 @@ def test_node_state_instantiate():
     state = NodeState(node)
     assert state.instantiate() == node
 
+def double(x: int) -> int:
+    return x * 2
+
+Double = rt.function_node(double)
+
+def test_node_state_pickle_round_trip():
+    import pickle
+
+    state = pickle.loads(pickle.dumps(NodeState(CapitalizeText("abc"))))
+    node = state.instantiate()
+    assert isinstance(node, CapitalizeText)
+    assert node.string == "abc"
+
+def test_node_state_pickle_rebuilds_function_nodes():
+    import pickle
+
+    original = Double.node_type(4)
+    node = pickle.loads(pickle.dumps(NodeState(original))).instantiate()
+    assert node.uuid == original.uuid
+    assert node.name() == original.name()
+    assert asyncio.run(node.invoke()) == 8
+
+def test_node_snapshot_copies_details_and_containers():
+    node = CapitalizeText("abc")
+    node.details["calls"] = ["first"]
+    node.history = [object()]
+    node.model = object()
+
+    snapshot = node.snapshot()
+    node.details["calls"].append("second")
+    node.details["latency"] = LatencyDetails(1.0)
+    node.history.append(object())
+
+    assert snapshot.uuid == node.uuid
+    assert snapshot.string is node.string
+    assert snapshot.details == {"calls": ["first"]}
+    assert len(snapshot.history) == 1 and snapshot.history[0] is node.history[0]
+    assert snapshot.model is node.model
+
 def test_debugdetails_dict():
     d = DebugDetails()
     d['x'] = 1
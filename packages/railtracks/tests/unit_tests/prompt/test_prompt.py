@@ -10,11 +10,11 @@
 def test_prompt_injection(mock_llm):
     prompt = "{secret}"
 
-    def return_message(messages: MessageHistory) -> Response:
+    async def return_message(messages: MessageHistory) -> Response:
         return Response(message=Message(role=Role.assistant, content=messages[-1].content))
 
     model = mock_llm()
-    model._chat = return_message
+    model._achat = return_message
 
     node = rt.agent_node(system_message=prompt, llm=model)
 
@@ -30,11 +30,11 @@ async def top_level():
 def test_prompt_injection_bypass(mock_llm):
     prompt = "{{secret_value}}"
 
-    def return_message(messages: MessageHistory) -> Response:
+    async def return_message(messages: MessageHistory) -> Response:
         return Response(message=Message(role=Role.assistant, content=messages[-1].content))
 
     model = mock_llm()
-    model._chat = return_message
+    model._achat = return_message
 
     node = rt.agent_node(system_message=prompt, llm=model)
 
@@ -51,11 +51,11 @@ async def top_level():
 def test_prompt_numerical(mock_llm):
     prompt = "{1}"
 
-    def return_message(messages: MessageHistory) -> Response:
+    async def return_message(messages: MessageHistory) -> Response:
         return Response(message=Message(role=Role.assistant, content=messages[-1].content))
 
     model = mock_llm()
-    model._chat = return_message
+    model._achat = return_message
 
     node = rt.agent_node(
         system_message=prompt,
@@ -75,11 +75,11 @@ async def top_level():
 def test_prompt_not_in_context(mock_llm):
     prompt = "{secret2}"
 
-    def return_message(messages: MessageHistory) -> Response:
+    async def return_message(messages: MessageHistory) -> Response:
         return Response(message=Message(role=Role.assistant, content=messages[-1].content))
 
     model = mock_llm()
-    model._chat = return_message
+    model._achat = return_message
 
     node = rt.agent_node(
         system_message=prompt,
@@ -101,11 +101,11 @@ async def top_level():
 def test_prompt_injection_global_config_bypass(mock_llm):
     prompt = "{secret_value}"
 
-    def return_message(messages: MessageHistory) -> Response:
+    async def return_message(messages: MessageHistory) -> Response:
         return Response(message=Message(role=Role.assistant, content=messages[-1].content))
 
     model = mock_llm()
-    model._chat = return_message
+    model._achat = return_message
 
     node = rt.agent_node(
         system_message=prompt,
@@ -1,7 +1,11 @@
 import pytest
 import asyncio
 from railtracks.utils.publisher import Subscriber
-from railtracks.pubsub.messages import RequestCompletionMessage
+from railtracks.pubsub.messages import (
+    FatalFailure,
+    RequestCompletionMessage,
+    RequestSuccess,
+)
 
 
 @pytest.mark.asyncio
@@ -24,3 +28,76 @@ def bad_callback(x):
     # Ensure debug was called at least once
     assert logger_patch.debug.called
 
+
+@pytest.mark.asyncio
+async def test_request_listener_routes_by_request_id(dummy_publisher):
+    async with dummy_publisher as pub:
+        first = asyncio.create_task(pub.request_listener("first"))
+        second = asyncio.create_task(pub.request_listener("second", lambda m: m.result))
+        await asyncio.sleep(0.01)
+
+        await pub.publish(RequestSuccess(request_id="second", node_state=None, result=2))
+        await pub.publish(RequestSuccess(request_id="first", node_state=None, result=1))
+
+        assert await second == 2
+        assert (await first).result == 1
+        assert pub._request_listeners == {}
+
+
+@pytest.mark.asyncio
+async def test_request_listener_does_not_subscribe(dummy_publisher):
+    async with dummy_publisher as pub:
+        n_subs = len(pub._subscribers)
+        task = asyncio.create_task(pub.request_listener("abc"))
+        await asyncio.sleep(0.01)
+        assert len(pub._subscribers) == n_subs
+        assert "abc" in pub._request_listeners
+
+        await pub.publish(RequestSuccess(request_id="abc", node_state=None, result=None))
+        await task
+
+
+@pytest.mark.asyncio
+async def test_fatal_failure_fans_out_to_all_requests(dummy_publisher):
+    async with dummy_publisher as pub:
+        tasks = [
+            asyncio.create_task(pub.request_listener(str(i))) for i in range(3)
+        ]
+        await asyncio.sleep(0.01)
+
+        failure = FatalFailure(error=Exception("boom"))
+        await pub.publish(failure)
+
+        assert await asyncio.gather(*tasks) == [failure] * 3
+
+
+@pytest.mark.asyncio
+async def test_request_completion_still_broadcast(dummy_publisher):
+    received = []
+    async with dummy_publisher as pub:
+        pub.subscribe(received.append)
+        task = asyncio.create_task(pub.request_listener("abc"))
+        await asyncio.sleep(0.01)
+
+        message = RequestSuccess(request_id="abc", node_state=None, result=None)
+        await pub.publish(message)
+        await task
+
+    assert received == [message]
+
+
+@pytest.mark.asyncio
+async def test_request_listener_raises_on_shutdown(dummy_publisher):
+    await dummy_publisher.start()
+    task = asyncio.create_task(dummy_publisher.request_listener("abc"))
+    await asyncio.sleep(0.01)
+    await dummy_publisher.shutdown()
+
+    with pytest.raises(ValueError):
+        await task
+
+
+@pytest.mark.asyncio
+async def test_request_listener_raises_if_not_running(dummy_publisher):
+    with pytest.raises(ValueError):
+        await dummy_publisher.request_listener("abc")
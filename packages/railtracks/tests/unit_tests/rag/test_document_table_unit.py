@@ -0,0 +1,27 @@
+from railtracks.rag.document_table import DocumentTable
+from railtracks.rag.text_object import TextObject
+from railtracks.rag.vector_store.base import SearchEntry, VectorRecord
+
+
+def test_add_and_discard():
+    table = DocumentTable()
+    tobj = TextObject("the document")
+    assert table.add(tobj) == tobj.hash
+    assert table[tobj.hash] is tobj
+    assert list(table) == [tobj.hash] and len(table) == 1
+
+    table.discard(tobj.hash)
+    table.discard("unknown")
+    assert len(table) == 0
+
+
+def test_resolve_records_and_search_entries():
+    table = DocumentTable()
+    tobj = TextObject("the document")
+    table.add(tobj)
+    record = VectorRecord(id="r", vector=[1.0], text="chunk", metadata={"document_id": tobj.hash})
+
+    assert table.resolve(record) is tobj
+    assert table.resolve(SearchEntry(score=0.0, record=record)) is tobj
+    assert table.resolve(VectorRecord(id="x", vector=[1.0], metadata={"document_id": "gone"})) is None
+    assert table.resolve(VectorRecord(id="y", vector=[1.0], metadata=None)) is None
@@ -0,0 +1,71 @@
+import threading
+
+import pytest
+from railtracks.rag.embedding_cache import EmbeddingCache
+
+
+def test_get_many_returns_none_for_misses():
+    cache = EmbeddingCache()
+    cache.set("a", [1.0, 2.0])
+    assert cache.get_many(["a", "b"]) == [[1.0, 2.0], None]
+    assert cache.get("b") is None
+
+def test_key_depends_on_namespace_and_text():
+    assert EmbeddingCache.key("m1", "text") == EmbeddingCache.key("m1", "text")
+    assert EmbeddingCache.key("m1", "text") != EmbeddingCache.key("m2", "text")
+    assert EmbeddingCache.key("m1", "text") != EmbeddingCache.key("m1", "text!")
+
+def test_lru_evicts_least_recently_used():
+    cache = EmbeddingCache(max_entries=2)
+    cache.set("a", [1.0])
+    cache.set("b", [2.0])
+    cache.get("a")
+    cache.set("c", [3.0])
+    assert len(cache) == 2
+    assert cache.get_many(["a", "b", "c"]) == [[1.0], None, [3.0]]
+
+def test_zero_entries_disables_memory():
+    cache = EmbeddingCache(max_entries=0)
+    cache.set("a", [1.0])
+    assert cache.get("a") is None
+
+def test_sqlite_level_survives_restarts(tmp_path):
+    path = tmp_path / "cache" / "embeddings.sqlite"
+    cache = EmbeddingCache(max_entries=1, path=path)
+    cache.set_many([("a", [0.1, 0.2]), ("b", [0.3, 0.4])])
+    # "a" was evicted from memory but is still on disk
+    assert cache.get("a") == [0.1, 0.2]
+    cache.close()
+
+    reopened = EmbeddingCache(path=path)
+    assert reopened.get_many(["a", "b", "c"]) == [[0.1, 0.2], [0.3, 0.4], None]
+    reopened.clear()
+    assert reopened.get("a") is None
+    reopened.close()
+
+def test_sqlite_lookup_of_many_keys(tmp_path):
+    cache = EmbeddingCache(max_entries=0, path=tmp_path / "e.sqlite")
+    cache.set_many((str(i), [float(i)]) for i in range(1200))
+    keys = [str(i) for i in range(1200)] + ["missing", "5"]
+    assert cache.get_many(keys) == [[float(i)] for i in range(1200)] + [None, [5.0]]
+    cache.close()
+
+def test_concurrent_use_from_threads(tmp_path):
+    cache = EmbeddingCache(max_entries=50, path=tmp_path / "e.sqlite")
+
+    def work(offset):
+        for i in range(100):
+            cache.set(f"{offset}-{i}", [float(i)])
+            assert cache.get(f"{offset}-{i}") == [float(i)]
+
+    threads = [threading.Thread(target=work, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert cache.get("3-99") == [99.0]
+    cache.close()
+
+def test_negative_max_entries_raises():
+    with pytest.raises(ValueError):
+        EmbeddingCache(max_entries=-1)
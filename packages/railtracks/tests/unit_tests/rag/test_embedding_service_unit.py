@@ -1,19 +1,30 @@
+import asyncio
+
 import pytest
+from railtracks.rag.embedding_cache import EmbeddingCache
 from railtracks.rag.embedding_service import BaseEmbeddingService, EmbeddingService
 
 
 @pytest.fixture(autouse=True)
 def patch_litellm(monkeypatch):
     class DummyLitellm:
+        calls = []
+
         @staticmethod
         def embedding(model, input, **kwargs):
+            DummyLitellm.calls.append(list(input))
             return {"data":[
                 {"index":i, "embedding":[float(len(t)), 1.0, 2.0]} for i,t in enumerate(input)
             ]}
 
+        @staticmethod
+        async def aembedding(model, input, **kwargs):
+            return DummyLitellm.embedding(model, input, **kwargs)
+
     # Patch where it is used:
     import railtracks.rag.embedding_service as embmod
     monkeypatch.setattr(embmod, "litellm", DummyLitellm)
+    return DummyLitellm
 
 def test_repr_includes_class_and_model():
     es = EmbeddingService(model="test-model")
@@ -40,4 +51,52 @@ def test_litellm_extra_kwargs():
     es = EmbeddingService(model="abc", api_key="XXX", base_url="http://foo", timeout=20, whatever="yes")
     assert es.litellm_extra["api_key"] == "XXX"
     assert es.litellm_extra["base_url"] == "http://foo"
-    assert es.litellm_extra["whatever"] == "yes"
\ No newline at end of file
+    assert es.litellm_extra["whatever"] == "yes"
+
+def test_embed_reuses_repeated_texts(patch_litellm):
+    es = EmbeddingService(model="foo")
+    out = es.embed(["a", "bb", "a", "bb", "ccc"], batch_size=8)
+    assert patch_litellm.calls == [["a", "bb", "ccc"]]
+    assert [v[0] for v in out] == [1.0, 2.0, 1.0, 2.0, 3.0]
+
+def test_embed_concurrent_batches_keep_order(patch_litellm):
+    es = EmbeddingService(model="foo", max_concurrency=4)
+    texts = ["x" * i for i in range(1, 30)]
+    out = es.embed(texts, batch_size=3)
+    assert len(patch_litellm.calls) == 10
+    assert [v[0] for v in out] == [float(len(t)) for t in texts]
+
+def test_aembed_matches_embed(patch_litellm):
+    es = EmbeddingService(model="foo", max_concurrency=2)
+    texts = ["one", "two", "three", "four", "one"]
+    out = asyncio.run(es.aembed(texts, batch_size=2))
+    assert out == es.embed(texts, batch_size=2)
+    assert asyncio.run(es.aembed("solo")) == [[4.0, 1.0, 2.0]]
+
+def test_batches_are_cut_by_token_count(patch_litellm):
+    es = EmbeddingService(model="foo", max_batch_tokens=10, token_counter=len)
+    es.embed(["aaaa", "bbbb", "cc", "dddddddddddd", "e"], batch_size=8)
+    # a text over the limit still gets a batch of its own
+    assert patch_litellm.calls == [["aaaa", "bbbb", "cc"], ["dddddddddddd"], ["e"]]
+
+def test_cache_skips_embedded_texts(patch_litellm):
+    es = EmbeddingService(model="foo", cache=EmbeddingCache())
+    es.embed(["a", "bb"])
+    out = es.embed(["bb", "ccc", "a"])
+    assert patch_litellm.calls == [["a", "bb"], ["ccc"]]
+    assert [v[0] for v in out] == [2.0, 3.0, 1.0]
+
+    asyncio.run(es.aembed(["a", "bb", "ccc"]))
+    assert len(patch_litellm.calls) == 2
+
+def test_cache_is_keyed_by_model(patch_litellm):
+    cache = EmbeddingCache()
+    EmbeddingService(model="foo", cache=cache).embed(["a"])
+    EmbeddingService(model="bar", cache=cache).embed(["a"])
+    assert patch_litellm.calls == [["a"], ["a"]]
+
+def test_invalid_options_raise():
+    with pytest.raises(ValueError):
+        EmbeddingService(max_concurrency=0)
+    with pytest.raises(ValueError):
+        EmbeddingService(max_batch_tokens=0)
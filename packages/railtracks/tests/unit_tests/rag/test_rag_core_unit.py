@@ -6,6 +6,7 @@
 # Import the RAG implementation under test
 from railtracks.rag.rag_core import RAG, RAGConfig, textobject_to_vectorrecords
 from railtracks.rag.text_object import TextObject
+from railtracks.rag.vector_store import InMemoryVectorStore
 from railtracks.rag.vector_store.base import VectorRecord
 
 
@@ -49,6 +50,16 @@ def add(self, records: Sequence[VectorRecord]):
         self.received_records.extend(records)
         # No return value needed
 
+    def delete(self, ids: Sequence[str]):
+        self.deleted_ids = getattr(self, "deleted_ids", []) + list(ids)
+        return len(ids)
+
+    def search_many(self, queries: Sequence[List[float]], top_k: int = 5, *, embed: bool = True):
+        self.search_many_calls = getattr(self, "search_many_calls", 0) + 1
+        self.last_queries = list(queries)
+        self.last_top_k = top_k
+        return [[q] for q in queries]
+
     def search(self, query: List[float], top_k: int = 5):
         self.search_calls += 1
         self.last_query = query
@@ -180,6 +191,21 @@ def test_search_vector_bypasses_embedding():
     assert hasattr(res, "__iter__")
 
 
+def test_search_many_embeds_text_queries_in_one_call():
+    embed = DummyEmbedService()
+    store = DummyStore()
+    chunker = DummyChunker(chunks=["a"])
+    rag = RAG(docs=["doc"], embedding_service=embed, vector_store=store, chunk_service=chunker)
+
+    res = rag.search_many(["q", [0.1, 0.2], "query"], top_k=4)
+    assert embed.calls == [["q", "query"]]
+    assert store.search_many_calls == 1
+    # vectors keep the position of their query
+    assert store.last_queries == [[1.0, 1.0], [0.1, 0.2], [5.0, 5.0]]
+    assert store.last_top_k == 4
+    assert res == [[q] for q in store.last_queries]
+
+
 def test_add_docs_appends_to_text_objects():
     rag = RAG(docs=["d1", "d2"], embedding_service=DummyEmbedService(), vector_store=DummyStore(), chunk_service=DummyChunker())
     assert len(rag.text_objects) == 2
@@ -209,4 +235,117 @@ def my_strategy(self, text: str) -> List[str]:
 def test_embed_all_with_no_docs_no_store_calls():
     rag = RAG(docs=[], embedding_service=DummyEmbedService(), vector_store=DummyStore(), chunk_service=DummyChunker())
     rag.embed_all()
-    assert rag.vector_store.add_calls == 0
\ No newline at end of file
+    assert rag.vector_store.add_calls == 0
+
+
+class SplitChunker:
+    """Chunker splitting on whitespace, so different documents get different chunks."""
+    def chunk(self, text: str) -> List[str]:
+        return text.split()
+
+
+def test_embed_all_skips_unchanged_documents():
+    embed = DummyEmbedService()
+    store = DummyStore()
+    rag = RAG(docs=["a b", "c d e"], embedding_service=embed, vector_store=store, chunk_service=SplitChunker())
+
+    rag.embed_all()
+    assert len(store.received_records) == 5
+    rag.embed_all()
+    assert len(embed.calls) == 1
+    assert store.add_calls == 1
+
+    rag.add_docs(["f"])
+    rag.embed_all()
+    assert list(embed.calls[-1]) == ["f"]
+    assert len(store.received_records) == 6
+
+
+def test_embed_all_replaces_records_of_changed_documents():
+    embed = DummyEmbedService()
+    store = DummyStore()
+    rag = RAG(docs=["a b", "c d e"], embedding_service=embed, vector_store=store, chunk_service=SplitChunker())
+    rag.embed_all()
+    old_ids = [rec.id for rec in store.received_records[:2]]
+
+    rag.text_objects[0].raw_content = "a b x"
+    rag.embed_all()
+
+    assert store.deleted_ids == old_ids
+    assert list(embed.calls[-1]) == ["a", "b", "x"]
+    new_records = store.received_records[5:]
+    assert [rec.text for rec in new_records] == ["a", "b", "x"]
+    assert all(rec.id.startswith(rag.text_objects[0].hash) for rec in new_records)
+
+
+def test_embed_all_deletes_records_of_removed_documents():
+    store = DummyStore()
+    rag = RAG(docs=["a b", "c"], embedding_service=DummyEmbedService(), vector_store=store, chunk_service=SplitChunker())
+    rag.embed_all()
+    removed = rag.text_objects.pop()
+    rag.embed_all()
+    assert store.deleted_ids == [f"{removed.hash}-0"]
+
+
+def test_embed_all_embeds_identical_documents_once():
+    embed = DummyEmbedService()
+    store = DummyStore()
+    rag = RAG(docs=["same doc", "same doc"], embedding_service=embed, vector_store=store, chunk_service=SplitChunker())
+    rag.embed_all()
+    assert embed.calls == [["same", "doc"]]
+    assert len(store.received_records) == 2
+
+
+def test_embed_all_groups_chunks_across_documents(monkeypatch):
+    monkeypatch.setattr(RAG, "EMBED_GROUP_SIZE", 3)
+    embed = DummyEmbedService()
+    store = DummyStore()
+    docs = ["a b", "c", "d e f g", "h"]
+    rag = RAG(docs=docs, embedding_service=embed, vector_store=store, chunk_service=SplitChunker())
+    rag.embed_all()
+
+    # documents are never split, a group is closed once it holds EMBED_GROUP_SIZE chunks
+    assert [list(c) for c in embed.calls] == [["a", "b", "c"], ["d", "e", "f", "g"], ["h"]]
+    assert store.add_calls == 3
+    assert [rec.text for rec in store.received_records] == list("abcdefgh")
+    assert [len(t.embeddings) for t in rag.text_objects] == [2, 1, 4, 1]
+
+
+def test_embed_all_upserts_in_place_into_a_shared_store():
+    store = InMemoryVectorStore(metric="l2", dim=2)
+    RAG(docs=["a b", "c"], embedding_service=DummyEmbedService(), vector_store=store, chunk_service=SplitChunker()).embed_all()
+    assert store.count() == 3
+
+    # a second RAG over the same store (and documents) overwrites the existing records
+    RAG(docs=["a b", "c"], embedding_service=DummyEmbedService(), vector_store=store, chunk_service=SplitChunker()).embed_all()
+    assert store.count() == 3
+
+
+def test_records_reference_their_document_instead_of_copying_it():
+    store = DummyStore()
+    document = "word " * 10_000
+    rag = RAG(docs=[document], embedding_service=DummyEmbedService(), vector_store=store, chunk_service=SplitChunker())
+    rag.embed_all()
+
+    doc_id = rag.text_objects[0].hash
+    for rec in store.received_records:
+        assert "raw_content" not in rec.metadata
+        assert rec.metadata["document_id"] == doc_id
+        assert rec.metadata["content_length"] == len(document)
+    assert rag.documents[doc_id].raw_content == document
+
+
+def test_get_document_resolves_search_results_lazily():
+    store = InMemoryVectorStore(metric="l2", dim=2)
+    rag = RAG(docs=["a bb", "ccc"], embedding_service=DummyEmbedService(), vector_store=store, chunk_service=SplitChunker())
+    rag.embed_all()
+
+    [entry] = rag.search([3.0, 3.0], top_k=1)
+    assert entry.record.text == "ccc"
+    assert rag.get_document(entry).raw_content == "ccc"
+
+    # removed documents are dropped from the table along with their records
+    rag.text_objects.pop()
+    rag.embed_all()
+    assert rag.get_document(entry) is None
+    assert [e.record.text for e in rag.search([3.0, 3.0], top_k=5)] == ["bb", "a"]
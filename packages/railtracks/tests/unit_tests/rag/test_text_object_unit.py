@@ -0,0 +1,77 @@
+import hashlib
+
+import pytest
+import railtracks.rag.text_object as tomod
+from railtracks.rag.rag_core import textobject_to_vectorrecords
+from railtracks.rag.text_object import TextObject
+
+
+def test_hash_covers_the_full_content():
+    prefix = "templated report header " * 1000
+    first = TextObject(prefix + "quarter one")
+    second = TextObject(prefix + "quarter two")
+    assert first.hash != second.hash
+    assert first.hash == TextObject(prefix + "quarter one").hash
+
+
+def test_streamed_hash_matches_hashing_the_whole_content(monkeypatch):
+    monkeypatch.setattr(tomod, "_HASH_BLOCK_CHARS", 7)
+    content = "snowman ☃ and some more text " * 5
+    expected = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    assert TextObject.get_resource_hash(content) == expected
+
+
+def test_other_hashlib_algorithms():
+    tobj = TextObject("some text", hash_type="blake2b")
+    assert tobj.hash == hashlib.blake2b(b"some text").hexdigest()
+
+
+def test_file_hash_matches_content_hash(tmp_path, monkeypatch):
+    monkeypatch.setattr(tomod, "_HASH_BLOCK_BYTES", 5)
+    path = tmp_path / "doc.txt"
+    path.write_text("file content that spans several blocks", encoding="utf-8")
+    assert TextObject.get_file_hash(str(path)) == TextObject.get_resource_hash(
+        "file content that spans several blocks"
+    )
+
+
+def test_xxhash_option():
+    xxhash = pytest.importorskip("xxhash")
+    tobj = TextObject("some text", hash_type="xxh3_128")
+    assert tobj.hash == xxhash.xxh3_128(b"some text").hexdigest()
+
+
+def test_xxhash_missing_raises_helpful_error(monkeypatch):
+    import builtins
+
+    real_import = builtins.__import__
+
+    def fake_import(name, *args, **kwargs):
+        if name == "xxhash":
+            raise ImportError("No module named 'xxhash'")
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", fake_import)
+    with pytest.raises(ImportError, match="railtracks\\[rag\\]"):
+        TextObject("text", hash_type="xxh3_64")
+
+
+def test_records_of_documents_with_a_shared_prefix_do_not_collide():
+    prefix = "x" * 10000
+    ids = set()
+    for tobj in [TextObject(prefix + "a"), TextObject(prefix + "b")]:
+        tobj.set_chunked(["chunk"])
+        tobj.set_embeddings([[1.0]])
+        ids.update(r.id for r in textobject_to_vectorrecords(tobj))
+    assert len(ids) == 2
+
+
+def test_records_carry_a_chunk_hash():
+    tobj = TextObject("doc", hash_type="md5")
+    tobj.set_chunked(["one", "two"])
+    tobj.set_embeddings([[1.0], [2.0]])
+    records = textobject_to_vectorrecords(tobj)
+    assert [r.metadata["chunk_hash"] for r in records] == [
+        hashlib.md5(b"one").hexdigest(),
+        hashlib.md5(b"two").hexdigest(),
+    ]
@@ -5,6 +5,8 @@
 from unittest.mock import MagicMock
 import pickle
 
+import numpy as np
+
 import railtracks.rag.vector_store.in_memory as vsmem
 
 # -------------- Auto-patch module dependencies (pytest-style) --------------
@@ -26,7 +28,8 @@ def patch_vectorstore_deps(monkeypatch, dummy_embedding_service, dummy_record, d
 
 # --------------------------- helpers -----------------------------
 
-def vectors_allclose(vec1, vec2, tol=1e-8):
+def vectors_allclose(vec1, vec2, tol=1e-6):
+    # vectors are stored as float32
     if len(vec1) != len(vec2):
         return False
     return all(abs(a - b) < tol for a, b in zip(vec1, vec2))
@@ -374,4 +377,134 @@ def test_record_vector_matches_stored_after_update(store_cos):
 def test_search_topk_zero_returns_empty(store_l2, dummy_record):
     store_l2.add([dummy_record(id="a1", vector=[0, 0, 0], text="a")], embed=False)
     res = store_l2.search([0, 0, 0], top_k=0, embed=False)
-    assert list(res) == []
\ No newline at end of file
+    assert list(res) == []
+
+def test_search_matches_brute_force_for_every_metric(dummy_record):
+    from railtracks.rag.vector_store.utils import distance
+
+    vectors = {f"v{i}": [float((i * 7) % 5), float(i % 3), float((i * 3) % 4) - 1] for i in range(20)}
+    query = [1.0, 2.0, -0.5]
+    for metric in ["cosine", "l2", "dot"]:
+        s = InMemoryVectorStore(metric=metric, dim=3, normalize=False)
+        s.add([dummy_record(id=k, vector=v, text=k) for k, v in vectors.items()], embed=False)
+
+        results = s.search(query, top_k=5, embed=False)
+        expected = sorted(distance(query, v, metric=metric) for v in vectors.values())[:5]
+        assert [e.score for e in results] == pytest.approx(expected, abs=1e-5)
+
+def test_delete_keeps_remaining_vectors_searchable(store_l2, dummy_record):
+    store_l2.add(
+        [dummy_record(id=f"d{i}", vector=[float(i), 0.0, 0.0], text=str(i)) for i in range(5)],
+        embed=False,
+    )
+    assert store_l2.delete(["d0", "d2"]) == 2
+
+    assert store_l2.count() == 3
+    assert set(store_l2._vectors) == {"d1", "d3", "d4"}
+    assert store_l2._vectors["d4"] == [4.0, 0.0, 0.0]
+    results = store_l2.search([4.0, 0.0, 0.0], top_k=3, embed=False)
+    assert [e.record.id for e in results] == ["d4", "d3", "d1"]
+
+def test_add_existing_id_overwrites_vector(store_l2, dummy_record):
+    store_l2.add([dummy_record(id="same", vector=[1.0, 0.0, 0.0], text="old")], embed=False)
+    store_l2.add([dummy_record(id="same", vector=[0.0, 1.0, 0.0], text="new")], embed=False)
+
+    assert store_l2.count() == 1
+    assert store_l2._record["same"].text == "new"
+    assert store_l2._vectors["same"] == [0.0, 1.0, 0.0]
+
+def test_store_grows_past_initial_capacity(store_l2, dummy_record):
+    store_l2.add(
+        [dummy_record(id=f"g{i}", vector=[float(i), 1.0, 0.0], text=None) for i in range(100)],
+        embed=False,
+    )
+    assert store_l2.count() == 100
+    assert store_l2._vectors["g99"] == [99.0, 1.0, 0.0]
+
+
+def test_search_many_matches_search_for_every_query(monkeypatch, dummy_record):
+    for metric in ["cosine", "l2", "dot"]:
+        s = InMemoryVectorStore(metric=metric, dim=3)
+        s.add(
+            [dummy_record(id=f"m{i}", vector=[float(i % 4), float(i % 7) - 3, 1.0], text=None) for i in range(30)],
+            embed=False,
+        )
+        queries = [[float(i), 1.0, float(-i)] for i in range(5)]
+        # force several blocks of queries
+        monkeypatch.setattr(InMemoryVectorStore, "QUERY_BLOCK_SIZE", 2)
+
+        many = s.search_many(queries, top_k=4)
+        single = [s.search(q, top_k=4) for q in queries]
+        assert len(many) == len(queries)
+        for batch_result, single_result in zip(many, single):
+            assert [e.score for e in batch_result] == pytest.approx([e.score for e in single_result])
+
+def test_search_many_embeds_all_text_queries_at_once(store_cos):
+    store_cos.add(["a", "b", "c"])
+    calls = []
+    original = store_cos.embedding_service.embed
+    store_cos.embedding_service.embed = lambda texts: calls.append(texts) or original(texts)
+
+    results = store_cos.search_many(["a", "c"], top_k=2, embed=True)
+    assert calls == [["a", "c"]]
+    assert [len(r) for r in results] == [2, 2]
+
+def test_search_many_validates_embed_flag(store_cos):
+    with pytest.raises(ValueError):
+        store_cos.search_many(["text"], embed=False)
+    with pytest.raises(ValueError):
+        store_cos.search_many(["text", [1.0, 0.0, 0.0]], embed=True)
+    assert store_cos.search_many([]) == []
+
+def test_mmap_persist_and_load_roundtrip(tmp_path, store_cos, dummy_record):
+    store_cos.add([
+        dummy_record(id="r1", vector=[1.0, 0.0, 0.0], text="one", metadata={"k": 1}),
+        dummy_record(id="r2", vector=[0.0, 1.0, 0.0], text="two"),
+        dummy_record(id="r3", vector=[1.0, 1.0, 0.0], text="three"),
+    ], embed=False)
+    out_dir = tmp_path / "mmap_store"
+    store_cos.persist(out_dir, format="mmap")
+    assert (out_dir / "vectors.npy").exists()
+    assert (out_dir / "records.pkl").exists()
+
+    loaded = InMemoryVectorStore.load(out_dir)
+    assert isinstance(loaded._matrix, np.memmap)
+    assert loaded.count() == 3
+    assert loaded.metric.value == store_cos.metric.value
+    assert loaded._normalize == store_cos._normalize
+    for k, v in store_cos._vectors.items():
+        assert vectors_allclose(loaded._vectors[k], v)
+    assert loaded._record["r1"].metadata == {"k": 1}
+    assert [e.record.id for e in loaded.search([1.0, 0.1, 0.0], top_k=3)] == [
+        e.record.id for e in store_cos.search([1.0, 0.1, 0.0], top_k=3)
+    ]
+
+def test_mmap_loaded_store_changes_do_not_reach_disk(tmp_path, store_l2, dummy_record):
+    store_l2.add([
+        dummy_record(id=f"m{i}", vector=[float(i), 0.0, 1.0], text=None) for i in range(4)
+    ], embed=False)
+    out_dir = tmp_path / "mmap_store"
+    store_l2.persist(out_dir, format="mmap")
+
+    loaded = InMemoryVectorStore.load(out_dir)
+    loaded.delete(["m0"])
+    loaded.add([dummy_record(id="new", vector=[9.0, 9.0, 9.0], text=None)], embed=False)
+    assert loaded.count() == 4
+    assert loaded._vectors["new"] == [9.0, 9.0, 9.0]
+    assert loaded._vectors["m3"] == [3.0, 0.0, 1.0]
+
+    reloaded = InMemoryVectorStore.load(out_dir)
+    assert sorted(reloaded._vectors.keys()) == ["m0", "m1", "m2", "m3"]
+    assert reloaded._vectors["m0"] == [0.0, 0.0, 1.0]
+
+def test_mmap_persist_of_empty_store(tmp_path):
+    store = InMemoryVectorStore(metric="dot", dim=4)
+    store.persist(tmp_path / "empty", format="mmap")
+    loaded = InMemoryVectorStore.load(tmp_path / "empty")
+    assert loaded.count() == 0
+    assert loaded._dim == 4
+    assert loaded.search([1.0, 0.0, 0.0, 0.0]) == []
+
+def test_persist_rejects_unknown_format(tmp_path, store_cos):
+    with pytest.raises(ValueError):
+        store_cos.persist(tmp_path, format="json")
@@ -0,0 +1,132 @@
+import numpy as np
+import pytest
+
+from railtracks.rag.vector_store import IVFVectorStore, InMemoryVectorStore, create_store
+from railtracks.rag.vector_store.base import VectorRecord
+
+
+def clustered_vectors(n, dim=8, n_clusters=16, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(n_clusters, dim)) * 10
+    labels = rng.integers(0, n_clusters, size=n)
+    return (centers[labels] + rng.normal(size=(n, dim))).astype(np.float32)
+
+
+def records(vectors, prefix="r"):
+    return [VectorRecord(id=f"{prefix}{i}", vector=v.tolist(), text=None) for i, v in enumerate(vectors)]
+
+
+def result_ids(result):
+    return [e.record.id for e in result]
+
+
+@pytest.fixture
+def trained_store():
+    store = IVFVectorStore(metric="l2", n_lists=16, n_probe=4, train_threshold=500)
+    store.add(records(clustered_vectors(1000)), embed=False)
+    return store
+
+
+def test_untrained_store_matches_brute_force():
+    vectors = clustered_vectors(100)
+    ivf = IVFVectorStore(metric="cosine", train_threshold=1000)
+    exact = InMemoryVectorStore(metric="cosine")
+    ivf.add(records(vectors), embed=False)
+    exact.add(records(vectors), embed=False)
+
+    assert not ivf.is_trained
+    for q in vectors[:10]:
+        assert result_ids(ivf.search(q.tolist(), top_k=5)) == result_ids(exact.search(q.tolist(), top_k=5))
+
+
+def test_store_trains_once_threshold_is_reached(trained_store):
+    assert trained_store.is_trained
+    assert len(trained_store._lists) == 16
+    assert sum(lst.size for lst in trained_store._lists) == trained_store.count() == 1000
+
+
+def test_probing_every_list_is_exact(trained_store):
+    exact = InMemoryVectorStore(metric="l2")
+    exact.add(records(clustered_vectors(1000)), embed=False)
+    trained_store.n_probe = 16
+
+    queries = clustered_vectors(20, seed=1).tolist()
+    for ivf_result, exact_result in zip(trained_store.search_many(queries, top_k=10), exact.search_many(queries, top_k=10)):
+        assert result_ids(ivf_result) == result_ids(exact_result)
+
+
+def test_recall_on_clustered_data(trained_store):
+    exact = InMemoryVectorStore(metric="l2")
+    exact.add(records(clustered_vectors(1000)), embed=False)
+
+    queries = clustered_vectors(50, seed=2).tolist()
+    found = 0
+    for ivf_result, exact_result in zip(trained_store.search_many(queries, top_k=10), exact.search_many(queries, top_k=10)):
+        found += len(set(result_ids(ivf_result)) & set(result_ids(exact_result)))
+    assert found / (50 * 10) > 0.9
+
+
+def test_incremental_insert_is_searchable(trained_store):
+    trained_store.add([VectorRecord(id="new", vector=[100.0] * 8, text="new")], embed=False)
+    assert trained_store.count() == 1001
+    assert result_ids(trained_store.search([100.0] * 8, top_k=1)) == ["new"]
+
+
+def test_delete_tombstones_rows(trained_store):
+    query = trained_store._vectors["r3"]
+    assert result_ids(trained_store.search(query, top_k=1)) == ["r3"]
+
+    assert trained_store.delete(["r3", "missing"]) == 1
+    assert trained_store.count() == 999
+    assert "r3" not in trained_store._vectors
+    assert "r3" not in result_ids(trained_store.search(query, top_k=20))
+    # the row is only marked, not reclaimed yet
+    assert len(trained_store._ids) == 1000
+
+
+def test_compaction_reclaims_tombstones(trained_store):
+    trained_store.delete([f"r{i}" for i in range(600)])
+    assert len(trained_store._ids) == trained_store.count() == 400
+    assert sum(lst.size for lst in trained_store._lists) == 400
+    query = trained_store._vectors["r700"]
+    assert result_ids(trained_store.search(query, top_k=1)) == ["r700"]
+
+
+def test_overwrite_replaces_vector(trained_store):
+    trained_store.add([VectorRecord(id="r5", vector=[-100.0] * 8, text=None)], embed=False)
+    assert trained_store.count() == 1000
+    assert trained_store._vectors["r5"] == [-100.0] * 8
+    assert result_ids(trained_store.search([-100.0] * 8, top_k=1)) == ["r5"]
+
+
+@pytest.mark.parametrize("fmt", ["pickle", "mmap"])
+def test_persist_and_load_keeps_index_settings(tmp_path, trained_store, fmt):
+    trained_store.delete(["r0"])
+    target = tmp_path / ("store.pkl" if fmt == "pickle" else "store")
+    trained_store.persist(target, format=fmt)
+
+    loaded = IVFVectorStore.load(target)
+    assert isinstance(loaded, IVFVectorStore)
+    assert loaded.count() == 999
+    assert (loaded.n_lists, loaded.n_probe, loaded.train_threshold) == (16, 4, 500)
+    assert loaded.is_trained
+    query = trained_store._vectors["r10"]
+    assert result_ids(loaded.search(query, top_k=1)) == ["r10"]
+
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        IVFVectorStore(n_probe=0)
+    with pytest.raises(ValueError):
+        IVFVectorStore(n_lists=0)
+
+
+def test_ivf_arguments_are_keyword_only():
+    with pytest.raises(TypeError):
+        IVFVectorStore(None, "l2")
+
+
+def test_factory_creates_ivf_store():
+    store = create_store({"backend": "ivf", "metric": "dot", "n_probe": 3})
+    assert isinstance(store, IVFVectorStore)
+    assert store.n_probe == 3
@@ -109,6 +109,10 @@ def safe_copy(self):
             result._copied = True
             return result
 
+        def snapshot(self):
+            cls = self.__class__
+            return cls(self.uuid, details=dict(self.details))
+
         def __repr__(self):
             return f"DummyNode<{self.uuid}>"
 
@@ -87,6 +87,28 @@ def test_nodeforest_id_type_mapping(node_forest, dummy_node_factory):
     typ = node_forest.get_node_type(a_id)
     assert typ == type(node)
 
+def test_nodeforest_checkout_hands_out_new_node(node_forest, dummy_node_factory):
+    a_id = str(uuid.uuid4())
+    node = dummy_node_factory(uuid=a_id, details={"x": 1})
+    node_forest.update(node, Stamp(1, 1, "created"))
+
+    checked_out = node_forest.checkout(a_id)
+    checked_out.details["x"] = 2
+
+    assert checked_out is node
+    assert node_forest[a_id]._node is not node
+    assert node_forest[a_id]._node.details == {"x": 1}
+
+def test_nodeforest_checkout_copies_after_first(node_forest, dummy_node_factory):
+    a_id = str(uuid.uuid4())
+    node = dummy_node_factory(uuid=a_id)
+    node_forest.update(node, Stamp(1, 1, "created"))
+    node_forest.checkout(a_id)
+
+    again = node_forest.checkout(a_id)
+    assert again is not node
+    assert again._copied
+
 # =============== END NodeForest heap & access =====================
 
 # =============== START to_vertices & conversions ==================
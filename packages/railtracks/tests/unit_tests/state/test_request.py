@@ -188,6 +188,48 @@ def test_forest_to_edges_returns_all(req_forest, req_template_factory):
     assert len(edge_list) == 2
     assert {e.source for e in edge_list} == {None, "A"}
 
+def test_forest_indexes_follow_updates(req_forest, req_stamp):
+    req_forest.create("A", source_id=None, sink_id="A", input_args=(), input_kwargs={}, stamp=req_stamp(0))
+    req_forest.create("B", source_id="A", sink_id="B", input_args=(), input_kwargs={}, stamp=req_stamp(1))
+    req_forest.create("C", source_id="B", sink_id="C", input_args=(), input_kwargs={}, stamp=req_stamp(2))
+
+    assert [r.identifier for r in req_forest.all_downstream("A")] == ["B", "C"]
+    assert [r.identifier for r in req_forest.open_tails()] == ["C"]
+    assert req_forest.children_requests_complete("B") is None
+
+    req_forest.update("C", output="done", stamp=req_stamp(3))
+    # the index must hand back the latest version of the request
+    assert req_forest.get_request_from_child_id("C").output == "done"
+    assert req_forest.children("B")[0].output == "done"
+    assert [r.identifier for r in req_forest.open_tails()] == ["B"]
+    assert req_forest.children_requests_complete("B") == "B"
+
+
+def test_forest_indexes_after_time_machine(req_forest, req_stamp):
+    req_forest.create("A", source_id=None, sink_id="A", input_args=(), input_kwargs={}, stamp=req_stamp(0))
+    req_forest.create("B", source_id="A", sink_id="B", input_args=(), input_kwargs={}, stamp=req_stamp(1))
+    req_forest.update("B", output="done", stamp=req_stamp(2))
+    assert req_forest.children_requests_complete("A") == "A"
+
+    req_forest.time_machine(step=1)
+    assert req_forest.children_requests_complete("A") is None
+
+    req_forest.time_machine(step=0)
+    assert req_forest.children("A") == []
+    with pytest.raises(RequestDoesNotExistError):
+        req_forest.get_request_from_child_id("B")
+
+
+def test_forest_indexes_from_heap(req_template_factory):
+    A = req_template_factory(identifier="A", source_id=None, sink_id="A", step=1)
+    B = req_template_factory(identifier="B", source_id="A", sink_id="B", step=2)
+    forest = RequestForest(request_heap={"A": A, "B": B})
+
+    assert forest.children("A") == [B]
+    assert forest.insertion_request == [A]
+    assert forest.open_tails() == [B]
+
+
 def test_forest_generate_graph(req_template_factory):
     # Build three requests: None->A, A->B, A->C
     A = req_template_factory(identifier="A", source_id=None, sink_id="A", step=1)
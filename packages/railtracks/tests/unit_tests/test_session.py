@@ -19,6 +19,7 @@ def mock_dependencies(monkeypatch):
     m_RTState = MagicMock()
     m_register_globals = MagicMock()
     m_delete_globals = MagicMock()
+    m_ExecutorPools = MagicMock()
 
     monkeypatch.setattr('railtracks._session.mark_session_logging_override', m_mark_session_logging_override)
     monkeypatch.setattr('railtracks._session.restore_module_logging', m_restore_module_logging)
@@ -29,6 +30,7 @@ def mock_dependencies(monkeypatch):
     monkeypatch.setattr('railtracks._session.RTState', m_RTState)
     monkeypatch.setattr('railtracks._session.register_globals', m_register_globals)
     monkeypatch.setattr('railtracks._session.delete_globals', m_delete_globals)
+    monkeypatch.setattr('railtracks._session.ExecutorPools', m_ExecutorPools)
 
     return {
         'mark_session_logging_override': m_mark_session_logging_override,
@@ -40,6 +42,7 @@ def mock_dependencies(monkeypatch):
         'RTState': m_RTState,
         'register_globals': m_register_globals,
         'delete_globals': m_delete_globals,
+        'ExecutorPools': m_ExecutorPools,
     }
 # ================ END Mock Fixture ===============
 
@@ -149,6 +152,7 @@ def test_close_calls_shutdown_and_delete(mock_dependencies):
     runner.rt_state = MagicMock()
     runner._close()
     assert runner.rt_state.shutdown.called
+    assert runner.executor_pools.shutdown.called
     assert mock_dependencies['delete_globals'].called
 
 def test_close_restores_logging_when_custom_logging_used(mock_dependencies):
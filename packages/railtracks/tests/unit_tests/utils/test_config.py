@@ -3,7 +3,7 @@
 import types
 import pytest
 
-from railtracks.utils.config import ExecutorConfig
+from railtracks.utils.config import ExecutorConfig, PoolConfig
 
 # ================= START ExecutorConfig: Fixtures ============
 @pytest.fixture(params=["INFO", "DEBUG"])
@@ -149,4 +149,32 @@ def test_multiple_updated(base_config):
     assert updated_config.prompt_injection is False
 
     assert base_config.timeout == 100.0
-    assert base_config.log_file is None
\ No newline at end of file
+    assert base_config.log_file is None
+
+def test_updated_pools(base_config):
+    pools = {"Slow Tool": PoolConfig(max_workers=2)}
+    updated_config = base_config.precedence_overwritten(
+        sync_pool_size=4, node_pools=pools
+    )
+    assert updated_config.sync_pool_size == 4
+    assert updated_config.node_pools is pools
+
+    assert base_config.sync_pool_size is None
+    assert base_config.node_pools is None
+
+# ================ END Precedence Overwritten Tests ===============
+
+
+# ================= START PoolConfig tests ============
+
+def test_pool_config_defaults():
+    config = PoolConfig()
+    assert config.max_workers is None
+    assert config.kind == "thread"
+
+@pytest.mark.parametrize("kwargs", [{"max_workers": 0}, {"kind": "fiber"}])
+def test_pool_config_invalid(kwargs):
+    with pytest.raises(ValueError):
+        PoolConfig(**kwargs)
+
+# ================ END PoolConfig tests ===============
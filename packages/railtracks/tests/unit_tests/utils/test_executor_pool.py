@@ -0,0 +1,117 @@
+import asyncio
+import contextvars
+import os
+import threading
+
+import pytest
+
+from railtracks.utils.config import ExecutorConfig, PoolConfig
+from railtracks.utils.executor_pool import ExecutorPool, ExecutorPools
+
+
+_var = contextvars.ContextVar("_var", default=None)
+
+
+def _thread_name():
+    return threading.current_thread().name
+
+
+def _pid():
+    return os.getpid()
+
+
+# ================= START ExecutorPool tests ==================
+
+@pytest.mark.asyncio
+async def test_run_returns_result():
+    pool = ExecutorPool(PoolConfig(max_workers=1))
+    assert await pool.run(lambda x, y=0: x + y, 1, y=2) == 3
+    assert pool.detail().completed == 1
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_run_raises_exception():
+    def fail():
+        raise ValueError("boom")
+
+    pool = ExecutorPool(PoolConfig(max_workers=1))
+    with pytest.raises(ValueError, match="boom"):
+        await pool.run(fail)
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_thread_pool_propagates_context():
+    pool = ExecutorPool(PoolConfig(max_workers=1))
+    _var.set("hello")
+    assert await pool.run(_var.get) == "hello"
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_detail_tracks_queue_depth():
+    pool = ExecutorPool(PoolConfig(max_workers=2))
+    release = threading.Event()
+
+    tasks = [asyncio.create_task(pool.run(release.wait)) for _ in range(5)]
+    await asyncio.sleep(0.05)
+
+    detail = pool.detail()
+    assert detail.max_workers == 2
+    assert detail.running == 2
+    assert detail.queued == 3
+    assert detail.completed == 0
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+    detail = pool.detail()
+    assert detail.running == 0
+    assert detail.queued == 0
+    assert detail.completed == 5
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_process_pool_runs_in_another_process():
+    pool = ExecutorPool(PoolConfig(max_workers=1, kind="process"))
+    assert await pool.run(_pid) != os.getpid()
+    assert pool.detail().kind == "process"
+    pool.shutdown()
+
+# ================ END ExecutorPool tests =====================
+
+
+# ================= START ExecutorPools tests ==================
+
+def test_pool_for_uses_dedicated_pool():
+    pools = ExecutorPools(
+        ExecutorConfig(sync_pool_size=3, node_pools={"Slow": PoolConfig(max_workers=1)})
+    )
+    assert pools.pool_for("Slow") is pools.dedicated["Slow"]
+    assert pools.pool_for("Other") is pools.shared
+    assert pools.shared.max_workers == 3
+
+
+@pytest.mark.asyncio
+async def test_pools_are_isolated():
+    pools = ExecutorPools(
+        ExecutorConfig(sync_pool_size=1, node_pools={"Slow": PoolConfig(max_workers=1)})
+    )
+    release = threading.Event()
+    blocked = asyncio.create_task(pools.run("Slow", release.wait))
+    await asyncio.sleep(0.05)
+
+    # the dedicated pool is saturated but the shared one is still free.
+    assert await asyncio.wait_for(pools.run("Other", _thread_name), timeout=1)
+
+    details = pools.pool_details()
+    assert details["Slow"].running == 1
+    assert details[None].completed == 1
+
+    release.set()
+    await blocked
+    pools.shutdown()
+
+# ================ END ExecutorPools tests =====================
@@ -477,6 +477,41 @@ async def test_get_listener_after_shutdown(self, async_publisher):
 
         with pytest.raises(ValueError):
             await hw_listener  # Should raise an error since the publisher is shutdown
+    @pytest.mark.asyncio
+    async def test_waiting_listener_raises_on_shutdown(self, started_publisher):
+        task = asyncio.create_task(started_publisher.listener(lambda x: x == "never"))
+        await asyncio.sleep(0.01)
+        await started_publisher.shutdown()
+
+        with pytest.raises(ValueError):
+            await task
+
+
+    @pytest.mark.asyncio
+    async def test_cancelled_listener_unsubscribes(self, async_publisher):
+        n_subs = len(async_publisher._subscribers)
+        task = asyncio.create_task(async_publisher.listener(lambda x: x == "never"))
+        await asyncio.sleep(0.01)
+        assert len(async_publisher._subscribers) == n_subs + 1
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert len(async_publisher._subscribers) == n_subs
+
+
+    @pytest.mark.timeout(1)
+    @pytest.mark.asyncio
+    async def test_many_listeners(self, async_publisher):
+        listeners = [
+            asyncio.create_task(async_publisher.listener(lambda x, i=i: x == i))
+            for i in range(100)
+        ]
+        await asyncio.sleep(0.01)
+        for i in reversed(range(100)):
+            await async_publisher.publish(i)
+
+        assert await asyncio.gather(*listeners) == list(range(100))
 # ================ END Publisher listener tests ===============
 
 # ================= START Publisher advanced tests ============
@@ -494,6 +529,25 @@ async def test_publish_after_shutdown_raises(self, started_publisher):
         with pytest.raises(RuntimeError):
             await started_publisher.publish("anything")
 
+    @pytest.mark.asyncio
+    async def test_shutdown_drains_queued_messages(self, started_publisher):
+        received = []
+
+        started_publisher.subscribe(received.append)
+        for i in range(5):
+            await started_publisher.publish(i)
+        await started_publisher.shutdown()
+
+        assert received == list(range(5))
+
+
+    @pytest.mark.asyncio
+    async def test_idle_publisher_loop_is_blocked(self, started_publisher):
+        await asyncio.sleep(0.01)
+        assert not started_publisher.pub_loop.done()
+        # the loop should be parked on the queue rather than waking on a timer
+        assert started_publisher._queue._getters
+
 # ================ END Publisher advanced tests ===============
 
 # ================= START Subscriber (stream_subscriber) tests ============
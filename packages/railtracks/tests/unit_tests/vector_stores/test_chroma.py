@@ -204,6 +204,101 @@ def test_upsert_generates_embeddings(self, chroma_store, chroma_mocks):
         assert all(len(e) == 5 for e in embeddings)
 
 
+    def test_upsert_does_not_mutate_chunk_metadata(self, chroma_store, sample_chunk, chroma_mocks):
+        """Test the content key is only added to the metadata sent to Chroma."""
+        original = dict(sample_chunk.metadata)
+        chroma_store.upsert(sample_chunk)
+
+        assert sample_chunk.metadata == original
+
+
+@pytest.fixture
+def make_batched_store(chroma_mocks):
+    """Builds a ChromaVectorStore with a recording embedding function and the given batching options."""
+
+    def _make(**kwargs):
+        calls = []
+
+        def embed(texts):
+            calls.append(list(texts))
+            return [[float(len(t))] for t in texts]
+
+        with patch.object(ChromaVectorStore, "class_init"):
+            ChromaVectorStore._chroma = chroma_mocks["client"]
+            store = ChromaVectorStore(collection_name="test_collection", embedding_function=embed, **kwargs)
+        store._collection = chroma_mocks["collection"]
+        return store, calls
+
+    return _make
+
+
+class TestChromaVectorStoreBatching:
+    """Tests for the batched embedding and upserting of ChromaVectorStore."""
+
+    def test_upsert_embeds_in_batches(self, make_batched_store, chroma_mocks):
+        store, calls = make_batched_store(embedding_batch_size=2)
+        texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+        store.upsert(texts)
+
+        assert calls == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
+        chroma_mocks["collection"].upsert.assert_called_once()
+        assert chroma_mocks["collection"].upsert.call_args.kwargs["embeddings"] == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+
+    def test_concurrent_embedding_keeps_order(self, make_batched_store, chroma_mocks):
+        store, calls = make_batched_store(embedding_batch_size=1, embedding_concurrency=4)
+        texts = ["x" * i for i in range(1, 20)]
+        ids = store.upsert(texts)
+
+        assert len(calls) == len(texts)
+        kwargs = chroma_mocks["collection"].upsert.call_args.kwargs
+        assert kwargs["ids"] == ids
+        assert kwargs["embeddings"] == [[float(len(t))] for t in texts]
+
+    def test_upsert_is_split_into_chunked_upserts(self, make_batched_store, chroma_mocks):
+        store, _ = make_batched_store(upsert_batch_size=2)
+        ids = store.upsert(["a", "b", "c", "d", "e"])
+
+        upserts = chroma_mocks["collection"].upsert.call_args_list
+        assert [c.kwargs["ids"] for c in upserts] == [ids[0:2], ids[2:4], ids[4:5]]
+        assert [m[CONTENT] for c in upserts for m in c.kwargs["metadatas"]] == ["a", "b", "c", "d", "e"]
+
+    def test_embedding_count_mismatch_raises(self, chroma_mocks):
+        with patch.object(ChromaVectorStore, "class_init"):
+            ChromaVectorStore._chroma = chroma_mocks["client"]
+            store = ChromaVectorStore(collection_name="test_collection", embedding_function=lambda texts: [[0.0]])
+
+        with pytest.raises(ValueError, match="1 embeddings for 2 inputs"):
+            store.upsert(["a", "b"])
+
+    def test_invalid_batch_sizes_raise(self, make_batched_store):
+        with pytest.raises(ValueError):
+            make_batched_store(embedding_batch_size=0)
+
+    def test_upsert_iter_consumes_stream_in_batches(self, make_batched_store, chroma_mocks):
+        store, calls = make_batched_store(embedding_batch_size=2)
+        consumed = []
+
+        def stream():
+            for i in range(5):
+                consumed.append(i)
+                yield f"text {i}"
+
+        ids = store.upsert_iter(stream(), batch_size=2)
+
+        assert len(ids) == 5
+        upserts = chroma_mocks["collection"].upsert.call_args_list
+        assert [len(c.kwargs["ids"]) for c in upserts] == [2, 2, 1]
+        assert [i for c in upserts for i in c.kwargs["ids"]] == ids
+        assert calls == [["text 0", "text 1"], ["text 2", "text 3"], ["text 4"]]
+
+    def test_upsert_iter_default_batch_covers_concurrent_embeddings(self, make_batched_store, chroma_mocks):
+        store, calls = make_batched_store(embedding_batch_size=2, embedding_concurrency=3)
+        store.upsert_iter(iter(["t"] * 7))
+
+        assert [len(c.kwargs["ids"]) for c in chroma_mocks["collection"].upsert.call_args_list] == [6, 1]
+        assert sorted(len(c) for c in calls) == [1, 2, 2, 2]
+
+
 class TestChromaVectorStoreFetch:
     """Tests for ChromaVectorStore.fetch()."""
 
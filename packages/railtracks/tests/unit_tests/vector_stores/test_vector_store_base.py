@@ -237,3 +237,35 @@ def count(self):
             embedding_function=lambda x: [[0.1]]
         )
         assert store._collection_name == "test"
+
+    def test_upsert_iter_upserts_in_batches(self):
+        """Verify the default upsert_iter passes the stream to upsert one batch at a time."""
+
+        class RecordingVectorStore(VectorStore):
+            def __init__(self):
+                super().__init__(collection_name="test", embedding_function=lambda x: [[0.1]])
+                self.batches = []
+
+            def upsert(self, content):
+                self.batches.append(content)
+                return [f"id-{c}" for c in content]
+
+            def fetch(self, ids):
+                return []
+
+            def search(self, query, top_k=10, where=None, include=None):
+                return []
+
+            def delete(self, ids, where=None):
+                pass
+
+            def count(self):
+                return 0
+
+        store = RecordingVectorStore()
+        ids = store.upsert_iter((str(i) for i in range(5)), batch_size=2)
+
+        assert store.batches == [["0", "1"], ["2", "3"], ["4"]]
+        assert ids == ["id-0", "id-1", "id-2", "id-3", "id-4"]
+        with pytest.raises(ValueError):
+            store.upsert_iter(["a"], batch_size=0)
@@ -0,0 +1,89 @@
+import asyncio
+import time
+
+import railtracks as rt
+from railtracks.llm import OpenAICompatibleProvider
+
+N_DISPATCHES = 200
+HISTORY_LENGTH = 200
+MESSAGE_SIZE = 5_000
+
+
+class FakeOpenAI(OpenAICompatibleProvider):
+    pass
+
+
+def add(x: int, y: int) -> int:
+    """
+    Adds two numbers.
+
+    Args:
+        x (int): The first number.
+        y (int): The second number.
+    """
+    return x + y
+
+
+def long_history() -> rt.llm.MessageHistory:
+    history = rt.llm.MessageHistory()
+    for i in range(HISTORY_LENGTH):
+        history.append(rt.llm.UserMessage(f"question {i} " + "x" * MESSAGE_SIZE))
+        history.append(rt.llm.AssistantMessage(f"answer {i} " + "y" * MESSAGE_SIZE))
+    history.append(rt.llm.UserMessage("one more question"))
+    return history
+
+
+def time_per_call(func, n: int = N_DISPATCHES) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        func()
+    return (time.perf_counter() - start) / n
+
+
+def compare_dispatch(name: str, make_node):
+    """
+    Compares the per request cost of the previous dispatch path (a `safe_copy` of the node) with the current one (a
+    `snapshot` of the node recorded in the history, the node itself is handed out as is).
+    """
+    node = make_node()
+    copy_time = time_per_call(node.safe_copy)
+    snapshot_time = time_per_call(node.snapshot)
+    print(
+        f"{name:<28} safe_copy {copy_time * 1e6:>10.1f}us   snapshot {snapshot_time * 1e6:>6.1f}us   "
+        f"({copy_time / snapshot_time:,.0f}x)"
+    )
+
+
+async def end_to_end(node, *args, n: int = N_DISPATCHES, **kwargs) -> float:
+    with rt.Session(logging_setting="NONE", save_state=False):
+        start = time.perf_counter()
+        for _ in range(n):
+            await rt.call(node, *args, **kwargs)
+        return (time.perf_counter() - start) / n
+
+
+def main():
+    llm = FakeOpenAI("fake-model", api_base="http://127.0.0.1:1", api_key="not-a-key")
+    add_node = rt.function_node(add)
+    agent = rt.agent_node(name="Agent", llm=llm, system_message="You are helpful.")
+    tool_agent = rt.agent_node(
+        name="Tool Agent",
+        llm=llm,
+        tool_nodes=[add_node],
+        system_message="You are helpful.",
+    )
+    history = long_history()
+
+    print(
+        f"Dispatch overhead per request ({HISTORY_LENGTH * 2 + 1} message history for agents)"
+    )
+    compare_dispatch("function node", lambda: add_node.node_type(1, 2))
+    compare_dispatch("agent node", lambda: agent(history))
+    compare_dispatch("tool calling agent node", lambda: tool_agent(history))
+
+    per_call = asyncio.run(end_to_end(add_node, 1, 2))
+    print(f"\nEnd to end `rt.call` of a function node: {per_call * 1e6:.1f}us per call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+import time
+
+import numpy as np
+from railtracks.rag.vector_store import InMemoryVectorStore
+from railtracks.rag.vector_store.base import VectorRecord
+from railtracks.rag.vector_store.utils import distance, normalize_vector
+
+N_VECTORS = 100_000
+DIM = 1536
+BATCH_SIZE = 10_000
+N_QUERIES = 50
+TOP_K = 10
+# the previous pure python search is far too slow to run against the full store
+N_PYTHON_BASELINE = 2_000
+
+
+def python_search(vectors: dict, query: list, top_k: int):
+    """The search loop the store used before it was backed by a matrix."""
+    q = normalize_vector(query)
+    scores = [(vid, distance(q, v, metric="cosine")) for vid, v in vectors.items()]
+    scores.sort(key=lambda t: t[1])
+    return scores[:top_k]
+
+
+def main():
+    rng = np.random.default_rng(0)
+    store = InMemoryVectorStore(metric="cosine", dim=DIM)
+
+    start = time.perf_counter()
+    for batch_start in range(0, N_VECTORS, BATCH_SIZE):
+        batch = rng.standard_normal((BATCH_SIZE, DIM), dtype=np.float32)
+        store.add(
+            [
+                VectorRecord(id=str(batch_start + i), vector=row, text=None)
+                for i, row in enumerate(batch)
+            ],
+            embed=False,
+        )
+    add_time = time.perf_counter() - start
+
+    queries = rng.standard_normal((N_QUERIES, DIM), dtype=np.float32)
+    start = time.perf_counter()
+    for q in queries:
+        store.search(q, top_k=TOP_K)
+    search_time = (time.perf_counter() - start) / N_QUERIES
+
+    start = time.perf_counter()
+    store.delete([str(i) for i in range(0, N_VECTORS, 10)])
+    delete_time = time.perf_counter() - start
+
+    baseline = {
+        str(i): v
+        for i, v in enumerate(rng.standard_normal((N_PYTHON_BASELINE, DIM)).tolist())
+    }
+    start = time.perf_counter()
+    python_search(baseline, queries[0].tolist(), TOP_K)
+    python_time = time.perf_counter() - start
+
+    print(f"InMemoryVectorStore with {N_VECTORS:,} x {DIM} vectors (cosine)")
+    print(f"  add:    {add_time:.2f}s ({N_VECTORS / add_time:,.0f} vectors/s)")
+    print(f"  search: {search_time * 1e3:.1f}ms per query (top_k={TOP_K})")
+    print(f"  delete: {delete_time * 1e3:.1f}ms for {N_VECTORS // 10:,} ids")
+    print(
+        f"Previous pure python search: {python_time * 1e3:.0f}ms per query for only {N_PYTHON_BASELINE:,} vectors "
+        f"(~{python_time * N_VECTORS / N_PYTHON_BASELINE:.1f}s per query extrapolated to {N_VECTORS:,})"
+    )
+
+
+if __name__ == "__main__":
+    main()
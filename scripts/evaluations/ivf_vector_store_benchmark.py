@@ -0,0 +1,73 @@
+import time
+
+import numpy as np
+from railtracks.rag.vector_store import InMemoryVectorStore, IVFVectorStore
+from railtracks.rag.vector_store.base import VectorRecord
+
+N_VECTORS = 200_000
+DIM = 256
+N_CLUSTERS = 1_000
+BATCH_SIZE = 10_000
+N_QUERIES = 200
+TOP_K = 10
+N_PROBES = [1, 4, 8, 16, 32, 64, 128]
+
+
+def synthetic_vectors(rng: np.random.Generator, centers: np.ndarray, n: int):
+    """Gaussian blobs around random centers, which is roughly how embeddings of a real corpus are spread."""
+    labels = rng.integers(0, len(centers), size=n)
+    return (centers[labels] + 2.0 * rng.standard_normal((n, DIM))).astype(np.float32)
+
+
+def fill(store, vectors: np.ndarray) -> float:
+    start = time.perf_counter()
+    for batch_start in range(0, len(vectors), BATCH_SIZE):
+        batch = vectors[batch_start : batch_start + BATCH_SIZE]
+        store.add(
+            [
+                VectorRecord(id=str(batch_start + i), vector=row, text=None)
+                for i, row in enumerate(batch)
+            ],
+            embed=False,
+        )
+    return time.perf_counter() - start
+
+
+def run_queries(store, queries: np.ndarray):
+    start = time.perf_counter()
+    results = [store.search(q, top_k=TOP_K) for q in queries]
+    qps = len(queries) / (time.perf_counter() - start)
+    return [{e.record.id for e in r} for r in results], qps
+
+
+def main():
+    rng = np.random.default_rng(0)
+    centers = rng.standard_normal((N_CLUSTERS, DIM)).astype(np.float32)
+    vectors = synthetic_vectors(rng, centers, N_VECTORS)
+    queries = synthetic_vectors(rng, centers, N_QUERIES)
+
+    exact = InMemoryVectorStore(metric="cosine", dim=DIM)
+    exact_add = fill(exact, vectors)
+    truth, exact_qps = run_queries(exact, queries)
+
+    ivf = IVFVectorStore(metric="cosine", dim=DIM)
+    ivf_add = fill(ivf, vectors)
+
+    print(
+        f"{N_VECTORS:,} x {DIM} vectors in {N_CLUSTERS:,} clusters (cosine), {N_QUERIES} queries, top_k={TOP_K}"
+    )
+    print(f"  brute force:  add {exact_add:.1f}s, {exact_qps:,.0f} QPS, recall 1.000")
+    print(
+        f"  ivf ({len(ivf._lists)} lists): add {ivf_add:.1f}s (including k-means training)"
+    )
+    for n_probe in N_PROBES:
+        ivf.n_probe = n_probe
+        found, qps = run_queries(ivf, queries)
+        recall = np.mean([len(f & t) / TOP_K for f, t in zip(found, truth)])
+        print(
+            f"    n_probe={n_probe:<3} {qps:>8,.0f} QPS ({qps / exact_qps:5.1f}x)  recall@{TOP_K} {recall:.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import asyncio
+import threading
+import time
+
+import railtracks as rt
+from aiohttp import web
+from railtracks.llm import OpenAICompatibleProvider
+
+N_COMPLETIONS = 500
+SERVER_LATENCY = 0.5
+PORT = 8765
+
+
+class FakeOpenAI(OpenAICompatibleProvider):
+    pass
+
+
+async def completions(request: web.Request) -> web.Response:
+    """
+    A minimal OpenAI compatible `/chat/completions` endpoint which responds after `SERVER_LATENCY` seconds.
+    """
+    await asyncio.sleep(SERVER_LATENCY)
+    return web.json_response(
+        {
+            "id": "chatcmpl-fake",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": "fake-model",
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "pong"},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+        }
+    )
+
+
+async def sample_threads(peak: list[int], stop: asyncio.Event):
+    while not stop.is_set():
+        peak[0] = max(peak[0], threading.active_count())
+        await asyncio.sleep(0.01)
+
+
+async def main():
+    app = web.Application()
+    app.router.add_post("/chat/completions", completions)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", PORT).start()
+
+    llm = FakeOpenAI(
+        "fake-model", api_base=f"http://127.0.0.1:{PORT}", api_key="not-a-key"
+    )
+    agent = rt.agent_node(name="Ping Agent", llm=llm, system_message="Reply pong.")
+
+    peak = [threading.active_count()]
+    stop = asyncio.Event()
+    sampler = asyncio.create_task(sample_threads(peak, stop))
+
+    with rt.Session(logging_setting="NONE", save_state=False):
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *[rt.call(agent, user_input="ping") for _ in range(N_COMPLETIONS)]
+        )
+        elapsed = time.perf_counter() - start
+
+    stop.set()
+    await sampler
+    await runner.cleanup()
+
+    assert all(r.content == "pong" for r in results)
+    print(
+        f"{N_COMPLETIONS} concurrent completions ({SERVER_LATENCY}s server latency) "
+        f"finished in {elapsed:.2f}s with a peak of {peak[0]} threads"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,47 @@
+import time
+
+import railtracks as rt
+from railtracks.llm.content import ToolCall, ToolResponse
+
+N_STEPS = 40
+TOOL_CALLS_PER_STEP = 3
+
+
+def tool_loop_history(n_steps: int):
+    """Yields the message history sent at every step of a tool calling loop."""
+    history = rt.llm.MessageHistory(
+        [rt.llm.SystemMessage("You are helpful."), rt.llm.UserMessage("Go.")]
+    )
+    for step in range(n_steps):
+        yield history
+        calls = [
+            ToolCall(identifier=f"{step}-{i}", name="lookup", arguments={"key": i})
+            for i in range(TOOL_CALLS_PER_STEP)
+        ]
+        history.append(rt.llm.AssistantMessage(calls))
+        for call in calls:
+            history.append(
+                rt.llm.ToolMessage(
+                    ToolResponse(
+                        identifier=call.identifier, name=call.name, result="ok"
+                    )
+                )
+            )
+
+
+def main():
+    model = rt.llm.OpenAILLM("gpt-4o")
+    total = 0.0
+    print(f"{'step':>5} {'messages':>9} {'ms':>8}")
+    for step, history in enumerate(tool_loop_history(N_STEPS), start=1):
+        start = time.perf_counter()
+        model._prepare_request(history)
+        elapsed = time.perf_counter() - start
+        total += elapsed
+        if step == 1 or step % 10 == 0:
+            print(f"{step:>5} {len(history):>9} {elapsed * 1000:>8.3f}")
+    print(f"total: {total * 1000:.2f} ms over {N_STEPS} steps")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import asyncio
+import statistics
+import time
+
+from railtracks.utils.publisher import Publisher
+
+N_LISTENERS = 1000
+IDLE_SECONDS = 2.0
+
+
+async def idle_cpu(publisher: Publisher) -> float:
+    """
+    Measures the fraction of a core that is used while the publisher is idle with `N_LISTENERS` waiting listeners.
+    """
+    start_cpu = time.process_time()
+    start_wall = time.perf_counter()
+    await asyncio.sleep(IDLE_SECONDS)
+    return (time.process_time() - start_cpu) / (time.perf_counter() - start_wall)
+
+
+async def message_latency(publisher: Publisher) -> list[float]:
+    """
+    Measures the time between publishing a message and the matching listener waking up.
+    """
+    latencies = []
+    for i in range(N_LISTENERS):
+        start = time.perf_counter()
+        await publisher.publish(i)
+        await publisher.listener(lambda x, i=i: x == f"ack-{i}")
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def main():
+    async with Publisher() as publisher:
+        listeners = [
+            asyncio.create_task(publisher.listener(lambda x, i=i: x == i))
+            for i in range(N_LISTENERS)
+        ]
+        await asyncio.sleep(0)
+
+        usage = await idle_cpu(publisher)
+        print(
+            f"Idle CPU with {N_LISTENERS} listeners: {usage * 100:.2f}% of one core"
+        )
+
+        async def ack(message):
+            if isinstance(message, int):
+                await publisher.publish(f"ack-{message}")
+
+        publisher.subscribe(ack)
+        latencies = await message_latency(publisher)
+        await asyncio.gather(*listeners)
+
+    print(
+        f"Per message latency with {N_LISTENERS} listeners: "
+        f"p50={statistics.median(latencies) * 1000:.3f}ms "
+        f"p99={statistics.quantiles(latencies, n=100)[98] * 1000:.3f}ms"
+    )
+
+
+asyncio.run(main())
@@ -0,0 +1,62 @@
+import time
+
+import railtracks as rt
+from railtracks.built_nodes.concrete.rag import RagConfig, update_context
+
+N_TURNS = 30
+REPORT_EVERY = 5
+TURN_TEXT = "Tell me more about the quarterly numbers of the northern region. " * 4
+
+
+class CountingVectorStore:
+    """Stands in for a vector store, counting the queries (i.e. embeddings) and characters it is asked to search."""
+
+    def __init__(self):
+        self.calls = 0
+        self.queries = 0
+        self.chars = 0
+
+    def search(self, query, top_k=10, **kwargs):
+        self.calls += 1
+        self.queries += len(query)
+        self.chars += sum(len(q) for q in query)
+        return [[] for _ in query]
+
+
+def run(label: str, **kwargs):
+    store = CountingVectorStore()
+    history = rt.llm.MessageHistory()
+    print(label)
+    print(f"  {'turn':>4} {'queries':>8} {'chars embedded':>15} {'ms':>8}")
+    for turn in range(1, N_TURNS + 1):
+        history.append(rt.llm.UserMessage(f"{turn}: {TURN_TEXT}"))
+        history.append(rt.llm.AssistantMessage(f"{turn}: {TURN_TEXT}"))
+        queries, chars = store.queries, store.chars
+        start = time.perf_counter()
+        update_context(history, store, **kwargs)
+        elapsed = (time.perf_counter() - start) * 1000
+        if turn == 1 or turn % REPORT_EVERY == 0:
+            print(
+                f"  {turn:>4} {store.queries - queries:>8} {store.chars - chars:>15,} {elapsed:>8.2f}"
+            )
+    print(f"  total: {store.queries:,} queries, {store.chars:,} chars embedded")
+
+
+def main():
+    config = RagConfig(CountingVectorStore())
+    run("every contiguous window, no cache (previous behaviour)")
+    run(
+        f"most recent {config.max_turns} turns, at most {config.max_queries} queries, no cache",
+        max_turns=config.max_turns,
+        max_queries=config.max_queries,
+    )
+    run(
+        "RagConfig defaults (with cache)",
+        max_turns=config.max_turns,
+        max_queries=config.max_queries,
+        cache=config.cache,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import time
+
+from railtracks.state.request import RequestForest
+from railtracks.utils.profiling import StampManager
+
+N_TOOL_CALLS = 10_000
+
+
+def build_session(forest: RequestForest, stamper: StampManager):
+    """
+    Simulates a wide agent session where a single agent makes `N_TOOL_CALLS` tool calls, checking after each one
+    whether all of its children are complete (as the state does) and looking the request back up by its child.
+    """
+    forest.create("agent", None, "agent", (), {}, stamper.create_stamp("agent"))
+    for i in range(N_TOOL_CALLS):
+        r_id = f"tool-{i}"
+        forest.create(r_id, "agent", r_id, (), {}, stamper.create_stamp(r_id))
+        forest.get_request_from_child_id(r_id)
+        forest.update(r_id, "done", stamper.create_stamp(r_id))
+        forest.children_requests_complete("agent")
+
+
+def main():
+    forest = RequestForest()
+    stamper = StampManager()
+
+    start = time.perf_counter()
+    build_session(forest, stamper)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    tails = forest.open_tails()
+    downstream = forest.all_downstream(None)
+    traversal_time = time.perf_counter() - start
+
+    print(
+        f"{N_TOOL_CALLS} tool call session built in {build_time:.3f}s "
+        f"({build_time / N_TOOL_CALLS * 1e6:.1f}us per request)"
+    )
+    print(
+        f"open_tails + all_downstream over {len(downstream)} requests "
+        f"({len(tails)} open tails) took {traversal_time * 1000:.2f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
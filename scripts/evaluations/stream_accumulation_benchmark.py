@@ -0,0 +1,64 @@
+import time
+from types import SimpleNamespace
+
+import railtracks as rt
+
+CHUNK_COUNTS = [1_000, 10_000, 100_000]
+CONTENT_PIECE = "token "
+ARGUMENT_PIECE = '"abc", '
+
+
+def chunk(content=None, tool_calls=None, finish_reason=None):
+    delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+    return SimpleNamespace(
+        choices=[SimpleNamespace(delta=delta, finish_reason=finish_reason)]
+    )
+
+
+def call_delta(index, id=None, name=None, arguments=None):
+    return SimpleNamespace(
+        index=index,
+        id=id,
+        function=SimpleNamespace(name=name, arguments=arguments),
+    )
+
+
+def content_stream(n_chunks: int):
+    chunks = [chunk(CONTENT_PIECE) for _ in range(n_chunks)]
+    return [*chunks, chunk(finish_reason="stop"), chunk()]
+
+
+def tool_call_stream(n_chunks: int):
+    chunks = [
+        chunk(
+            tool_calls=[call_delta(0, id="call", name="tool", arguments='{"items": [')]
+        )
+    ]
+    chunks += [
+        chunk(tool_calls=[call_delta(0, arguments=ARGUMENT_PIECE)])
+        for _ in range(n_chunks)
+    ]
+    chunks.append(chunk(tool_calls=[call_delta(0, arguments='"end"]}')]))
+    return [*chunks, chunk(finish_reason="tool_calls"), chunk()]
+
+
+def consume(model, stream) -> float:
+    start = time.perf_counter()
+    for _ in model._stream_handler_base(stream, start):
+        pass
+    return time.perf_counter() - start
+
+
+def main():
+    model = rt.llm.OpenAILLM("gpt-4o", stream=True)
+    print(f"{'stream':>10} {'chunks':>9} {'seconds':>9} {'chunks/s':>12}")
+    for label, build in (("content", content_stream), ("tool args", tool_call_stream)):
+        for n_chunks in CHUNK_COUNTS:
+            elapsed = consume(model, build(n_chunks))
+            print(
+                f"{label:>10} {n_chunks:>9,} {elapsed:>9.3f} {n_chunks / elapsed:>12,.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()